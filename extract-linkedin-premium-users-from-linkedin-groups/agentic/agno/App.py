@@ -2,15 +2,17 @@
 
 import streamlit as st
 from config.constants import PAGE_CONFIG, WORKFLOW_TYPES, HELP_TEXT, FOOTER_HELP_TEXT
-from config.agent_setup import initialize_agent, initialize_session_state
+from config.agent_setup import check_api_key, initialize_agent, initialize_session_state, get_job_runner
 from config.workflows import execute_workflow
+from config.jobs import submit_workflow_job, render_jobs
 
 # Page configuration
 st.set_page_config(**PAGE_CONFIG)
 
-# Initialize session state and agent
+# Initialize session state; the agent is built on first use and shared across sessions
 initialize_session_state()
-agent = initialize_agent()
+check_api_key()
+job_runner = get_job_runner()
 
 # Main content area
 st.title("🔗 LinkedIn Group Premium Members Extractor Agent")
@@ -51,11 +53,21 @@ sheet_title = st.text_input(
     help=HELP_TEXT["sheet_title"]
 )
 
+run_in_background = st.checkbox("Run in background", help=HELP_TEXT["background"])
+
 st.divider()
 
 # Execute button
 if st.button("🚀 Execute Workflow", use_container_width=True, type="primary"):
-    execute_workflow(agent, workflow_type, group_id, limit_members, sheet_title)
+    if run_in_background:
+        submit_workflow_job(job_runner, workflow_type, group_id, limit_members, sheet_title)
+    else:
+        execute_workflow(initialize_agent(), workflow_type, group_id, limit_members, sheet_title)
+
+# Background jobs keep running across reruns; each session sees only its own
+st.divider()
+st.subheader("🗂️ Background Jobs")
+render_jobs(job_runner)
 
 # Display last result in expandable section
 if st.session_state.last_result:
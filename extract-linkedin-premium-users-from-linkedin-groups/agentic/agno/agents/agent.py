@@ -7,6 +7,7 @@ from tools.linkedin.complete_group_members_workflow_tool import complete_group_m
 from tools.linkedin.fetch_linkedIn_group_members_tool import fetch_linkedin_group_members
 from tools.linkedin.fetch_group_members_by_url_tool import fetch_group_members_by_url
 from tools.linkedin.filter_premium_verified_members_tool import filter_premium_verified_members
+from tools.linkedin.query_stored_members_tool import query_stored_members
 from tools.googlesheet.export_members_to_sheets_tool import export_members_to_sheets
 
 load_dotenv()
@@ -27,6 +28,7 @@ agent = Agent(
         fetch_linkedin_group_members,
         fetch_group_members_by_url,
         filter_premium_verified_members,
+        query_stored_members,
         export_members_to_sheets,
     ],
     instructions=[
@@ -46,7 +48,9 @@ agent = Agent(
         "If a user provides a group URL: First use fetch_group_members_by_url, then continue.",
         "## MEMORY LOGIC",
         "When members are fetched, treat the result as the working set.",
-        "If the user says 'them' or 'those', reuse the last fetched data.",
+        "Every fetched member is saved in a local store.",
+        "If the user says 'them', 'those' or 'the last fetched members', call query_stored_members instead of fetching again,",
+        "then pass its JSON result to export_members_to_sheets if an export is requested.",
     ],
     markdown=True,
 )
@@ -1,47 +1,79 @@
 """Agent setup and initialization."""
 
 import os
+import uuid
 import streamlit as st
 from dotenv import load_dotenv
-from agno.agent import Agent
-from agno.models.google import Gemini
-from tools.linkedin.fetch_all_linkedIn_group_members_tool import fetch_all_linkedin_group_members
-from tools.linkedin.complete_group_members_workflow_tool import complete_group_members_workflow
-from tools.linkedin.fetch_linkedIn_group_members_tool import fetch_linkedin_group_members
-from tools.linkedin.fetch_group_members_by_url_tool import fetch_group_members_by_url
-from tools.linkedin.filter_premium_verified_members_tool import filter_premium_verified_members
-from tools.googlesheet.export_members_to_sheets_tool import export_members_to_sheets
-from config.constants import AGENT_INSTRUCTIONS
+from config.constants import AGENT_INSTRUCTIONS, JOB_DB_PATH, JOB_MAX_WORKERS
+from config.job_runner import JobRunner
 
 load_dotenv()
 
 
+def create_agent():
+    """Build a new Gemini agent with the LinkedIn and Google Sheets tools."""
+    # Imported here so the UI renders before agno and the tools are loaded
+    from agno.agent import Agent
+    from agno.models.google import Gemini
+    from tools.linkedin.fetch_all_linkedIn_group_members_tool import fetch_all_linkedin_group_members
+    from tools.linkedin.complete_group_members_workflow_tool import complete_group_members_workflow
+    from tools.linkedin.fetch_linkedIn_group_members_tool import fetch_linkedin_group_members
+    from tools.linkedin.fetch_group_members_by_url_tool import fetch_group_members_by_url
+    from tools.linkedin.filter_premium_verified_members_tool import filter_premium_verified_members
+    from tools.linkedin.query_stored_members_tool import query_stored_members
+    from tools.googlesheet.export_members_to_sheets_tool import export_members_to_sheets
+
+    return Agent(
+        model=Gemini(id="gemini-3-pro-preview"),
+        tools=[
+            fetch_all_linkedin_group_members,
+            complete_group_members_workflow,
+            fetch_linkedin_group_members,
+            fetch_group_members_by_url,
+            filter_premium_verified_members,
+            query_stored_members,
+            export_members_to_sheets,
+        ],
+        instructions=AGENT_INSTRUCTIONS,
+        markdown=True,
+    )
+
+
+@st.cache_resource(show_spinner="Loading agent...")
+def get_shared_agent():
+    """
+    One agent per process, shared by every browser session.
+
+    Runs don't share history: each session passes its own session_id.
+    """
+    return create_agent()
+
+
+def check_api_key():
+    """Stop the app if the Gemini API key is missing."""
+    if not os.getenv("GOOGLE_API_KEY"):
+        st.error("⚠️ GOOGLE_API_KEY not found in environment variables.")
+        st.stop()
+
+
 def initialize_agent():
-    """Initialize and return the agent if not already in session state."""
-    if "agent" not in st.session_state:
-        GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-        if not GOOGLE_API_KEY:
-            st.error("⚠️ GOOGLE_API_KEY not found in environment variables.")
-            st.stop()
-        
-        st.session_state.agent = Agent(
-            model=Gemini(id="gemini-3-pro-preview"),
-            tools=[
-                fetch_all_linkedin_group_members,
-                complete_group_members_workflow,
-                fetch_linkedin_group_members,
-                fetch_group_members_by_url,
-                filter_premium_verified_members,
-                export_members_to_sheets,
-            ],
-            instructions=AGENT_INSTRUCTIONS,
-            markdown=True,
-        )
-    return st.session_state.agent
+    """Return the shared agent, building it on first use in this process."""
+    check_api_key()
+    return get_shared_agent()
+
+
+@st.cache_resource
+def get_job_runner():
+    """One job runner per process, shared by every browser session."""
+    return JobRunner(JOB_DB_PATH, max_workers=JOB_MAX_WORKERS)
 
 
 def initialize_session_state():
     """Initialize session state variables."""
     if "last_result" not in st.session_state:
         st.session_state.last_result = None
+    if "session_id" not in st.session_state:
+        # Kept in the URL so a reload still finds this session's jobs and fetches
+        st.session_state.session_id = st.query_params.get("session") or uuid.uuid4().hex
+        st.query_params["session"] = st.session_state.session_id
 
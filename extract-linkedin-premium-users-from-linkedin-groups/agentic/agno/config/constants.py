@@ -1,5 +1,7 @@
 """Constants and configuration for the LinkedIn Group Members Agent."""
 
+import os
+
 # Page configuration
 PAGE_CONFIG = {
     "page_title": "LinkedIn Premium Member Extractor",
@@ -11,12 +13,18 @@ PAGE_CONFIG = {
 # Workflow types
 WORKFLOW_TYPES = ["Complete Workflow", "Multi-Step Workflow", "Fetch Only"]
 
+# Background jobs
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", "jobs.db")
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "2"))
+JOB_POLL_SECONDS = 2
+
 # Help text
 HELP_TEXT = {
     "workflow": "Choose how you want to process the members",
     "group_id": "Enter the LinkedIn group ID",
     "limit_members": "Maximum number of members to fetch",
-    "sheet_title": "Title for the Google Sheet (required for Complete Workflow)"
+    "sheet_title": "Title for the Google Sheet (required for Complete Workflow)",
+    "background": "Run as a background job that keeps going if you close or reload the page"
 }
 
 # Agent instructions
@@ -36,8 +44,10 @@ AGENT_INSTRUCTIONS = [
     "For all members export: fetch_all_linkedin_group_members → export_members_to_sheets",
     "If a user provides a group URL: First use fetch_group_members_by_url, then continue.",
     "## MEMORY LOGIC",
+    "Every fetched member is saved in a local store.",
     "When members are fetched, treat the result as the working set.",
-    "If the user says 'them' or 'those', reuse the last fetched data.",
+    "If the user says 'them', 'those' or 'the last fetched members', call query_stored_members instead of fetching again,",
+    "then pass its JSON result to export_members_to_sheets if an export is requested.",
 ]
 
 # Footer help text
@@ -60,5 +70,6 @@ FOOTER_HELP_TEXT = """
 - ✅ Premium/Verified member filtering
 - ✅ Google Sheets integration
 - ✅ Duplicate detection in sheets
+- ✅ Background jobs with progress and cancellation
 """
 
@@ -0,0 +1,152 @@
+"""Background job runner: extractions keep running when the Streamlit session goes away."""
+
+import json
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from tools.progress import set_progress_sink, reset_progress_sink
+
+FINISHED_STATES = ("succeeded", "failed", "cancelled")
+
+
+class JobCancelled(BaseException):
+    """Raised inside a job when it has been cancelled (BaseException so tools don't swallow it)."""
+
+
+class JobRunner:
+    """Runs jobs on a thread pool and persists their state in SQLite."""
+
+    def __init__(self, db_path: str, max_workers: int = 2):
+        self.db_path = db_path
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY, name TEXT, params TEXT, status TEXT,
+                    progress TEXT, result TEXT, error TEXT,
+                    created_at TEXT, updated_at TEXT, owner TEXT)"""
+            )
+            columns = {row["name"] for row in db.execute("PRAGMA table_info(jobs)")}
+            if "owner" not in columns:
+                # Job tables created before jobs had an owner
+                db.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            # Jobs from a previous process can never finish
+            db.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Interrupted by restart' "
+                "WHERE status IN ('queued', 'running')"
+            )
+
+    def submit(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        params: Dict[str, Any],
+        owner: Optional[str] = None,
+    ) -> str:
+        """
+        Queue func(progress, **params) and return its job ID.
+
+        `owner` (e.g. the browser session's ID) scopes list_jobs and cancel, so
+        one session never sees or stops another session's jobs.
+
+        `progress(message)` records a progress message and raises JobCancelled once
+        the job is cancelled. Tool progress (tools/progress.py) is recorded too.
+        """
+        job_id = uuid.uuid4().hex[:12]
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO jobs (id, name, params, status, progress, created_at, updated_at, owner) "
+                "VALUES (?, ?, ?, 'queued', '', ?, ?, ?)",
+                (job_id, name, json.dumps(params), now, now, owner),
+            )
+        with self._lock:
+            self._cancel_events[job_id] = threading.Event()
+        self._pool.submit(self._run, job_id, func, params)
+        return job_id
+
+    def cancel(self, job_id: str, owner: Optional[str] = None) -> bool:
+        """
+        Request cancellation; a running job stops at its next progress report.
+
+        With an `owner`, only that owner's jobs can be cancelled. Returns False
+        if the job doesn't exist or belongs to someone else.
+        """
+        job = self.get(job_id)
+        if job is None or (owner is not None and job["owner"] != owner):
+            return False
+        with self._lock:
+            event = self._cancel_events.get(job_id)
+        if event is not None:
+            event.set()
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET status = 'cancelled', updated_at = ? WHERE id = ? AND status = 'queued'",
+                (datetime.now().isoformat(timespec="seconds"), job_id),
+            )
+        return True
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job's state, progress and result."""
+        with self._connect() as db:
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list_jobs(self, limit: int = 20, owner: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the most recent jobs, newest first; only `owner`'s when given."""
+        where, params = ("WHERE owner = ? ", (owner,)) if owner is not None else ("", ())
+        with self._connect() as db:
+            rows = db.execute(
+                f"SELECT * FROM jobs {where}ORDER BY created_at DESC, rowid DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _run(self, job_id: str, func: Callable[..., Any], params: Dict[str, Any]) -> None:
+        cancel_event = self._cancel_events[job_id]
+        if cancel_event.is_set():
+            return self._finish(job_id)
+
+        def progress(message: str) -> None:
+            if cancel_event.is_set():
+                raise JobCancelled()
+            self._update(job_id, progress=message)
+
+        self._update(job_id, status="running")
+        token = set_progress_sink(progress)
+        try:
+            result = func(progress, **params)
+            self._update(job_id, status="succeeded", result=str(result))
+        except JobCancelled:
+            self._update(job_id, status="cancelled")
+        except Exception as e:
+            self._update(job_id, status="failed", error=str(e))
+        finally:
+            reset_progress_sink(token)
+            self._finish(job_id)
+
+    def _finish(self, job_id: str) -> None:
+        with self._lock:
+            self._cancel_events.pop(job_id, None)
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        fields["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as db:
+            db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=10)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
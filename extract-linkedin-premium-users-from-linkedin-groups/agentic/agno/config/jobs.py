@@ -0,0 +1,78 @@
+"""Background extraction jobs and the panel that tracks them."""
+
+import streamlit as st
+from config.constants import JOB_POLL_SECONDS
+from config.agent_setup import create_agent
+from config.workflows import workflow_queries
+from tools.storage.member_store import set_member_session, reset_member_session
+
+STATUS_ICONS = {
+    "queued": "⏳",
+    "running": "🔄",
+    "succeeded": "✅",
+    "failed": "❌",
+    "cancelled": "🛑",
+}
+
+
+def run_workflow_job(progress, workflow_type, group_id, limit_members, sheet_title, session_id=None):
+    """Run a workflow to completion on a job thread, with its own agent."""
+    agent = create_agent()
+    queries = workflow_queries(workflow_type, group_id, limit_members, sheet_title)
+    outputs = []
+    # Fetches count as the submitting session's, for its later follow-ups
+    token = set_member_session(session_id)
+    try:
+        for step, query in enumerate(queries, start=1):
+            progress(f"Step {step}/{len(queries)}: {query}")
+            outputs.append(agent.run(query).content)
+    finally:
+        reset_member_session(token)
+    return "\n\n---\n\n".join(outputs)
+
+
+def submit_workflow_job(runner, workflow_type, group_id, limit_members, sheet_title):
+    """Queue a workflow as a background job."""
+    if not group_id:
+        st.error("⚠️ Please enter a Group ID")
+        return
+    if workflow_type == "Complete Workflow" and not sheet_title:
+        st.error("⚠️ Sheet Title is required for Complete Workflow")
+        return
+
+    job_id = runner.submit(
+        f"{workflow_type} · group {group_id}",
+        run_workflow_job,
+        {
+            "workflow_type": workflow_type,
+            "group_id": group_id,
+            "limit_members": int(limit_members),
+            "sheet_title": sheet_title,
+            "session_id": st.session_state.session_id,
+        },
+        owner=st.session_state.session_id,
+    )
+    st.success(f"✅ Job `{job_id}` queued. Track it under Background Jobs.")
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def render_jobs(runner):
+    """List this session's recent jobs with live progress, results and cancel buttons."""
+    jobs = runner.list_jobs(owner=st.session_state.session_id)
+    if not jobs:
+        st.caption("No background jobs yet.")
+        return
+
+    for job in jobs:
+        icon = STATUS_ICONS.get(job["status"], "•")
+        with st.expander(f"{icon} `{job['id']}` {job['name']} — {job['status']}"):
+            st.caption(f"Started {job['created_at']} · updated {job['updated_at']}")
+            if job["progress"]:
+                st.text(job["progress"])
+            if job["status"] in ("queued", "running"):
+                if st.button("🛑 Cancel", key=f"cancel_{job['id']}"):
+                    runner.cancel(job["id"], owner=st.session_state.session_id)
+            elif job["result"]:
+                st.markdown(job["result"])
+            elif job["error"]:
+                st.error(job["error"])
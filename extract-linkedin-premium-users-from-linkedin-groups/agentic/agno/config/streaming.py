@@ -0,0 +1,60 @@
+"""Streams agent runs into the Streamlit UI."""
+
+from contextlib import closing
+
+import streamlit as st
+from tools.progress import set_progress_sink, reset_progress_sink
+from tools.storage.member_store import set_member_session, reset_member_session
+
+
+def stream_agent_run(agent, query: str, label: str) -> str:
+    """
+    Run the agent and render progress live.
+
+    Tool calls and tool progress (pages fetched, members found) go into a status
+    panel; the answer is written out as the model produces it.
+
+    Args:
+        agent: The Agno agent to run.
+        query (str): The prompt to run.
+        label (str): Label shown on the status panel while running.
+    Returns:
+        str: The final response content.
+    """
+    from agno.run.agent import RunEvent
+
+    status = st.status(label, expanded=True)
+    answer = st.empty()
+    content = ""
+
+    token = set_progress_sink(status.write)
+    session_token = set_member_session(st.session_state.session_id)
+    try:
+        # closing() stops the run if Streamlit interrupts the script (e.g. Stop button)
+        events = agent.run(
+            query,
+            stream=True,
+            stream_events=True,
+            session_id=st.session_state.session_id,
+        )
+        with closing(events):
+            for event in events:
+                if event.event == RunEvent.run_content and event.content:
+                    content += str(event.content)
+                    answer.markdown(content + "▌")
+                elif event.event == RunEvent.tool_call_started:
+                    status.write(f"🔧 Calling `{event.tool.tool_name}`")
+                elif event.event == RunEvent.tool_call_completed:
+                    status.write(f"✅ `{event.tool.tool_name}` finished")
+                elif event.event == RunEvent.run_error:
+                    raise RuntimeError(event.content)
+    except Exception:
+        status.update(label="❌ Failed", state="error")
+        raise
+    finally:
+        reset_member_session(session_token)
+        reset_progress_sink(token)
+
+    status.update(label="✅ Done", state="complete", expanded=False)
+    answer.markdown(content)
+    return content
@@ -1,6 +1,32 @@
 """Workflow execution handlers."""
 
 import streamlit as st
+from config.streaming import stream_agent_run
+
+
+def fetch_query(group_id, limit_members):
+    """Prompt that fetches premium members from a group."""
+    return f"fetch {limit_members} premium members from group id {group_id}"
+
+
+def export_query(sheet_title):
+    """Prompt that exports the last fetched members to a sheet."""
+    return f"add the last fetched members to a google sheet titled '{sheet_title}'"
+
+
+def complete_query(group_id, limit_members, sheet_title):
+    """Prompt that fetches premium members and exports them in one run."""
+    return f"{fetch_query(group_id, limit_members)} and add them to a google sheet titled '{sheet_title}'"
+
+
+def workflow_queries(workflow_type, group_id, limit_members, sheet_title):
+    """Prompts a workflow runs, in order."""
+    if workflow_type == "Complete Workflow":
+        return [complete_query(group_id, limit_members, sheet_title)]
+    queries = [fetch_query(group_id, limit_members)]
+    if workflow_type == "Multi-Step Workflow" and sheet_title:
+        queries.append(export_query(sheet_title))
+    return queries
 
 
 def execute_complete_workflow(agent, group_id, limit_members, sheet_title):
@@ -9,61 +35,52 @@ def execute_complete_workflow(agent, group_id, limit_members, sheet_title):
         st.error("⚠️ Sheet Title is required for Complete Workflow")
         return
     
-    query = f"fetch {limit_members} premium members from group id {group_id} and add them to a google sheet titled '{sheet_title}'"
+    query = complete_query(group_id, limit_members, sheet_title)
     
-    with st.spinner("🔄 Fetching premium members and exporting to Google Sheets..."):
-        try:
-            response = agent.run(query)
-            st.session_state.last_result = response.content
-            st.success("✅ Complete workflow executed successfully!")
-            st.markdown("### Result:")
-            st.markdown(response.content)
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
+    try:
+        st.markdown("### Result:")
+        content = stream_agent_run(agent, query, "🔄 Fetching premium members and exporting to Google Sheets...")
+        st.session_state.last_result = content
+        st.success("✅ Complete workflow executed successfully!")
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
 
 
 def execute_multi_step_workflow(agent, group_id, limit_members, sheet_title):
     """Execute multi-step workflow: fetch first, then optionally export."""
-    query = f"fetch {limit_members} premium members from group id {group_id}"
+    query = fetch_query(group_id, limit_members)
     
-    with st.spinner("🔄 Step 1: Fetching premium members..."):
-        try:
-            response = agent.run(query)
-            st.session_state.last_result = response.content
-            st.success("✅ Step 1 completed: Members fetched!")
-            st.markdown("### Fetch Result:")
-            st.markdown(response.content)
-            
-            if sheet_title:
-                st.divider()
-                export_query = f"add the last fetched members to a google sheet titled '{sheet_title}'"
-                with st.spinner("🔄 Step 2: Exporting to Google Sheets..."):
-                    try:
-                        export_response = agent.run(export_query)
-                        st.success("✅ Step 2 completed: Exported to Google Sheets!")
-                        st.markdown("### Export Result:")
-                        st.markdown(export_response.content)
-                    except Exception as e:
-                        st.error(f"❌ Export Error: {str(e)}")
-            else:
-                st.info("💡 Enter a Sheet Title to export the fetched members to Google Sheets")
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
+    try:
+        st.markdown("### Fetch Result:")
+        content = stream_agent_run(agent, query, "🔄 Step 1: Fetching premium members...")
+        st.session_state.last_result = content
+        st.success("✅ Step 1 completed: Members fetched!")
+        
+        if sheet_title:
+            st.divider()
+            try:
+                st.markdown("### Export Result:")
+                stream_agent_run(agent, export_query(sheet_title), "🔄 Step 2: Exporting to Google Sheets...")
+                st.success("✅ Step 2 completed: Exported to Google Sheets!")
+            except Exception as e:
+                st.error(f"❌ Export Error: {str(e)}")
+        else:
+            st.info("💡 Enter a Sheet Title to export the fetched members to Google Sheets")
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
 
 
 def execute_fetch_only_workflow(agent, group_id, limit_members):
     """Execute fetch-only workflow."""
-    query = f"fetch {limit_members} premium members from group id {group_id}"
+    query = fetch_query(group_id, limit_members)
     
-    with st.spinner("🔄 Fetching members..."):
-        try:
-            response = agent.run(query)
-            st.session_state.last_result = response.content
-            st.success("✅ Members fetched successfully!")
-            st.markdown("### Result:")
-            st.markdown(response.content)
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
+    try:
+        st.markdown("### Result:")
+        content = stream_agent_run(agent, query, "🔄 Fetching members...")
+        st.session_state.last_result = content
+        st.success("✅ Members fetched successfully!")
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
 
 
 def execute_workflow(agent, workflow_type, group_id, limit_members, sheet_title):
@@ -4,6 +4,7 @@ import json
 import httpx
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from tools.progress import report_progress
 
 load_dotenv()
 
@@ -114,6 +115,7 @@ def google_sheets_tool(
             res = client.post(append_url, headers=headers, json={"values": rows_to_add})
             res.raise_for_status()
             members_added = len(rows_to_add)
+            report_progress(f"📝 {members_added} new rows appended to the sheet")
 
     result = {
         "success": True,
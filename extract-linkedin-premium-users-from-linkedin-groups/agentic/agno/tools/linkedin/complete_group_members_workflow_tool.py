@@ -4,6 +4,8 @@ from dotenv import load_dotenv
 import httpx
 from datetime import datetime
 from typing import Optional, List, Dict, Any
+from tools.progress import report_progress
+from tools.storage.member_store import store_members
 
 load_dotenv()
 
@@ -48,10 +50,14 @@ def complete_group_members_workflow(group_id: str, max_members: Optional[int] =
                 all_members.extend(batch)
                 has_more = bool(data.get("hasMore", False))
                 start += count
+                report_progress(f"📄 Page {start // count}: {len(all_members)} members fetched")
 
                 if max_members and len(all_members) >= max_members:
                     all_members = all_members[:max_members]
                     break
+
+        # Keep every fetched member locally for follow-up queries and exports
+        store_members(group_id, all_members)
         
         # Step 2: Filtering Logic
         filtered = []
@@ -63,6 +69,8 @@ def complete_group_members_workflow(group_id: str, max_members: Optional[int] =
             if is_premium or is_verified or "premium" in badges or "verified" in badges:
                 filtered.append(m)
 
+        report_progress(f"⭐ {len(filtered)} premium/verified members found")
+
         result = {
             "totalFetched": len(all_members),
             "totalFiltered": len(filtered),
@@ -2,6 +2,8 @@ import os
 from dotenv import load_dotenv
 import httpx
 from typing import Optional, List, Dict, Any
+from tools.progress import report_progress
+from tools.storage.member_store import store_members
 from datetime import datetime
 
 load_dotenv()
@@ -48,10 +50,14 @@ def fetch_all_linkedin_group_members(group_id: str, max_members: Optional[int] =
                 all_members.extend(batch)
                 has_more = bool(data.get("hasMore", False))
                 start += count
+                report_progress(f"📄 Page {start // count}: {len(all_members)} members fetched")
 
                 if max_members and len(all_members) >= max_members:
                     all_members = all_members[:max_members]
                     break
+
+        # Keep every fetched member locally for follow-up queries and exports
+        store_members(group_id, all_members)
         
         result = {
             "totalFetched": len(all_members),
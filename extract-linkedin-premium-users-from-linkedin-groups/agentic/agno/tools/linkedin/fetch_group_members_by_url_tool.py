@@ -3,6 +3,7 @@ from dotenv import load_dotenv
 import httpx
 import json
 from typing import Optional
+from tools.storage.member_store import store_members
 
 load_dotenv()
 
@@ -27,6 +28,9 @@ def fetch_group_members_by_url(group_url: str, count: int = 20, start: int = 0)
         with httpx.Client(timeout=30.0) as client:
             response = client.post(url, headers=headers, json=payload)
             response.raise_for_status()
-            return json.dumps(response.json())
+            data = response.json()
+            # The API resolves the URL to a groupId; fall back to the URL itself
+            store_members(data.get("groupId") or group_url, data.get("members", []))
+            return json.dumps(data)
     except Exception as e:
         return f"Error fetching by URL: {str(e)}"
\ No newline at end of file
@@ -3,6 +3,7 @@ from dotenv import load_dotenv
 import httpx
 import json
 from typing import Optional
+from tools.storage.member_store import store_members
 
 load_dotenv()
 
@@ -33,6 +34,7 @@ def fetch_linkedin_group_members(group_id: str, start: int = 0, count: int = 50)
             response = client.post(url, headers=headers, json=payload)
             response.raise_for_status()
             data = response.json()
+            store_members(group_id, data.get("members", []))
             
             # Formating the return to match your TS tool's output structure
             result = {
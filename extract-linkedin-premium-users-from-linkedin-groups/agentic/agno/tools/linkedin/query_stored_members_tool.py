@@ -0,0 +1,38 @@
+import json
+from typing import Optional
+from tools.storage.member_store import current_member_session, get_member_store
+
+
+def query_stored_members(
+    group_id: Optional[str] = None,
+    premium_only: bool = True,
+    fetched_since: Optional[str] = None,
+    limit: int = 100,
+) -> str:
+    """
+    Query members already fetched into the local store, without calling the API.
+    Use this for follow-ups about previously fetched members ("them", "those").
+
+    Args:
+        group_id (Optional[str]): Group to query. Defaults to the group most recently fetched in this session.
+        premium_only (bool): Only Premium/Verified members (default True).
+        fetched_since (Optional[str]): UTC ISO timestamp; only members fetched at or after it.
+        limit (int): Maximum number of members to return (default 100); totalStored says how many match.
+    Returns:
+        str: A JSON string with groupId, totalFetched, totalStored and members, in the same shape
+            as the fetch tools so it can be passed to export_members_to_sheets.
+    """
+    store = get_member_store()
+    group_id = group_id or store.last_group_id(current_member_session())
+    if not group_id:
+        return json.dumps({"success": False, "error": "No members have been fetched yet"})
+
+    filters = {"group_id": group_id, "premium_or_verified": premium_only, "fetched_since": fetched_since}
+    members = store.query_members(**filters, limit=max(1, int(limit)))
+    return json.dumps({
+        "source": "local",
+        "groupId": group_id,
+        "totalFetched": len(members),
+        "totalStored": store.count_members(**filters),
+        "members": members,
+    })
@@ -0,0 +1,23 @@
+"""Lets long-running tools report progress to whoever is running the agent."""
+
+from contextvars import ContextVar, Token
+from typing import Callable, Optional
+
+_sink: ContextVar[Optional[Callable[[str], None]]] = ContextVar("progress_sink", default=None)
+
+
+def set_progress_sink(sink: Callable[[str], None]) -> Token:
+    """Send progress messages from tools to `sink` until the token is reset."""
+    return _sink.set(sink)
+
+
+def reset_progress_sink(token: Token) -> None:
+    """Restore the previous progress sink."""
+    _sink.reset(token)
+
+
+def report_progress(message: str) -> None:
+    """Report a progress message; a no-op when nobody is listening."""
+    sink = _sink.get()
+    if sink is not None:
+        sink(message)
@@ -1,4 +1,5 @@
 import os
+import uuid
 
 # Disable CrewAI telemetry
 os.environ["OTEL_SDK_DISABLED"] = "true"
@@ -6,7 +7,10 @@ os.environ["CREWAI_TELEMETRY_OPT_OUT"] = "true"
 
 import streamlit as st
 from dotenv import load_dotenv
-from crew import LinkedInCrew
+from streaming import describe_step, describe_task
+from jobs import get_job_runner, submit_crew_job, render_jobs
+from tools.progress import set_progress_sink, reset_progress_sink
+from tools.storage.memberStore import set_member_session, reset_member_session
 
 load_dotenv()
 
@@ -31,6 +35,10 @@ def main():
 
     if not check_env():
         st.stop()
+    if "session_id" not in st.session_state:
+        # Kept in the URL so a reload still finds this session's jobs and fetches
+        st.session_state.session_id = st.query_params.get("session") or uuid.uuid4().hex
+        st.query_params["session"] = st.session_state.session_id
 
     with st.sidebar:
         st.header("⚙️ Configuration")
@@ -43,36 +51,70 @@ def main():
         export = st.checkbox("Export to Sheets", value=True, disabled=mode == "Fetch Only")
         title = st.text_input("Sheet Title") if export else None
 
+        background = st.checkbox(
+            "Run in background",
+            help="Keeps running if you close or reload the page",
+        )
+
+    job_runner = get_job_runner()
+
     if st.button("▶️ Start Extraction", type="primary"):
         if not group_id:
             st.warning("⚠️ Please enter a Group ID")
             st.stop()
 
-        with st.spinner("🤖 Agents working..."):
-            try:
-                crew = LinkedInCrew()
-                kwargs = {
-                    "group_id": group_id,
-                    "max_members": max_members,
-                }
-                
-                if mode == "Complete Workflow":
-                    res = crew.complete_workflow(**kwargs, spreadsheet_title=title, export_to_sheets=export)
-                elif mode == "Multi-Step Workflow":
-                    res = crew.multi_step_workflow(**kwargs, spreadsheet_title=title)
-                else:
-                    res = crew.fetch_only(**kwargs)
-
-                st.success("✅ Workflow completed!")
-                
-                with st.expander("🤖 Agent Output", expanded=True):
-                    st.code(str(res.get("result", "")), language="text")
-                
-                if res.get("sheets_exported"):
-                    st.info("📊 Spreadsheet Created! Check output above for URL.")
-
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+        if background:
+            job_id = submit_crew_job(job_runner, mode, group_id, max_members, title, export)
+            st.success(f"✅ Job `{job_id}` queued. Track it under Background Jobs.")
+        else:
+            run_in_foreground(mode, group_id, max_members, title, export)
+
+    # Background jobs keep running across reruns; each session sees only its own
+    st.divider()
+    st.subheader("🗂️ Background Jobs")
+    render_jobs(job_runner)
+
+
+def run_in_foreground(mode, group_id, max_members, title, export):
+    """Run the selected workflow in this script run, streaming progress."""
+    # Imported on first run so the UI renders before CrewAI is loaded
+    from crew import LinkedInCrew
+
+    # Agent steps, finished tasks and tool progress stream into this panel
+    status = st.status("🤖 Agents working...", expanded=True)
+    token = set_progress_sink(status.write)
+    session_token = set_member_session(st.session_state.session_id)
+    try:
+        crew = LinkedInCrew(
+            step_callback=lambda step: status.write(describe_step(step)),
+            task_callback=lambda output: status.write(describe_task(output)),
+        )
+        kwargs = {
+            "group_id": group_id,
+            "max_members": max_members,
+        }
+        
+        if mode == "Complete Workflow":
+            res = crew.complete_workflow(**kwargs, spreadsheet_title=title, export_to_sheets=export)
+        elif mode == "Multi-Step Workflow":
+            res = crew.multi_step_workflow(**kwargs, spreadsheet_title=title)
+        else:
+            res = crew.fetch_only(**kwargs)
+
+        status.update(label="✅ Workflow completed!", state="complete", expanded=False)
+        
+        with st.expander("🤖 Agent Output", expanded=True):
+            st.code(str(res.get("result", "")), language="text")
+        
+        if res.get("sheets_exported"):
+            st.info("📊 Spreadsheet Created! Check output above for URL.")
+
+    except Exception as e:
+        status.update(label="❌ Workflow failed", state="error")
+        st.error(f"❌ Error: {str(e)}")
+    finally:
+        reset_member_session(session_token)
+        reset_progress_sink(token)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from crewai import Agent, LLM
 from tools import linkedin_tools, google_sheets_tool
 
@@ -7,8 +8,9 @@ class LinkedInAgents:
     """Factory class for creating LinkedIn automation agents."""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_llm():
-        """Get the Gemini LLM instance."""
+        """Get the Gemini LLM instance, shared by every agent in the process."""
         return LLM(
             model="gemini/gemini-3-pro-preview",
             temperature=0.7,
@@ -8,8 +8,8 @@ from workflows import LinkedInWorkflows
 class LinkedInCrew:
     """Facade for LinkedIn workflows."""
 
-    def __init__(self):
-        self.workflows = LinkedInWorkflows()
+    def __init__(self, step_callback=None, task_callback=None):
+        self.workflows = LinkedInWorkflows(step_callback, task_callback)
 
     def complete_workflow(self, **kwargs) -> dict:
         result = self.workflows.run_complete(**kwargs)
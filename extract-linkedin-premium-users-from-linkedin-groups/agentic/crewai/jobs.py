@@ -0,0 +1,92 @@
+"""Background extraction jobs and the panel that tracks them."""
+
+import os
+
+import streamlit as st
+from job_runner import JobRunner
+from streaming import describe_step, describe_task
+from tools.storage.memberStore import set_member_session, reset_member_session
+
+JOB_POLL_SECONDS = 2
+
+STATUS_ICONS = {
+    "queued": "⏳",
+    "running": "🔄",
+    "succeeded": "✅",
+    "failed": "❌",
+    "cancelled": "🛑",
+}
+
+
+@st.cache_resource
+def get_job_runner() -> JobRunner:
+    """One job runner per process, shared by every browser session."""
+    return JobRunner(
+        os.getenv("JOB_DB_PATH", "jobs.db"),
+        max_workers=int(os.getenv("JOB_MAX_WORKERS", "2")),
+    )
+
+
+def run_crew_job(progress, mode, group_id, max_members, spreadsheet_title, export, session_id=None):
+    """Run a crew workflow to completion on a job thread."""
+    from crew import LinkedInCrew
+
+    # Step/task callbacks double as cancellation points
+    crew = LinkedInCrew(
+        step_callback=lambda step: progress(describe_step(step)),
+        task_callback=lambda output: progress(describe_task(output)),
+    )
+    kwargs = {"group_id": group_id, "max_members": max_members}
+
+    # Fetches count as the submitting session's, for its later follow-ups
+    token = set_member_session(session_id)
+    try:
+        if mode == "Complete Workflow":
+            res = crew.complete_workflow(**kwargs, spreadsheet_title=spreadsheet_title, export_to_sheets=export)
+        elif mode == "Multi-Step Workflow":
+            res = crew.multi_step_workflow(**kwargs, spreadsheet_title=spreadsheet_title)
+        else:
+            res = crew.fetch_only(**kwargs)
+    finally:
+        reset_member_session(token)
+    return str(res.get("result", ""))
+
+
+def submit_crew_job(runner, mode, group_id, max_members, spreadsheet_title, export) -> str:
+    """Queue a crew workflow as a background job and return its ID."""
+    return runner.submit(
+        f"{mode} · group {group_id}",
+        run_crew_job,
+        {
+            "mode": mode,
+            "group_id": group_id,
+            "max_members": int(max_members) if max_members else None,
+            "spreadsheet_title": spreadsheet_title,
+            "export": export,
+            "session_id": st.session_state.session_id,
+        },
+        owner=st.session_state.session_id,
+    )
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def render_jobs(runner):
+    """List this session's recent jobs with live progress, results and cancel buttons."""
+    jobs = runner.list_jobs(owner=st.session_state.session_id)
+    if not jobs:
+        st.caption("No background jobs yet.")
+        return
+
+    for job in jobs:
+        icon = STATUS_ICONS.get(job["status"], "•")
+        with st.expander(f"{icon} `{job['id']}` {job['name']} — {job['status']}"):
+            st.caption(f"Started {job['created_at']} · updated {job['updated_at']}")
+            if job["progress"]:
+                st.markdown(job["progress"])
+            if job["status"] in ("queued", "running"):
+                if st.button("🛑 Cancel", key=f"cancel_{job['id']}"):
+                    runner.cancel(job["id"], owner=st.session_state.session_id)
+            elif job["result"]:
+                st.code(job["result"], language="text")
+            elif job["error"]:
+                st.error(job["error"])
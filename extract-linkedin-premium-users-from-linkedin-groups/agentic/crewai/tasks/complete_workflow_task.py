@@ -46,7 +46,8 @@ class CompleteWorkflowTask:
         - total_fetched: integer
         - total_filtered: integer
         - filter_rate: float
-        - members: list of premium member dictionaries
+        - result_id: string referring to the full list of premium members
+        - members_preview: list of premium member dictionaries (may be partial)
         """
 
         return Task(
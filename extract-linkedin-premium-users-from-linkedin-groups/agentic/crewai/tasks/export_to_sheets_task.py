@@ -30,6 +30,9 @@ class ExportToSheetsTask:
         
         {title_instruction}
         
+        Pass the result_id from the previous step to the Google Sheets Export tool.
+        Do not copy member objects into the tool call.
+        
         Requirements:
         - Create a new spreadsheet (or update existing if spreadsheet_id provided)
         - Add professional column headers
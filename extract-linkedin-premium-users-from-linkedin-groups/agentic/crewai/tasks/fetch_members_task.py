@@ -42,7 +42,8 @@ class FetchMembersTask:
         The output should be a structured dictionary containing:
         - success: boolean
         - total_fetched: integer
-        - members: list of member dictionaries
+        - result_id: string referring to the full member list
+        - members_preview: list of member dictionaries (may be partial)
         - group_id: string
         """
 
@@ -32,6 +32,7 @@ class FilterPremiumTask:
         - Quality metrics
         
         Return only the premium/verified members for export.
+        Pass the result_id from the fetch step to the filter tool instead of copying members.
         """
 
         expected_output = """
@@ -44,7 +45,8 @@ class FilterPremiumTask:
         - success: boolean
         - total_filtered: integer
         - filter_rate: float (percentage)
-        - members: list of premium member dictionaries
+        - result_id: string referring to the full list of premium members
+        - members_preview: list of premium member dictionaries (may be partial)
         """
 
         return Task(
@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 from .FetchLinkedInGroupMembersTool import FetchLinkedInGroupMembersTool
 from .FilterPremiumMembersTool import FilterPremiumMembersTool
+from ..compaction import compact_members_result
 
 
 class CompleteWorkflowInput(BaseModel):
@@ -20,11 +21,15 @@ class CompleteGroupMembersWorkflowTool(BaseTool):
         "Complete end-to-end workflow to fetch LinkedIn group members and automatically "
         "filter for Premium/Verified profiles using ConnectSafely.ai. "
         "This is the recommended tool for most use cases as it combines fetching and filtering. "
-        "Returns ready-to-export premium member data."
+        "Returns a preview of the premium members plus a result_id for export."
     )
     args_schema: Type[BaseModel] = CompleteWorkflowInput
 
     def _run(self, group_id: str, max_members: Optional[int] = None) -> dict[str, Any]:
+        """Execute the tool and return a compacted result for the agent."""
+        return compact_members_result(self.run_workflow(group_id, max_members))
+
+    def run_workflow(self, group_id: str, max_members: Optional[int] = None) -> dict[str, Any]:
         """
         Execute complete workflow: fetch + filter premium members.
         
@@ -40,14 +45,14 @@ class CompleteGroupMembersWorkflowTool(BaseTool):
         try:
             # Step 1: Fetch members
             fetch_tool = FetchLinkedInGroupMembersTool()
-            fetch_result = fetch_tool._run(group_id=group_id, max_members=max_members)
+            fetch_result = fetch_tool.fetch_members(group_id=group_id, max_members=max_members)
 
             if not fetch_result.get("success"):
                 return fetch_result
 
             # Step 2: Filter for premium members
             filter_tool = FilterPremiumMembersTool()
-            filter_result = filter_tool._run(members=fetch_result["members"])
+            filter_result = filter_tool.filter_members(fetch_result["members"])
 
             if not filter_result.get("success"):
                 return filter_result
@@ -3,6 +3,9 @@ import requests
 from typing import Any, Optional, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
+from ..compaction import compact_members_result
+from ..progress import report_progress
+from ..storage.memberStore import store_members
 
 
 class FetchMembersInput(BaseModel):
@@ -19,13 +22,18 @@ class FetchLinkedInGroupMembersTool(BaseTool):
     description: str = (
         "Fetch members from a LinkedIn group using ConnectSafely.ai. "
         "Automatically handles pagination and returns all members up to the specified limit. "
-        "Use this tool to get raw member data from LinkedIn groups."
+        "Use this tool to get raw member data from LinkedIn groups. "
+        "Returns a preview plus a result_id that refers to the full member list."
     )
     args_schema: Type[BaseModel] = FetchMembersInput
 
     def _run(self, group_id: str, max_members: Optional[int] = None) -> dict[str, Any]:
+        """Execute the tool and return a compacted result for the agent."""
+        return compact_members_result(self.fetch_members(group_id, max_members))
+
+    def fetch_members(self, group_id: str, max_members: Optional[int] = None) -> dict[str, Any]:
         """
-        Execute the tool to fetch LinkedIn group members.
+        Fetch LinkedIn group members.
         
         Args:
             group_id: The LinkedIn group ID
@@ -74,6 +82,7 @@ class FetchLinkedInGroupMembersTool(BaseTool):
                 start += count
 
                 print(f"   Fetched {len(all_members)} members...")
+                report_progress(f"📄 Page {start // count}: {len(all_members)} members fetched")
 
                 if max_members and len(all_members) >= max_members:
                     all_members = all_members[:max_members]
@@ -81,6 +90,9 @@ class FetchLinkedInGroupMembersTool(BaseTool):
 
             print(f"✓ Total members fetched: {len(all_members)}\n")
 
+            # Keep every fetched member locally for follow-up queries and exports
+            store_members(group_id, all_members)
+
             return {
                 "success": True,
                 "total_fetched": len(all_members),
@@ -1,12 +1,17 @@
-from typing import Any, Type
+from typing import Any, Optional, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
+from ..compaction import compact_members_result, result_store
+from ..progress import report_progress
 
 
 class FilterPremiumMembersInput(BaseModel):
     """Input schema for FilterPremiumMembers tool."""
 
-    members: list = Field(..., description="List of LinkedIn member objects to filter")
+    result_id: Optional[str] = Field(
+        None, description="result_id returned by the fetch tool (preferred over members)"
+    )
+    members: Optional[list] = Field(None, description="List of LinkedIn member objects to filter")
 
 
 class FilterPremiumMembersTool(BaseTool):
@@ -14,13 +19,24 @@ class FilterPremiumMembersTool(BaseTool):
     description: str = (
         "Filter a list of LinkedIn members to only include Premium or Verified accounts. "
         "Identifies members with premium badges, verified status, or LinkedIn Premium subscription. "
-        "Use this tool after fetching members to get only high-value profiles."
+        "Use this tool after fetching members to get only high-value profiles. "
+        "Pass the result_id from the fetch tool instead of copying the members."
     )
     args_schema: Type[BaseModel] = FilterPremiumMembersInput
 
-    def _run(self, members: list) -> dict[str, Any]:
+    def _run(
+        self, result_id: Optional[str] = None, members: Optional[list] = None
+    ) -> dict[str, Any]:
+        """Execute the tool and return a compacted result for the agent."""
+        if result_id:
+            members = result_store.get(result_id)
+            if members is None:
+                return {"success": False, "error": f"Unknown or expired result_id: {result_id}"}
+        return compact_members_result(self.filter_members(members or []))
+
+    def filter_members(self, members: list) -> dict[str, Any]:
         """
-        Execute the tool to filter premium members.
+        Filter members down to Premium/Verified profiles.
         
         Args:
             members: List of LinkedIn member dictionaries
@@ -48,6 +64,7 @@ class FilterPremiumMembersTool(BaseTool):
                 f"✓ Found {len(premium_members)} premium/verified members "
                 f"out of {len(members)} total\n"
             )
+            report_progress(f"⭐ {len(premium_members)} premium/verified members found")
 
             return {
                 "success": True,
@@ -0,0 +1,55 @@
+from typing import Any, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+from ..compaction import compact_members_result
+from ..storage.memberStore import current_member_session, get_member_store
+
+
+class QueryStoredMembersInput(BaseModel):
+    """Input schema for QueryStoredMembers tool."""
+
+    group_id: Optional[str] = Field(
+        None, description="Group to query (defaults to the group most recently fetched in this session)"
+    )
+    premium_only: bool = Field(True, description="Only return Premium/Verified members")
+    fetched_since: Optional[str] = Field(
+        None, description="UTC ISO timestamp; only members fetched at or after it"
+    )
+    limit: Optional[int] = Field(None, description="Maximum number of members to return")
+
+
+class QueryStoredMembersTool(BaseTool):
+    name: str = "Query Stored Members"
+    description: str = (
+        "Query members that were already fetched, from the local member store, without "
+        "calling LinkedIn again. Use this for follow-ups about previously fetched members. "
+        "Returns a result_id that can be passed to the filter or Google Sheets tools."
+    )
+    args_schema: Type[BaseModel] = QueryStoredMembersInput
+
+    def _run(
+        self,
+        group_id: Optional[str] = None,
+        premium_only: bool = True,
+        fetched_since: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Execute the tool and return a compacted result for the agent."""
+        store = get_member_store()
+        group_id = group_id or store.last_group_id(current_member_session())
+        if not group_id:
+            return {"success": False, "error": "No members have been fetched yet"}
+
+        members = store.query_members(
+            group_id=group_id,
+            premium_or_verified=premium_only,
+            fetched_since=fetched_since,
+            limit=limit,
+        )
+        return compact_members_result({
+            "success": True,
+            "source": "local",
+            "group_id": group_id,
+            "total_fetched": len(members),
+            "members": members,
+        })
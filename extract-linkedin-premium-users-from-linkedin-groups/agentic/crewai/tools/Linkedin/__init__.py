@@ -1,17 +1,20 @@
 from .FetchLinkedInGroupMembersTool import FetchLinkedInGroupMembersTool
 from .FilterPremiumMembersTool import FilterPremiumMembersTool
 from .CompleteGroupMembersWorkflowTool import CompleteGroupMembersWorkflowTool
+from .QueryStoredMembersTool import QueryStoredMembersTool
 
 linkedin_tools = [
     FetchLinkedInGroupMembersTool(),
     FilterPremiumMembersTool(),
     CompleteGroupMembersWorkflowTool(),
+    QueryStoredMembersTool(),
 ]
 
 __all__ = [
     "FetchLinkedInGroupMembersTool",
     "FilterPremiumMembersTool",
     "CompleteGroupMembersWorkflowTool",
+    "QueryStoredMembersTool",
     "linkedin_tools",
 ]
 
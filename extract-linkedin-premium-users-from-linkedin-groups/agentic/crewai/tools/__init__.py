@@ -1,4 +1,14 @@
-from .Linkedin import linkedin_tools
-from .googleSheet.googleSheetsTools import google_sheets_tool
-
 __all__ = ["linkedin_tools", "google_sheets_tool"]
+
+
+def __getattr__(name):
+    # Loaded on first use so light modules (e.g. tools.progress) don't pull in CrewAI
+    if name == "linkedin_tools":
+        from .Linkedin import linkedin_tools
+
+        return linkedin_tools
+    if name == "google_sheets_tool":
+        from .googleSheet.googleSheetsTools import google_sheets_tool
+
+        return google_sheets_tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
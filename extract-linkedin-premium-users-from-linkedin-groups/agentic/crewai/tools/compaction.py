@@ -0,0 +1,67 @@
+"""Token-aware compaction of member results before they reach the model."""
+import json
+import os
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv("TOOL_OUTPUT_TOKEN_BUDGET", "1500"))
+
+MEMBER_FIELDS = ["profileId", "fullName", "headline", "isPremium", "isVerified"]
+
+
+class ResultStore:
+    """Process-wide store of full member lists, addressed by a result_id."""
+
+    def __init__(self, max_entries: int = 20):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, list]" = OrderedDict()
+
+    def put(self, members: list) -> str:
+        result_id = uuid.uuid4().hex[:12]
+        self._results[result_id] = members
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result_id
+
+    def get(self, result_id: str) -> Optional[list]:
+        return self._results.get(result_id)
+
+
+result_store = ResultStore()
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count (~4 characters per token) of a value as the model sees it."""
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return len(text) // 4 + 1
+
+
+def compact_members_result(
+    result: dict[str, Any], max_tokens: int = DEFAULT_TOKEN_BUDGET
+) -> dict[str, Any]:
+    """
+    Replace a result's full member list with a projected preview that fits the budget.
+
+    The full list is kept in `result_store`; the returned 'result_id' lets other
+    tools (filter, Google Sheets export) load it without the model copying members.
+    """
+    members = result.get("members")
+    if not result.get("success") or not isinstance(members, list):
+        return result
+
+    rows = [{field: m.get(field) for field in MEMBER_FIELDS if field in m} for m in members]
+    compact = {key: value for key, value in result.items() if key != "members"}
+    compact["result_id"] = result_store.put(members)
+    shown = len(rows)
+    compact["members_preview"] = rows
+
+    while shown > 0 and estimate_tokens(compact) > max_tokens:
+        shown = max(0, min(shown - 1, shown * max_tokens // estimate_tokens(compact)))
+        compact["members_preview"] = rows[:shown]
+
+    compact["preview_note"] = (
+        f"Showing {shown} of {len(rows)} members. "
+        f"Pass result_id '{compact['result_id']}' to other tools to use the full list."
+    )
+    return compact
@@ -2,12 +2,17 @@ from typing import Any, Optional, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 from .googleSheetsClient import GoogleSheetsClient
+from ..compaction import result_store
+from ..progress import report_progress
 
 
 class GoogleSheetsInput(BaseModel):
     """Input schema for GoogleSheets tool."""
 
-    members: list = Field(..., description="List of LinkedIn member objects to save")
+    result_id: Optional[str] = Field(
+        None, description="result_id returned by the fetch/filter tools (preferred over members)"
+    )
+    members: Optional[list] = Field(None, description="List of LinkedIn member objects to save")
     spreadsheet_title: Optional[str] = Field(
         None, description="Title for the new spreadsheet (auto-generated if not provided)"
     )
@@ -24,18 +29,25 @@ class GoogleSheetsTool(BaseTool):
     description: str = (
         "Create or update a Google Sheet with LinkedIn members. "
         "Automatically handles OAuth authentication, creates spreadsheets, "
-        "detects duplicates, and formats data professionally."
+        "detects duplicates, and formats data professionally. "
+        "Pass the result_id from the previous step instead of copying the members."
     )
     args_schema: Type[BaseModel] = GoogleSheetsInput
 
     def _run(
         self,
-        members: list,
+        result_id: Optional[str] = None,
+        members: Optional[list] = None,
         spreadsheet_title: Optional[str] = None,
         spreadsheet_id: Optional[str] = None,
         sheet_name: str = "LinkedIn Members",
     ) -> dict[str, Any]:
         """Execute the tool to save members to Google Sheets."""
+        if result_id:
+            members = result_store.get(result_id)
+            if members is None:
+                return {"success": False, "error": f"Unknown or expired result_id: {result_id}"}
+        members = members or []
         print(f"\n💾 Google Sheets Export invoked with {len(members)} members")
         client = GoogleSheetsClient()
 
@@ -77,6 +89,7 @@ class GoogleSheetsTool(BaseTool):
             if rows:
                 client.append_data(spreadsheet_id, sheet_name, rows)
                 print(f"✓ Added {len(rows)} new members")
+                report_progress(f"📝 {len(rows)} new rows appended to the sheet")
             else:
                 print("⚠️ No new members to add (duplicates skipped)")
 
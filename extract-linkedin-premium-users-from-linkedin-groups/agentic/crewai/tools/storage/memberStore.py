@@ -0,0 +1,207 @@
+"""Local SQLite warehouse of every fetched group member."""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    profile_id TEXT NOT NULL,
+    group_id TEXT NOT NULL,
+    full_name TEXT,
+    headline TEXT,
+    profile_url TEXT,
+    is_premium INTEGER NOT NULL DEFAULT 0,
+    is_verified INTEGER NOT NULL DEFAULT 0,
+    fetched_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (profile_id, group_id)
+);
+CREATE INDEX IF NOT EXISTS idx_members_profile ON members (profile_id);
+CREATE INDEX IF NOT EXISTS idx_members_group_premium ON members (group_id, is_premium);
+CREATE INDEX IF NOT EXISTS idx_members_premium ON members (is_premium);
+CREATE INDEX IF NOT EXISTS idx_members_fetched ON members (fetched_at);
+CREATE TABLE IF NOT EXISTS session_groups (
+    session_id TEXT PRIMARY KEY,
+    group_id TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO members (profile_id, group_id, full_name, headline, profile_url,
+                     is_premium, is_verified, fetched_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (profile_id, group_id) DO UPDATE SET
+    full_name = excluded.full_name, headline = excluded.headline,
+    profile_url = excluded.profile_url, is_premium = excluded.is_premium,
+    is_verified = excluded.is_verified, fetched_at = excluded.fetched_at,
+    data = excluded.data
+"""
+
+# The UI session whose agent run is calling the tools, so follow-ups resolve to its own group
+_session: ContextVar[Optional[str]] = ContextVar("member_session", default=None)
+
+
+def set_member_session(session_id: Optional[str]) -> Token:
+    """Attribute fetches and follow-up queries to `session_id` until the token is reset."""
+    return _session.set(session_id)
+
+
+def reset_member_session(token: Token) -> None:
+    """Restore the previous session."""
+    _session.reset(token)
+
+
+def current_member_session() -> Optional[str]:
+    """The session set by the caller, or None outside a UI session (e.g. the CLI)."""
+    return _session.get()
+
+
+def is_premium_member(member: Dict[str, Any]) -> bool:
+    """True for members with the Premium flag or badge."""
+    return member.get("isPremium") is True or "premium" in (member.get("badges") or [])
+
+
+def is_verified_member(member: Dict[str, Any]) -> bool:
+    """True for members with the Verified flag or badge."""
+    return member.get("isVerified") is True or "verified" in (member.get("badges") or [])
+
+
+class MemberStore:
+    """Bulk upserts and indexed queries over fetched members."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    def save_members(
+        self, group_id: str, members: List[Dict[str, Any]], session_id: Optional[str] = None
+    ) -> int:
+        """
+        Upsert a batch of members for a group in one transaction.
+
+        `fetched_at` is the write time in UTC ISO format, so it sorts and compares
+        as a string; the API's own fetchedAt stays in the stored member data.
+        """
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        rows = [
+            (
+                str(m["profileId"]),
+                str(group_id),
+                m.get("fullName") or " ".join(filter(None, [m.get("firstName"), m.get("lastName")])),
+                m.get("headline"),
+                m.get("profileUrl"),
+                int(is_premium_member(m)),
+                int(is_verified_member(m)),
+                now,
+                json.dumps(m),
+            )
+            for m in members
+            if m.get("profileId")
+        ]
+        with self._connect() as db:
+            db.executemany(_UPSERT, rows)
+            if session_id and rows:
+                db.execute(
+                    "INSERT OR REPLACE INTO session_groups VALUES (?, ?, ?)",
+                    (session_id, str(group_id), now),
+                )
+        return len(rows)
+
+    def query_members(
+        self,
+        group_id: Optional[str] = None,
+        premium_or_verified: bool = False,
+        fetched_since: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return stored members (as fetched from the API), newest first."""
+        where, params = self._filters(group_id, premium_or_verified, fetched_since)
+        sql = "SELECT data FROM members" + where + " ORDER BY fetched_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._connect() as db:
+            return [json.loads(row[0]) for row in db.execute(sql, params)]
+
+    def count_members(
+        self,
+        group_id: Optional[str] = None,
+        premium_or_verified: bool = False,
+        fetched_since: Optional[str] = None,
+    ) -> int:
+        """Number of stored members matching the same filters as query_members."""
+        where, params = self._filters(group_id, premium_or_verified, fetched_since)
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM members" + where, params).fetchone()[0]
+
+    def last_group_id(self, session_id: Optional[str] = None) -> Optional[str]:
+        """
+        Group of the most recent fetch, for 'them'/'those' follow-ups.
+
+        With a session, only that session's fetches count, so one user's
+        follow-up never lands on another user's group.
+        """
+        with self._connect() as db:
+            if session_id:
+                row = db.execute(
+                    "SELECT group_id FROM session_groups WHERE session_id = ?", (session_id,)
+                ).fetchone()
+            else:
+                row = db.execute(
+                    "SELECT group_id FROM members ORDER BY fetched_at DESC LIMIT 1"
+                ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _filters(
+        group_id: Optional[str], premium_or_verified: bool, fetched_since: Optional[str]
+    ) -> tuple:
+        clauses, params = [], []
+        if group_id:
+            clauses.append("group_id = ?")
+            params.append(str(group_id))
+        if premium_or_verified:
+            clauses.append("(is_premium = 1 OR is_verified = 1)")
+        if fetched_since:
+            clauses.append("fetched_at >= ?")
+            params.append(fetched_since)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+
+_store: Optional[MemberStore] = None
+_store_lock = threading.Lock()
+
+
+def get_member_store() -> MemberStore:
+    """Process-wide member store at MEMBER_DB_PATH (default members.db)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MemberStore(os.getenv("MEMBER_DB_PATH", "members.db"))
+        return _store
+
+
+def store_members(group_id: str, members: List[Dict[str, Any]]) -> int:
+    """Save fetched members; storage problems are logged, never raised into the tool."""
+    try:
+        return get_member_store().save_members(group_id, members, current_member_session())
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not store members locally: {e}")
+        return 0
@@ -6,9 +6,12 @@ from tasks import LinkedInTasks
 class LinkedInWorkflows:
     """Handles the assembly and execution of CrewAI workflows."""
 
-    def __init__(self):
+    def __init__(self, step_callback=None, task_callback=None):
         self.agents = LinkedInAgents()
         self.tasks = LinkedInTasks()
+        # Called after every agent step / finished task so the UI can stream progress
+        self.step_callback = step_callback
+        self.task_callback = task_callback
 
     def run_complete(
         self,
@@ -60,6 +63,8 @@ class LinkedInWorkflows:
             tasks=tasks,
             process=Process.sequential,
             verbose=True,
+            step_callback=self.step_callback,
+            task_callback=self.task_callback,
         ).kickoff()
         print(f"\n✅ {name} completed!\n")
         return result
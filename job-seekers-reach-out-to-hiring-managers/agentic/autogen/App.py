@@ -1,7 +1,8 @@
 import os
+from contextlib import closing
+
 import streamlit as st
 from dotenv import load_dotenv
-from autogen_client import JobSearchClient
 
 # Disable AutoGen telemetry if available
 os.environ.setdefault("AUTOGEN_TELEMETRY_OPT_OUT", "true")
@@ -17,6 +18,80 @@ def check_env():
         return False
     return True
 
+def get_agent_client():
+    """Return this session's client, creating it on first use."""
+    # ✅ Initialize the Agent ONCE per session and persist it
+    # This keeps the job search memory alive across clicks
+    if "agent_client" not in st.session_state:
+        # Imported here so the UI renders before AutoGen is loaded
+        from autogen_client import JobSearchClient
+
+        with st.spinner("Initializing Agent..."):
+            st.session_state.agent_client = JobSearchClient()
+            # Optional: Print to console so you know it started
+            print("✅ Agent initialized in Session State")
+    return st.session_state.agent_client
+
+def render_stream(events) -> str:
+    """Render streamed agent events live and return the final answer."""
+    status = st.status("🤖 Agent working...", expanded=False)
+    answer = st.empty()
+    tokens = ""
+    final = ""
+
+    # closing() cancels the run if Streamlit interrupts the script (e.g. Stop button)
+    with closing(events):
+        for event in events:
+            kind = event["type"]
+            if kind == "token":
+                tokens += event["content"]
+                answer.markdown(tokens + "▌")
+            elif kind in ("tool_call", "tool_result"):
+                status.write(event["content"])
+                # Tokens before a tool call are the model thinking aloud
+                tokens = ""
+                answer.empty()
+            elif kind == "final":
+                final = event["content"]
+
+    status.update(label="✅ Done", state="complete")
+    answer.markdown(final)
+    return final
+
+@st.cache_resource
+def start_outreach_worker():
+    """Start the process-wide queue worker once; it keeps sending between reruns."""
+    from pipelines import get_outreach_worker
+
+    worker = get_outreach_worker()
+    worker.start()
+    return worker
+
+def render_outreach_queue():
+    """Sidebar panel: queue counts and worker controls."""
+    worker = start_outreach_worker()
+    stats = worker.queue.stats()
+
+    st.divider()
+    st.subheader("📬 Outreach Queue")
+    col1, col2 = st.columns(2)
+    col1.metric("Queued", stats["queued"] + stats["sending"])
+    col2.metric("Sent today", f"{stats['sent_today']}/{worker.daily_budget}")
+    st.caption(
+        f"Sent {stats['sent']} · Unverified {stats['unverified']} · Failed {stats['failed']} · "
+        f"Already connected {stats['already_connected']} · Already invited {stats['already_invited']}"
+    )
+    if worker.running:
+        if st.button("⏸️ Pause Sending"):
+            worker.pause()
+            st.rerun()
+    elif st.button("▶️ Resume Sending"):
+        worker.start()
+        st.rerun()
+    if stats["failed"] and st.button("🔁 Retry Failed"):
+        worker.queue.requeue_failed()
+        st.rerun()
+
 def main():
     st.set_page_config(
         page_title="Job Search Agent (AutoGen)", 
@@ -32,16 +107,6 @@ def main():
     # --- 1. INITIALIZE SESSION STATE ---
     if "messages" not in st.session_state:
         st.session_state.messages = []
-    if "context" not in st.session_state:
-        st.session_state.context = ""
-    
-    # ✅ FIX: Initialize the Agent ONCE and persist it
-    # This keeps the 'last_search_results' memory alive across clicks
-    if "agent_client" not in st.session_state:
-        with st.spinner("Initializing Agent..."):
-            st.session_state.agent_client = JobSearchClient()
-            # Optional: Print to console so you know it started
-            print("✅ Agent initialized in Session State")
     
     # Display chat history
     st.subheader("💬 Command Interface")
@@ -74,15 +139,32 @@ def main():
         st.header("⚙️ Controls")
         if st.button("🗑️ Clear History & Reset Agent"):
             st.session_state.messages = []
-            st.session_state.context = ""
-            # Re-initialize to wipe memory clean
-            st.session_state.agent_client = JobSearchClient()
+            # Drop the agent; a clean one is created on the next command
+            st.session_state.pop("agent_client", None)
             st.rerun()
         
+        st.divider()
+        st.subheader("🚀 Quick Outreach")
+        # Runs geo → jobs → managers → status → connect directly, with one model call
+        with st.form("outreach_form"):
+            outreach_keywords = st.text_input("Job keywords", "Software Engineer")
+            outreach_location = st.text_input("Location", "Australia")
+            outreach_jobs = st.number_input("Jobs", min_value=1, max_value=25, value=5)
+            outreach_send = st.checkbox("Send connection requests", value=False)
+            outreach_queue = st.checkbox("Queue for paced sending", value=True)
+            outreach_new_only = st.checkbox("Skip jobs already handled", value=True)
+            run_outreach = st.form_submit_button("Run Outreach")
+
+        render_outreach_queue()
+
         st.divider()
         st.subheader("📋 Context Size")
-        # Just a visual indicator
-        st.metric("Context Length", len(st.session_state.context))
+        # The agent keeps its own context within a fixed token budget
+        if "agent_client" in st.session_state:
+            stats = st.session_state.agent_client.context_stats()
+            col1, col2 = st.columns(2)
+            col1.metric("Context tokens", f"{stats['context_tokens']}/{stats['budget']}")
+            col2.metric("Last prompt tokens", stats["prompt_tokens"] or "-")
     
     # --- 2. PROCESS COMMAND ---
     if command:
@@ -91,43 +173,51 @@ def main():
         st.chat_message("user").write(command)
         
         with st.chat_message("assistant"):
-            with st.spinner("🤖 Agent working..."):
-                try:
-                    # ✅ FIX: Use the PERSISTENT client
-                    client = st.session_state.agent_client
-                    
-                    # Execute
-                    # Note: We still pass context string for LLM awareness, 
-                    # but the client object now retains its internal list memory too.
-                    result = client.execute(
-                        command=command,
-                        context=st.session_state.context if st.session_state.context else None
-                    )
-                    
-                    result_str = str(result.get("result", ""))
-                    
-                    # Update textual context (keep last 2000 chars)
-                    if len(st.session_state.context) > 2000:
-                        st.session_state.context = st.session_state.context[-2000:]
-                    
-                    st.session_state.context += f"\n\nUser: {command}\nAgent: {result_str}\n"
-                    
-                    # Display Result
-                    st.markdown(result_str)
-                    
-                    # Save to history
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": result_str
-                    })
-                    
-                except Exception as e:
-                    error_msg = f"❌ Error: {str(e)}"
-                    st.error(error_msg)
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_msg
-                    })
+            try:
+                # ✅ FIX: Use the PERSISTENT client
+                client = get_agent_client()
+                
+                # Stream progress and tokens as the agent works; the client
+                # carries earlier turns and their IDs over by itself
+                result_str = render_stream(client.stream(command=command))
+                
+                # Save to history
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": result_str
+                })
+                
+            except Exception as e:
+                error_msg = f"❌ Error: {str(e)}"
+                st.error(error_msg)
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": error_msg
+                })
+
+    # --- 3. RUN OUTREACH PIPELINE ---
+    if run_outreach:
+        action = "Run outreach" if outreach_send else "Plan outreach (no requests sent)"
+        request_str = f"{action}: {outreach_jobs} '{outreach_keywords}' jobs in {outreach_location}"
+        st.session_state.messages.append({"role": "user", "content": request_str})
+        st.chat_message("user").write(request_str)
+
+        with st.chat_message("assistant"):
+            try:
+                client = get_agent_client()
+                result_str = render_stream(client.stream_outreach(
+                    keywords=outreach_keywords,
+                    location=outreach_location,
+                    job_count=int(outreach_jobs),
+                    send=outreach_send,
+                    queue=outreach_queue,
+                    new_jobs_only=outreach_new_only,
+                ))
+                st.session_state.messages.append({"role": "assistant", "content": result_str})
+            except Exception as e:
+                error_msg = f"❌ Error: {str(e)}"
+                st.error(error_msg)
+                st.session_state.messages.append({"role": "assistant", "content": error_msg})
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,23 +5,36 @@ Detailed Connection Success (Message + URL).
 Auto-Connects to the BEST manager.
 """
 import os
-import asyncio
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+from autogen_agentchat.base import TaskResult
+from autogen_core import CancellationToken
 
 from tools import (
     search_geo_location,
     search_jobs,
+    search_jobs_all,
     get_company_details,
+    get_company_details_batch,
     search_hiring_managers,
     fetch_profile_details,
     check_connection_status,
-    send_connection_request
+    batch_check_connection_status,
+    send_connection_request,
+    compact_tool,
+    ToolResultStore,
 )
+from tools.http_client import run_sync
+from pipelines import enrich_profiles, make_fan_out_tool, make_message_tool, queue_connection_request
 
-from .config.agent_factory import create_assistant_agent
-from .config.response_processor import clean_response
+from .config.agent_factory import create_assistant_agent, create_model_client
+from .config.response_processor import clean_response, ends_with_tool_output, format_tool_results
 from .config.memory_manager import MemoryManager
-from .config.execution_utils import is_raw_output, get_continuation_instruction
+from .config.conversation_context import ConversationContext
+from .config.execution_utils import get_continuation_instruction
+from .config.tool_results import ToolResultCollector
+from .config.stream_events import to_progress_event
+from .config.async_bridge import iterate_async
 
 
 class LinkedInAssistant:
@@ -33,60 +46,110 @@ class LinkedInAssistant:
             raise ValueError("GEMINI_API_KEY not found.")
         
         self.model = model
+        # Tool-free client for the message writer and the outreach planner; it lives
+        # on the shared background loop, so one instance serves every call
+        self.model_client = create_model_client(self.api_key, self.model)
+        # The agent sees compacted tool output; full results stay in self.results
+        self.results = ToolResultStore()
         self.tools = [
-            search_geo_location,
-            search_jobs,
-            get_company_details,
-            search_hiring_managers,
-            fetch_profile_details,
-            check_connection_status,
-            send_connection_request
+            compact_tool(tool, self.results)
+            for tool in (
+                search_geo_location,
+                search_jobs,
+                search_jobs_all,
+                get_company_details,
+                get_company_details_batch,
+                search_hiring_managers,
+                fetch_profile_details,
+                enrich_profiles,
+                check_connection_status,
+                batch_check_connection_status,
+                send_connection_request,
+                make_fan_out_tool(self.results),
+                make_message_tool(self.results, self.model_client),
+                queue_connection_request,
+            )
         ]
         
+        # Indexes job search results straight from tool return values
         self.memory = MemoryManager()
+        self.results.subscribe(self.memory.record_tool_result)
+        # Earlier turns, summarized to a fixed token budget; IDs from tool results kept verbatim
+        self.conversation = ConversationContext()
+        self.results.subscribe(self.conversation.record_tool_result)
         self.assistant = create_assistant_agent(self.api_key, self.model, self.tools)
-        self.conversation_history = []
         print(f"✅ LinkedInAssistant initialized with {model}")
     
-    async def execute_async(self, command: str, context: Optional[str] = None) -> str:
-        """Execute command asynchronously with context management."""
-        if self.memory.should_reset_memory(command):
-            self.memory.reset_memory()
-
+    async def execute_stream(
+        self, command: str, context: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, str]]:
+        """Execute command, yielding progress events and finally a 'final' event."""
         memory_context = self.memory.build_memory_context(command)
-        full_prompt = f"{context or ''}\n{memory_context}\nUSER REQUEST: {command}"
+        conversation_context = self.conversation.render(extra=context)
+        full_prompt = f"{conversation_context}\n{memory_context}\nUSER REQUEST: {command}"
+        prompt_tokens = completion_tokens = 0
+        # Earlier commands reach the model only through the budgeted context above,
+        # not as the agent's ever-growing message history
+        await self.assistant.on_reset(CancellationToken())
         
-        max_turns = 8
+        # One run already loops model → (parallel) tools → model until the model
+        # replies; another run is only needed if it used up its tool rounds
+        max_turns = 3
         current_turn = 0
         
         while current_turn < max_turns:
             try:
-                result = await self.assistant.run(task=full_prompt)
-                response_text = clean_response(result)
-                self.memory.extract_job_results(response_text)
+                result = None
+                tool_results = ToolResultCollector(self.results)
+                async for item in self.assistant.run_stream(task=full_prompt):
+                    if isinstance(item, TaskResult):
+                        result = item
+                        continue
+                    tool_results.observe(item)
+                    if (event := to_progress_event(item)) is not None:
+                        yield event
+
+                for message in result.messages if result else ():
+                    if message.models_usage:
+                        prompt_tokens += message.models_usage.prompt_tokens
+                        completion_tokens += message.models_usage.completion_tokens
 
-                if is_raw_output(response_text):
-                    instruction = get_continuation_instruction(response_text)
-                    full_prompt = f"TOOL OUTPUT: {response_text}\n\nNEXT STEP: {instruction}"
-                    current_turn += 1
-                    continue
+                if ends_with_tool_output(result):
+                    # Results we can render directly don't need another model turn
+                    response_text = format_tool_results(tool_results.results, command)
+                    if response_text is None:
+                        # The results are already in the agent's context; don't send them twice
+                        instruction = get_continuation_instruction(tool_results.results)
+                        full_prompt = f"NEXT STEP: {instruction}"
+                        current_turn += 1
+                        continue
+                else:
+                    response_text = clean_response(result)
                 
-                self.conversation_history.append({"role": "user", "content": command})
-                self.conversation_history.append({"role": "assistant", "content": response_text})
-                return response_text
+                self.conversation.record_turn(command, response_text, prompt_tokens, completion_tokens)
+                yield {"type": "final", "content": response_text}
+                return
                 
             except Exception as e:
-                return f"❌ Error: {str(e)}"
+                yield {"type": "final", "content": f"❌ Error: {str(e)}"}
+                return
         
-        return "⚠️ Stopped after max turns."
+        yield {"type": "final", "content": "⚠️ Stopped after max turns."}
+
+    async def execute_async(self, command: str, context: Optional[str] = None) -> str:
+        """Execute command asynchronously with context management."""
+        response_text = ""
+        async for event in self.execute_stream(command, context):
+            if event["type"] == "final":
+                response_text = event["content"]
+        return response_text
 
     def execute_command(self, command: str, context: Optional[str] = None) -> str:
-        """Execute command synchronously."""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                return loop.create_task(self.execute_async(command, context))
-            else:
-                return loop.run_until_complete(self.execute_async(command, context))
-        except RuntimeError:
-            return asyncio.run(self.execute_async(command, context))
+        """Execute command synchronously on the shared background loop."""
+        return run_sync(self.execute_async(command, context))
+
+    def stream_command(
+        self, command: str, context: Optional[str] = None
+    ) -> Iterator[Dict[str, str]]:
+        """Execute command synchronously, yielding progress events as they arrive."""
+        return iterate_async(lambda: self.execute_stream(command, context))
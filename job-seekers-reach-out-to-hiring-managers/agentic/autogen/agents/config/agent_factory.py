@@ -1,10 +1,14 @@
 """Factory for creating AutoGen AssistantAgent with Gemini model."""
-from typing import List, Callable
+import os
+from typing import List, Callable, Optional
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_core.models import ModelInfo
 
+# Model → tools → model rounds one agent run may take before handing back
+MAX_TOOL_ITERATIONS = int(os.getenv("AGENT_MAX_TOOL_ITERATIONS", "6"))
+
 
 def get_system_prompt() -> str:
     """Returns the system prompt for the LinkedIn assistant."""
@@ -12,13 +16,22 @@ def get_system_prompt() -> str:
 
 ### 🧠 INTELLIGENT RULES
 1. **JOB LISTING:** If the user asks for N jobs, **LIST ALL N JOBS**. Do not summarize "Top 3". Show the full table/list with Job IDs.
+   - For MORE than 25 jobs, call `search_jobs_all` ONCE with the full count instead of paging `search_jobs`.
+   - Jobs marked `processed` were already handled in an earlier session. When the user asks for NEW jobs (or repeats a search), pass `skip_processed=True`.
 2. **MANAGER SEARCH:** Always call `search_hiring_managers` with `count=10` to see all options.
+   - For SEVERAL jobs from the last search, call `find_hiring_managers_for_jobs` ONCE (pass `job_ids`, or none for all jobs) instead of one search per job.
 3. **ONE-SHOT CONNECT:** If the user says "Connect":
    - **Step A:** Find managers.
-   - **Step B:** **AUTO-SELECT** the SINGLE best match (e.g. 'Engineering Manager' for 'Software Engineer').
-   - **Step C:** Send the connection request IMMEDIATELY.
+   - **Step B:** **AUTO-SELECT** the `recommended` manager from the result. Only if the result lists `tied` candidates, pick the best of those yourself.
+   - **Step C:** Send the connection request IMMEDIATELY, passing the `job_id` it is about.
 
 4. **MEMORY:** Check 'HIDDEN DATA' for `companyId` when Job ID is mentioned.
+5. **COMPANIES:** To look up several companies, call `get_company_details_batch` ONCE with all their IDs.
+6. **MESSAGES:** To connect with SEVERAL managers, call `write_connection_messages` ONCE with all their profile IDs, then send or queue each request with its message. Contact each manager only once, even if they fit several jobs.
+7. **QUEUE:** If the user asks to QUEUE outreach (or to contact many managers), call `queue_connection_request` for each (with its `job_id`) instead of sending now. The queue paces sending and skips duplicates.
+8. **STATUS CHECKS:** To vet several managers, call `batch_check_connection_status` ONCE with all their profile IDs. Use `check_connection_status` only for a single profile.
+9. **PARALLEL CALLS:** Lookups that don't depend on each other (e.g. managers at different companies) go in the SAME turn as multiple tool calls. They run at the same time and you get all results together.
+10. **PROFILES:** To get details for several profiles (e.g. a shortlist of managers), call `enrich_profiles` ONCE with all their profile IDs or URLs. Use `fetch_profile_details` only for a single profile.
 
 ### 📋 OUTPUT FORMATTING
 - **Jobs:** Title | Company | Location | **Job ID** (Bold the ID)
@@ -26,13 +39,19 @@ def get_system_prompt() -> str:
 """
 
 
-def create_assistant_agent(
+def create_model_client(
     api_key: str,
     model: str,
-    tools: List[Callable]
-) -> AssistantAgent:
-    """Creates and returns an AssistantAgent configured for LinkedIn tasks."""
-    model_client = OpenAIChatCompletionClient(
+    parallel_tool_calls: Optional[bool] = None,
+) -> OpenAIChatCompletionClient:
+    """
+    Creates the Gemini chat client (OpenAI-compatible endpoint).
+
+    `parallel_tool_calls` is only sent when given; requests without tools
+    (the pipelines' planning calls) must leave it out.
+    """
+    create_args = {} if parallel_tool_calls is None else {"parallel_tool_calls": parallel_tool_calls}
+    return OpenAIChatCompletionClient(
         model=model,
         api_key=api_key,
         base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
@@ -43,11 +62,32 @@ def create_assistant_agent(
             family="gemini",
             structured_output=False,
         ),
+        **create_args,
     )
-    
+
+
+def create_assistant_agent(
+    api_key: str,
+    model: str,
+    tools: List[Callable]
+) -> AssistantAgent:
+    """
+    Creates and returns an AssistantAgent configured for LinkedIn tasks.
+
+    The model may request several tools in one turn; the agent runs them
+    concurrently and sends all results back in one message. One run loops
+    through up to MAX_TOOL_ITERATIONS such rounds until the model replies
+    in text, so multi-step commands don't need a new run per tool result.
+    """
+    model_client = create_model_client(api_key, model, parallel_tool_calls=True)
+
     return AssistantAgent(
         name="linkedin_assistant",
         model_client=model_client,
         tools=tools,
         system_message=get_system_prompt(),
+        model_client_stream=True,
+        max_tool_iterations=MAX_TOOL_ITERATIONS,
+        # The model's own next turn summarizes results; a separate reflection call would repeat it
+        reflect_on_tool_use=False,
     )
@@ -0,0 +1,49 @@
+"""Bridge between the synchronous Streamlit script and AutoGen's async API."""
+import asyncio
+import queue
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+from tools.http_client import background_loop
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def iterate_async(make_stream: Callable[[], AsyncIterator[T]]) -> Iterator[T]:
+    """
+    Consume an async iterator from synchronous code, yielding items as they arrive.
+
+    The iterator runs on the process-wide background loop, the same one the tools'
+    HTTP client and the model clients live on, so they stay warm across Streamlit
+    reruns and sessions. Closing the returned generator early (for example when
+    Streamlit reruns the script) cancels the run.
+    """
+    items: "queue.Queue" = queue.Queue()
+
+    async def pump():
+        try:
+            async for item in make_stream():
+                items.put(item)
+        except Exception as e:
+            items.put(_Failure(e))
+        finally:
+            items.put(_DONE)
+
+    future = asyncio.run_coroutine_threadsafe(pump(), background_loop())
+
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        future.cancel()
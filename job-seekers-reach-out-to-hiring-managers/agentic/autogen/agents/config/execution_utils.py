@@ -1,18 +1,14 @@
 """Execution utilities for assistant command processing."""
+from typing import List
 
+from .tool_results import ToolResult
 
-def is_raw_output(response_text: str) -> bool:
-    """Checks if response is raw tool output that needs processing."""
-    return (
-        "{'success': True" in response_text or 
-        "'location_id':" in response_text or 
-        "'jobId':" in response_text or
-        "'people': [" in response_text
-    )
 
-
-def get_continuation_instruction(response_text: str) -> str:
-    """Gets continuation instruction based on response type."""
-    if "'people': [" in response_text:
+def get_continuation_instruction(results: List[ToolResult]) -> str:
+    """Gets continuation instruction based on the tool results the run stopped at."""
+    last = results[-1] if results else None
+    if last and last.name in ("search_hiring_managers", "find_hiring_managers_for_jobs"):
         return "I have the list. If user said CONNECT, pick the best one and send request. If user said FIND, list ALL of them."
+    if last and not last.succeeded:
+        return "The tool returned an error. Explain it to the user and suggest what to try next."
     return "Continue logic."
@@ -1,42 +1,106 @@
 """Memory management for job search results and context."""
-import ast
-from typing import List, Dict
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+from tools.get_company_details_batch_tool import job_company_id
+
+# LinkedIn job IDs are long numbers; anything shorter in a command is a count or an ordinal
+JOB_ID_PATTERN = re.compile(r"\b\d{6,}\b")
+
+JOB_SEARCH_TOOLS = ("search_jobs", "search_jobs_all")
 
 
 class MemoryManager:
-    """Manages job search results and context memory."""
-    
-    def __init__(self):
-        self.last_search_results: List[Dict] = []
-    
-    def should_reset_memory(self, command: str) -> bool:
-        """Determines if memory should be reset based on command."""
-        lower_cmd = command.lower()
-        return "find" in lower_cmd and "job" in lower_cmd and "id" not in lower_cmd
-    
+    """
+    Indexes jobs from search_jobs / search_jobs_all tool results by jobId and companyId.
+
+    Fed straight from tool return values (see `record_tool_result`), so it never
+    depends on how the model formatted its reply. The last `max_searches`
+    searches are kept; older ones are evicted least-recently-used first.
+    """
+
+    def __init__(self, max_searches: int = 5):
+        self.max_searches = max_searches
+        self._searches: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._by_company: Dict[str, Set[str]] = {}
+        # jobId -> keys of the searches that returned it
+        self._holders: Dict[str, Set[str]] = {}
+
+    def record_tool_result(self, tool_name: str, arguments: Dict[str, Any], result: Any) -> None:
+        """ToolResultStore listener: index every successful job search."""
+        if tool_name not in JOB_SEARCH_TOOLS or not isinstance(result, dict) or not result.get("success"):
+            return
+        key = repr((tool_name, sorted(arguments.items())))
+        if key in self._searches:
+            self._forget(key)
+        job_ids = []
+        for job in result.get("jobs") or []:
+            job_id = job.get("jobId") or job.get("id")
+            if job_id:
+                job_ids.append(self._add_job(key, str(job_id), job))
+        self._searches[key] = job_ids
+        while len(self._searches) > self.max_searches:
+            self._forget(next(iter(self._searches)))
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a remembered job by ID."""
+        job = self._jobs.get(str(job_id))
+        if job is not None:
+            self._touch(str(job_id))
+        return job
+
+    def jobs_for_company(self, company_id: str) -> List[Dict[str, Any]]:
+        """Return every remembered job at a company."""
+        return [self._jobs[job_id] for job_id in self._by_company.get(str(company_id), ())]
+
     def reset_memory(self):
         """Clears stored job search results."""
-        self.last_search_results = []
-    
+        self._searches.clear()
+        self._jobs.clear()
+        self._by_company.clear()
+        self._holders.clear()
+
     def build_memory_context(self, command: str) -> str:
-        """Builds memory context string from stored job results."""
+        """Builds memory context string for the job IDs mentioned in the command."""
         memory_context = ""
-        if self.last_search_results:
-            for job in self.last_search_results:
-                if str(job.get('jobId')) in command:
-                    memory_context += f"\n💡 DATA FOUND for Job ID {job.get('jobId')}:\n"
-                    memory_context += f"   - Company: {job.get('companyName')}\n"
-                    memory_context += f"   - Company ID: {job.get('companyId')} <--- REQUIRED\n"
-                    memory_context += f"   - Job Title: {job.get('title')}\n"
+        for job_id in dict.fromkeys(JOB_ID_PATTERN.findall(command)):
+            job = self.get_job(job_id)
+            if job is None:
+                continue
+            memory_context += f"\n💡 DATA FOUND for Job ID {job_id}:\n"
+            memory_context += f"   - Company: {job.get('companyName')}\n"
+            memory_context += f"   - Company ID: {job_company_id(job)} <--- REQUIRED\n"
+            memory_context += f"   - Job Title: {job.get('title')}\n"
         return memory_context
-    
-    def extract_job_results(self, response_text: str):
-        """Extracts and stores job results from response text."""
-        if '"jobs": [{' in response_text or "'jobs': [{" in response_text:
-            try:
-                start = response_text.find("[{")
-                end = response_text.rfind("}]") + 2
-                if start != -1:
-                    self.last_search_results = ast.literal_eval(response_text[start:end])
-            except Exception:
-                pass
+
+    def _add_job(self, search_key: str, job_id: str, job: Dict[str, Any]) -> str:
+        self._jobs[job_id] = job
+        self._holders.setdefault(job_id, set()).add(search_key)
+        company_id = job_company_id(job)
+        if company_id:
+            self._by_company.setdefault(company_id, set()).add(job_id)
+        return job_id
+
+    def _forget(self, search_key: str) -> None:
+        """Drop a search, and every job no other remembered search still holds."""
+        for job_id in self._searches.pop(search_key):
+            holders = self._holders.get(job_id)
+            if holders is None:
+                continue
+            holders.discard(search_key)
+            if holders:
+                continue
+            del self._holders[job_id]
+            job = self._jobs.pop(job_id)
+            company_jobs = self._by_company.get(job_company_id(job) or "")
+            if company_jobs is not None:
+                company_jobs.discard(job_id)
+                if not company_jobs:
+                    del self._by_company[job_company_id(job)]
+
+    def _touch(self, job_id: str) -> None:
+        """Mark the searches holding a job as recently used."""
+        for key in self._holders.get(job_id, ()):
+            self._searches.move_to_end(key)
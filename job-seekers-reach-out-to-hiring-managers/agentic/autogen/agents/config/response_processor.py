@@ -1,6 +1,9 @@
 """Response processing and formatting utilities."""
-import ast
-from typing import Any
+from typing import Any, List, Optional
+
+from autogen_agentchat.messages import ToolCallSummaryMessage
+
+from .tool_results import ToolResult
 
 
 def extract_text_from_result(result: Any) -> str:
@@ -29,9 +32,13 @@ def format_connection_success(data: dict) -> str:
     profile_id = data.get('profileId', 'Unknown')
     msg_sent = data.get('customMessage', 'No custom message.')
     url = f"https://www.linkedin.com/in/{profile_id}"
+    if data.get('status') == 'unverified':
+        headline = f"⏳ **Connection request to {profile_id} timed out and is being verified**"
+    else:
+        headline = f"✅ **Connection request sent successfully to {profile_id}**"
     
     return (
-        f"✅ **Connection request sent successfully to {profile_id}**\n\n"
+        f"{headline}\n\n"
         f"📝 **Invitation Message:**\n_{msg_sent}_\n\n"
         f"🔗 **Profile URL:**\n[{url}]({url})"
     )
@@ -47,20 +54,28 @@ def format_hiring_managers(data: dict) -> str:
     return out
 
 
-def clean_response(result: Any) -> str:
-    """Cleans and formats AutoGen response for display."""
-    text_response = extract_text_from_result(result)
-    cleaned = text_response.strip()
+def ends_with_tool_output(result: Any) -> bool:
+    """True when the run stopped at raw tool output instead of a written reply."""
+    messages = getattr(result, "messages", None) or []
+    return bool(messages) and isinstance(messages[-1], ToolCallSummaryMessage)
 
-    if cleaned.startswith("{") or cleaned.startswith("["):
-        try:
-            data = ast.literal_eval(cleaned)
-            if isinstance(data, dict):
-                if 'status' in data and 'sent' in str(data.get('status')):
-                    return format_connection_success(data)
-                if 'people' in data:
-                    return format_hiring_managers(data)
-        except Exception:
-            pass
-    
-    return text_response
+
+def format_tool_results(results: List[ToolResult], command: str) -> Optional[str]:
+    """Formats tool results that need no further model turn, else returns None."""
+    sent = [
+        r.value for r in results
+        if r.name == "send_connection_request" and r.succeeded and r.value.get("status") in ("sent", "unverified")
+    ]
+    if sent:
+        return "\n\n---\n\n".join(format_connection_success(data) for data in sent)
+
+    last = results[-1] if results else None
+    # A connect command still needs the model to pick a manager from the list
+    if last and last.name == "search_hiring_managers" and last.succeeded and "connect" not in command.lower():
+        return format_hiring_managers(last.value)
+    return None
+
+
+def clean_response(result: Any) -> str:
+    """Cleans AutoGen response text for display."""
+    return extract_text_from_result(result)
@@ -2,6 +2,9 @@
 AutoGen Client for Job Search and Hiring Manager Outreach
 """
 
+from typing import Any, Dict, Iterator
+
+from pipelines import OutreachRequest
 from workflows import JobSearchWorkflows
 
 
@@ -18,3 +21,37 @@ class JobSearchClient:
             "success": True,
             "result": result,
         }
+
+    def stream(self, command: str, context: str | None = None) -> Iterator[Dict[str, str]]:
+        """Execute a command, yielding progress events; the last has type 'final'."""
+        return self.workflows.stream_command(command, context)
+
+    def context_stats(self) -> Dict[str, Any]:
+        """Token counts of the carried-over context and of the last turn's prompt."""
+        conversation = self.workflows.assistant.conversation
+        last = conversation.last_stats
+        return {
+            "context_tokens": last.context_tokens if last else 0,
+            "prompt_tokens": last.prompt_tokens if last else None,
+            "budget": conversation.token_budget,
+        }
+
+    def stream_outreach(
+        self,
+        keywords: str,
+        location: str,
+        job_count: int = 5,
+        send: bool = True,
+        queue: bool = False,
+        new_jobs_only: bool = False,
+    ) -> Iterator[Dict[str, str]]:
+        """Run the full outreach sequence with one model call; the last event has type 'final'."""
+        request = OutreachRequest(
+            keywords=keywords,
+            location=location,
+            job_count=job_count,
+            send=send,
+            queue=queue,
+            new_jobs_only=new_jobs_only,
+        )
+        return self.workflows.stream_outreach(request)
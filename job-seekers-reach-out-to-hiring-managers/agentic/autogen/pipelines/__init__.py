@@ -0,0 +1,35 @@
+"""Deterministic multi-step flows that run without an LLM round-trip per step."""
+from .hiring_managers import fan_out_hiring_managers, make_fan_out_tool
+from .job_watch import JobWatcher, JsonlSink, SavedSearch, WatchState, load_saved_searches
+from .messages import MessageTarget, make_message_tool, write_messages
+from .outreach import OutreachPipeline, OutreachRequest, OutreachReport
+from .profile_enrichment import enrich_profiles
+from .outreach_queue import (
+    OutreachQueue,
+    OutreachWorker,
+    get_outreach_queue,
+    get_outreach_worker,
+    queue_connection_request,
+)
+
+__all__ = [
+    "fan_out_hiring_managers",
+    "make_fan_out_tool",
+    "JobWatcher",
+    "JsonlSink",
+    "SavedSearch",
+    "WatchState",
+    "load_saved_searches",
+    "MessageTarget",
+    "make_message_tool",
+    "write_messages",
+    "OutreachPipeline",
+    "OutreachRequest",
+    "OutreachReport",
+    "enrich_profiles",
+    "OutreachQueue",
+    "OutreachWorker",
+    "get_outreach_queue",
+    "get_outreach_worker",
+    "queue_connection_request",
+]
@@ -0,0 +1,146 @@
+"""Find hiring managers for every job in a search result with one concurrent fan-out."""
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from tools import search_hiring_managers, ToolResultStore
+from tools.get_company_details_batch_tool import job_company_id
+from tools.http_client import map_concurrently
+from tools.manager_ranker import rank_result
+from tools.search_hiring_managers_tool import manager_search_title
+
+MAX_CONCURRENCY = int(os.getenv("HIRING_MANAGER_CONCURRENCY", "5"))
+
+MANAGER_FIELDS = ["name", "headline", "profileId", "profileUrl", "score"]
+
+
+def job_id(job: Dict[str, Any]) -> Optional[str]:
+    """A job's ID, whichever key the API used."""
+    jid = job.get("jobId") or job.get("id")
+    return str(jid) if jid else None
+
+
+def job_company_name(job: Dict[str, Any]) -> Optional[str]:
+    """A job's company name, whether flat or nested under 'company'."""
+    company = job.get("company")
+    return job.get("companyName") or (company.get("name") if isinstance(company, dict) else None)
+
+
+async def fan_out_hiring_managers(
+    jobs: Union[Dict[str, Any], List[Dict[str, Any]]],
+    count: int = 5,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Search hiring managers for every job concurrently.
+
+    Jobs at the same company that need the same kind of manager share one
+    search, so a 25-job result usually costs a handful of API calls.
+
+    Args:
+        jobs: A full search_jobs result, or its list of jobs
+        count: Managers to return per company (max 10)
+        max_concurrency: Searches in flight at once (HIRING_MANAGER_CONCURRENCY, default 5)
+
+    Returns:
+        Dict with 'success', 'managers_by_job' (jobId -> managers, best first),
+        'picks_by_job' (jobId -> 'recommended' profile ID or 'tied' profile IDs),
+        'searches' (API calls made), 'failed' (companyId -> an error for each of its
+        title searches that failed) and 'skipped' (jobs without a company)
+    """
+    if isinstance(jobs, dict):
+        jobs = jobs.get("jobs") or []
+
+    # (companyId, manager keywords) -> the job title to search with and the jobs it serves
+    searches: Dict[tuple, Dict[str, Any]] = {}
+    skipped = []
+    for job in jobs:
+        jid, cid = job_id(job), job_company_id(job)
+        if not jid or not cid:
+            skipped.append(jid or job.get("title"))
+            continue
+        key = (cid, manager_search_title(job.get("title")))
+        searches.setdefault(key, {"title": job.get("title"), "jobs": []})["jobs"].append((jid, job.get("title")))
+
+    if not searches:
+        return {"success": False, "error": "No jobs with a company ID to search"}
+
+    async def run(key: tuple) -> Dict[str, Any]:
+        return await search_hiring_managers(key[0], searches[key]["title"], count)
+
+    managers_by_job: Dict[str, List[Dict[str, Any]]] = {}
+    picks_by_job: Dict[str, Dict[str, Any]] = {}
+    failed: Dict[str, List[str]] = {}
+    results = await map_concurrently(run, list(searches), max_concurrency)
+    for key, result in zip(searches, results):
+        if not result.get("success"):
+            # A company can have several title searches; keep every error
+            failed.setdefault(key[0], []).append(f"{searches[key]['title']}: {result.get('error')}")
+            continue
+        # One search can serve several titles; rank it for each job's own title
+        for jid, title in searches[key]["jobs"]:
+            ranked = rank_result(result, title)
+            managers_by_job[jid] = ranked.get("people", [])
+            picks_by_job[jid] = {k: ranked[k] for k in ("recommended", "tied") if k in ranked}
+
+    return {
+        "success": sum(map(len, failed.values())) < len(searches),
+        "managers_by_job": managers_by_job,
+        "picks_by_job": picks_by_job,
+        "searches": len(searches),
+        "failed": failed,
+        "skipped": skipped,
+    }
+
+
+def make_fan_out_tool(store: ToolResultStore) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """Build the agent tool that fans out over the last full search_jobs result in `store`."""
+
+    async def find_hiring_managers_for_jobs(
+        job_ids: Optional[List[str]] = None,
+        count: int = 3,
+    ) -> Dict[str, Any]:
+        """Find hiring managers for many jobs from the last search_jobs result in ONE call.
+
+        Args:
+            job_ids: Job IDs to cover (default: every job from the last search)
+            count: Managers per company (default 3, max 10)
+
+        Returns:
+            Dict with 'success' and 'jobs': one row per job with its title, company, managers
+            (best first) and either the 'recommended' manager or the 'tied' ones to choose from
+        """
+        last_search = store.latest_of("search_jobs", "search_jobs_all")
+        if not last_search or not last_search.get("jobs"):
+            return {"success": False, "error": "No job search results yet. Call search_jobs first."}
+
+        by_id = {job_id(job): job for job in last_search["jobs"]}
+        wanted = [str(jid) for jid in job_ids] if job_ids else list(by_id)
+        jobs = [by_id[jid] for jid in wanted if jid in by_id]
+        if not jobs:
+            return {"success": False, "error": f"Job IDs not in the last search: {wanted}"}
+
+        result = await fan_out_hiring_managers(jobs, count)
+        if "managers_by_job" not in result:
+            return result
+
+        rows = []
+        for job in jobs:
+            managers = result["managers_by_job"].get(job_id(job), [])
+            rows.append({
+                "jobId": job_id(job),
+                "title": job.get("title"),
+                "companyName": job_company_name(job),
+                "managers": [
+                    {field: m.get(field) for field in MANAGER_FIELDS if m.get(field) is not None}
+                    for m in managers
+                ],
+                **result["picks_by_job"].get(job_id(job), {}),
+            })
+        return {
+            "success": result["success"],
+            "jobs": rows,
+            "searches": result["searches"],
+            "failed": result["failed"],
+        }
+
+    return find_hiring_managers_for_jobs
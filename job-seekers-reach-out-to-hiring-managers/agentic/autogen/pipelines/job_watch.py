@@ -0,0 +1,294 @@
+"""Headless job watcher: run saved searches on a schedule and emit only the jobs each one hasn't returned before.
+
+Run it with `python -m pipelines.job_watch` (add `--once` for a single pass, e.g. from cron).
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from tools import search_geo_location
+from tools.cache.sqlite_cache import CACHE_DIR
+from tools.http_client import close_http_client
+from tools.search_jobs_tool import fetch_jobs_page
+from .hiring_managers import job_id
+
+WATCH_SEARCHES_PATH = os.getenv("JOB_WATCH_SEARCHES", os.path.join(CACHE_DIR, "saved_searches.json"))
+WATCH_OUTPUT_PATH = os.getenv("JOB_WATCH_OUTPUT", os.path.join(CACHE_DIR, "new_jobs.jsonl"))
+WATCH_DB_PATH = os.getenv("JOB_WATCH_DB", os.path.join(CACHE_DIR, "job_watch.db"))
+WATCH_INTERVAL_SECONDS = float(os.getenv("JOB_WATCH_INTERVAL", "3600"))
+MAX_CONCURRENCY = int(os.getenv("JOB_WATCH_CONCURRENCY", "4"))
+# Past-24-hours searches never return older jobs, so old rows only take up space
+RETENTION_DAYS = float(os.getenv("JOB_WATCH_RETENTION_DAYS", "30"))
+
+
+@dataclass
+class SavedSearch:
+    """One search to repeat: keywords in a location, newest postings only."""
+    keywords: str
+    location: str
+    count: int = 25
+    date_posted: str = "past-24-hours"
+    # Skips the geo lookup when known
+    location_id: Optional[str] = None
+    name: str = ""
+
+    @property
+    def key(self) -> str:
+        return self.name or f"{self.keywords.strip().lower()} @ {self.location.strip().lower()}"
+
+
+def load_saved_searches(path: str = WATCH_SEARCHES_PATH) -> List[SavedSearch]:
+    """
+    Read saved searches from a JSON file.
+
+    The file holds a list of objects with 'keywords' and 'location', and
+    optionally 'count', 'date_posted', 'location_id' and 'name'.
+    """
+    with open(path, encoding="utf-8") as f:
+        return [SavedSearch(**entry) for entry in json.load(f)]
+
+
+class WatchState:
+    """Job IDs each saved search has already returned, so a run can report only new ones."""
+
+    def __init__(self, db_path: str = WATCH_DB_PATH, retention_days: float = RETENTION_DAYS):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS watch_results (
+                    search_key TEXT NOT NULL, job_id TEXT NOT NULL, first_seen_at REAL NOT NULL,
+                    PRIMARY KEY (search_key, job_id))"""
+            )
+            db.execute(
+                "DELETE FROM watch_results WHERE first_seen_at < ?",
+                (time.time() - retention_days * 86400,),
+            )
+
+    def diff(self, search_key: str, job_ids: List[str]) -> Set[str]:
+        """Record a run's job IDs and return the ones this search hadn't returned before."""
+        if not job_ids:
+            return set()
+        placeholders = ", ".join("?" for _ in job_ids)
+        with self._connect() as db:
+            known = {
+                row[0]
+                for row in db.execute(
+                    f"SELECT job_id FROM watch_results WHERE search_key = ? AND job_id IN ({placeholders})",
+                    (search_key, *job_ids),
+                )
+            }
+            new = set(job_ids) - known
+            now = time.time()
+            db.executemany(
+                "INSERT OR IGNORE INTO watch_results (search_key, job_id, first_seen_at) VALUES (?, ?, ?)",
+                [(search_key, jid, now) for jid in new],
+            )
+        return new
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+
+class JsonlSink:
+    """Appends new-job records to a JSON Lines file, one job per line."""
+
+    def __init__(self, path: str = WATCH_OUTPUT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def __call__(self, records: List[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class JobWatcher:
+    """
+    Runs saved searches through `fetch_jobs_page` every `interval_seconds` and
+    hands the jobs each search hasn't returned before to `sink`.
+
+    Watched jobs stay out of the chat's seen-jobs store and trigger no
+    company lookups, so a search costs one API call per run.
+
+    Searches run concurrently, at most `max_concurrency` at a time; each
+    location is resolved once per run. A search's first run emits all its jobs.
+    """
+
+    def __init__(
+        self,
+        searches: List[SavedSearch],
+        sink: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        state: Optional[WatchState] = None,
+        interval_seconds: float = WATCH_INTERVAL_SECONDS,
+        max_concurrency: int = MAX_CONCURRENCY,
+        search: Callable[..., Awaitable[Dict[str, Any]]] = fetch_jobs_page,
+        geo: Callable[[str], Awaitable[Dict[str, Any]]] = search_geo_location,
+    ):
+        self.searches = searches
+        # Called with each search's new-job records, e.g. a JsonlSink or a queue's put
+        self.sink = sink or JsonlSink()
+        self.state = state or WatchState()
+        self.interval_seconds = interval_seconds
+        self.max_concurrency = max_concurrency
+        self.search = search
+        self.geo = geo
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    async def run_once(self) -> Dict[str, Any]:
+        """
+        Run every saved search once.
+
+        Returns:
+            Dict with 'searches' run, 'new_jobs' emitted and 'failed' (search key -> error)
+        """
+        failed: Dict[str, str] = {}
+        location_ids = await self._resolve_locations(failed)
+        slots = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def run(saved: SavedSearch) -> tuple:
+            try:
+                async with slots:
+                    return saved, await self.search(
+                        location_ids[saved.location_id or saved.location],
+                        saved.keywords,
+                        min(saved.count, 25),
+                        0,
+                        saved.date_posted,
+                    )
+            except Exception as e:
+                return saved, {"success": False, "error": str(e)}
+
+        new_jobs = 0
+        runs = [run(s) for s in self.searches if s.key not in failed]
+        # Emit each search's new jobs as soon as it finishes
+        for finished in asyncio.as_completed(runs):
+            saved, result = await finished
+            if not result.get("success"):
+                failed[saved.key] = result.get("error") or "Unknown error"
+                continue
+            new_jobs += self._emit(saved, result.get("jobs") or [])
+
+        if failed:
+            print(f"⚠️ {len(failed)} saved search(es) failed: {failed}")
+        return {"searches": len(self.searches), "new_jobs": new_jobs, "failed": failed}
+
+    def start(self) -> None:
+        """Run on a background thread until stop() is called."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=asyncio.run, args=(self._serve(),), name="job-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def run_forever(self) -> None:
+        """Run every `interval_seconds` (measured from the start of each run) until stopped."""
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                summary = await self.run_once()
+                print(f"👀 Job watch: {summary['new_jobs']} new job(s) from {summary['searches']} search(es)")
+            except Exception as e:
+                print(f"⚠️ Job watch run failed: {e}")
+            # Short sleeps so stop() takes effect within a second
+            next_run = started + self.interval_seconds
+            while not self._stop.is_set() and (remaining := next_run - time.monotonic()) > 0:
+                await asyncio.sleep(min(remaining, 1.0))
+
+    async def _serve(self) -> None:
+        """run_forever() on the watcher's own loop, closing that loop's HTTP client at the end."""
+        try:
+            await self.run_forever()
+        finally:
+            await close_http_client()
+
+    async def _resolve_locations(self, failed: Dict[str, str]) -> Dict[str, str]:
+        """Location (or given location_id) -> geo ID, one lookup per distinct location."""
+        location_ids: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        for saved in self.searches:
+            if saved.location_id:
+                location_ids[saved.location_id] = saved.location_id
+                continue
+            if saved.location not in location_ids and saved.location not in errors:
+                geo = await self.geo(saved.location)
+                if geo.get("success"):
+                    location_ids[saved.location] = geo["location_id"]
+                else:
+                    errors[saved.location] = geo.get("error") or f"Unknown location '{saved.location}'"
+            if saved.location in errors:
+                failed[saved.key] = errors[saved.location]
+        return location_ids
+
+    def _emit(self, saved: SavedSearch, jobs: List[Dict[str, Any]]) -> int:
+        by_id = {job_id(job): job for job in jobs if job_id(job)}
+        new = self.state.diff(saved.key, list(by_id))
+        if not new:
+            return 0
+        found_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.sink([
+            {
+                "search": saved.key,
+                "keywords": saved.keywords,
+                "location": saved.location,
+                "found_at": found_at,
+                "job": job,
+            }
+            for jid, job in by_id.items()
+            if jid in new
+        ])
+        return len(new)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description="Run saved LinkedIn job searches and record new jobs.")
+    parser.add_argument("--searches", default=WATCH_SEARCHES_PATH, help="JSON file of saved searches")
+    parser.add_argument("--output", default=WATCH_OUTPUT_PATH, help="JSON Lines file new jobs are appended to")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL_SECONDS, help="Seconds between runs")
+    parser.add_argument("--once", action="store_true", help="Run every search once and exit")
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    watcher = JobWatcher(load_saved_searches(args.searches), JsonlSink(args.output), interval_seconds=args.interval)
+    if args.once:
+        print(json.dumps(asyncio.run(_once(watcher)), indent=2))
+        return
+    try:
+        asyncio.run(watcher._serve())
+    except KeyboardInterrupt:
+        watcher.stop()
+
+
+async def _once(watcher: JobWatcher) -> Dict[str, Any]:
+    try:
+        return await watcher.run_once()
+    finally:
+        await close_http_client()
+
+
+if __name__ == "__main__":
+    main()
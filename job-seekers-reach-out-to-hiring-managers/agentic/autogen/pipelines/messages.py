@@ -0,0 +1,154 @@
+"""Personalize many connection messages with one model call."""
+import json
+import re
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from autogen_core.models import ChatCompletionClient, SystemMessage, UserMessage
+
+from tools import ToolResultStore
+from tools.message_templates import default_message, fit_message
+
+WRITER_PROMPT = """You write LinkedIn connection requests for a job seeker.
+For every person, write one short, specific message (under 280 characters) that greets
+them by first name and names the role and company. No placeholders, no sign-off.
+Reply with ONLY a JSON array: [{"profileId": "...", "message": "..."}]"""
+
+
+@dataclass
+class MessageTarget:
+    """One manager to write to, and the job the message is about."""
+    profile_id: str
+    name: str = ""
+    headline: str = ""
+    job_title: Optional[str] = None
+    company_name: Optional[str] = None
+
+
+async def write_messages(
+    model_client: ChatCompletionClient,
+    targets: List[MessageTarget],
+) -> Dict[str, str]:
+    """
+    Write a personalized message for every target in a single model call.
+
+    Targets the model skips, or all of them if the call fails, get the
+    template message instead, so every target always has a message.
+
+    Args:
+        model_client: Model client used for the call; it is not closed
+        targets: Managers to write to, with the job each message is about
+
+    Returns:
+        Dict mapping profile ID to a message within LinkedIn's 300-character limit
+    """
+    messages = {t.profile_id: _template(t) for t in targets}
+    if not targets:
+        return messages
+
+    brief = [
+        {"profileId": t.profile_id, **{k: v for k, v in asdict(t).items() if v and k != "profile_id"}}
+        for t in targets
+    ]
+    try:
+        result = await model_client.create([
+            SystemMessage(content=WRITER_PROMPT),
+            UserMessage(content=json.dumps(brief), source="user"),
+        ])
+    except Exception as e:
+        print(f"⚠️ Message personalization failed, using templates: {e}")
+        return messages
+
+    written = 0
+    for item in parse_json_array(result.content):
+        profile_id = str(item.get("profileId"))
+        message = str(item.get("message") or "").strip()
+        if profile_id in messages and message:
+            messages[profile_id] = fit_message(message)
+            written += 1
+    if written < len(targets):
+        print(f"⚠️ {len(targets) - written} of {len(targets)} messages fell back to the template")
+    return messages
+
+
+def make_message_tool(
+    store: ToolResultStore,
+    model_client: ChatCompletionClient,
+) -> Callable[..., Any]:
+    """Build the agent tool that writes messages for managers from earlier tool results in `store`."""
+
+    async def write_connection_messages(
+        profile_ids: List[str],
+        job_title: Optional[str] = None,
+        company_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Write personalized connection messages for MANY managers in ONE call.
+
+        Managers found by find_hiring_managers_for_jobs are matched to their own job;
+        for managers from search_hiring_managers, pass the job_title and company_name.
+
+        Args:
+            profile_ids: Profile IDs of the managers to write to
+            job_title: Job the messages are about (for managers from search_hiring_managers)
+            company_name: Company of that job
+
+        Returns:
+            Dict with 'success' and 'messages' (profileId -> message, max 300 characters)
+        """
+        targets = targets_from_results(store, profile_ids, job_title, company_name)
+        messages = await write_messages(model_client, targets)
+        return {"success": True, "messages": messages}
+
+    return write_connection_messages
+
+
+def targets_from_results(
+    store: ToolResultStore,
+    profile_ids: List[str],
+    job_title: Optional[str] = None,
+    company_name: Optional[str] = None,
+) -> List[MessageTarget]:
+    """Look up name, headline and job for each profile in the latest manager searches."""
+    known: Dict[str, MessageTarget] = {}
+    searched = store.latest("search_hiring_managers") or {}
+    for person in searched.get("people") or []:
+        known[person["profileId"]] = MessageTarget(
+            person["profileId"],
+            (person.get("name") or "").strip(),
+            person.get("headline") or "",
+            job_title,
+            company_name,
+        )
+    # Fan-out rows carry each manager's own job, so they take precedence
+    fanned_out = store.latest("find_hiring_managers_for_jobs") or {}
+    for row in fanned_out.get("jobs") or []:
+        for person in row.get("managers") or []:
+            known[person["profileId"]] = MessageTarget(
+                person["profileId"],
+                (person.get("name") or "").strip(),
+                person.get("headline") or "",
+                row.get("title"),
+                row.get("companyName"),
+            )
+    return [
+        known.get(str(pid)) or MessageTarget(str(pid), job_title=job_title, company_name=company_name)
+        for pid in dict.fromkeys(profile_ids)
+    ]
+
+
+def parse_json_array(content: Any) -> List[Dict[str, Any]]:
+    """Pull the JSON array out of a model reply, tolerating code fences and prose."""
+    text = content if isinstance(content, str) else str(content)
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if not match:
+        return []
+    try:
+        items = json.loads(match.group(0))
+    except ValueError:
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+
+def _template(target: MessageTarget) -> str:
+    first_name = target.name.split()[0] if target.name else None
+    return fit_message(default_message(first_name, target.job_title, target.company_name))
@@ -0,0 +1,336 @@
+"""Fixed geo → jobs → managers → status → connect outreach that calls the model once."""
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+
+from autogen_core.models import ChatCompletionClient, SystemMessage, UserMessage
+
+from tools import (
+    search_geo_location,
+    search_jobs,
+    batch_check_connection_status,
+    send_connection_request,
+    ToolResultStore,
+)
+from tools.invitation_verifier import verify_in_background
+from tools.manager_ranker import TIE_MARGIN
+from tools.message_templates import default_message, fit_message
+from .hiring_managers import fan_out_hiring_managers, job_id, job_company_name
+from .messages import parse_json_array
+from .outreach_queue import get_outreach_queue
+
+PLANNER_PROMPT = """You plan LinkedIn outreach for a job seeker.
+For a job with "candidates", pick the ONE candidate most likely to be the hiring manager for that role.
+A job with a "manager" is already decided; keep that person.
+For every job, write a short, specific connection message (under 280 characters) that names the role.
+Reply with ONLY a JSON array: [{"jobId": "...", "profileId": "...", "message": "..."}]
+Pick each profileId for at most one job; a person reached for one role isn't contacted again for another.
+Skip a job with "candidates" (leave it out) if none of them fits."""
+
+
+@dataclass
+class OutreachRequest:
+    """What to search for and how many people to contact."""
+    keywords: str
+    location: str
+    job_count: int = 5
+    candidates_per_company: int = 5
+    send: bool = True
+    # Hand requests to the paced outreach queue instead of sending them now
+    queue: bool = False
+    # Leave out jobs an earlier run already sent or queued a request for
+    new_jobs_only: bool = False
+
+
+@dataclass
+class Job:
+    job_id: str
+    title: str
+    company_name: str
+    company_id: Optional[str] = None
+
+
+@dataclass
+class Manager:
+    profile_id: str
+    name: str
+    headline: str = ""
+    profile_url: Optional[str] = None
+    score: float = 0.0
+
+
+@dataclass
+class Outreach:
+    """One job's outcome: who was chosen, what was written, and what happened."""
+    job: Job
+    manager: Optional[Manager] = None
+    message: str = ""
+    status: str = "skipped"  # sent | unverified | queued | planned | skipped | failed
+    detail: str = ""
+
+
+@dataclass
+class OutreachReport:
+    request: OutreachRequest
+    location_id: Optional[str] = None
+    outreach: List[Outreach] = field(default_factory=list)
+    model_calls: int = 0
+    # Set when the model step failed and the top-ranked managers were used instead
+    warning: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_markdown(self) -> str:
+        """Chat-ready summary of the run."""
+        if self.error:
+            return f"❌ Outreach stopped: {self.error}"
+        sent = sum(1 for o in self.outreach if o.status == "sent")
+        queued = sum(1 for o in self.outreach if o.status == "queued")
+        lines = [
+            f"### 🚀 Outreach: {self.request.keywords} in {self.request.location}",
+            f"{len(self.outreach)} jobs · {sent} requests sent · {queued} queued · {self.model_calls} model call(s)",
+            "",
+        ]
+        if self.warning:
+            lines.insert(2, f"⚠️ {self.warning}")
+        for o in self.outreach:
+            lines.append(f"- **{o.job.title}** at {o.job.company_name} (Job ID **{o.job.job_id}**)")
+            if o.manager:
+                url = o.manager.profile_url or f"https://www.linkedin.com/in/{o.manager.profile_id}"
+                lines.append(f"  - {o.status.upper()}: [{o.manager.name}]({url}) — {o.manager.headline}")
+                if o.message:
+                    lines.append(f"  - _{o.message}_")
+            else:
+                lines.append(f"  - {o.status.upper()}: {o.detail}")
+        return "\n".join(lines)
+
+
+class OutreachPipeline:
+    """
+    Runs the outreach tools directly, in order, and asks the model only to pick
+    managers and write messages, in a single call covering every job.
+    """
+
+    def __init__(
+        self,
+        model_client: ChatCompletionClient,
+        store: Optional[ToolResultStore] = None,
+    ):
+        # Shared with the caller and left open; the pipeline only makes requests on it
+        self.model_client = model_client
+        # Full results are recorded here so follow-up chat commands can use them
+        self.store = store
+
+    async def run(self, request: OutreachRequest) -> OutreachReport:
+        """Run the pipeline to completion and return its report."""
+        report = OutreachReport(request)
+        async for event in self.stream(request, report):
+            pass
+        return report
+
+    async def stream(
+        self, request: OutreachRequest, report: Optional[OutreachReport] = None
+    ) -> AsyncIterator[Dict[str, str]]:
+        """Run the pipeline, yielding progress events and finally a 'final' event."""
+        report = report or OutreachReport(request)
+        try:
+            async for event in self._steps(request, report):
+                yield event
+        except Exception as e:
+            report.error = str(e)
+        yield {"type": "final", "content": report.to_markdown()}
+
+    async def _steps(
+        self, request: OutreachRequest, report: OutreachReport
+    ) -> AsyncIterator[Dict[str, str]]:
+        yield {"type": "tool_call", "content": f"📍 Resolving location '{request.location}'"}
+        geo = await self._call(search_geo_location, keywords=request.location)
+        if not geo.get("location_id"):
+            raise RuntimeError(geo.get("error") or f"Unknown location '{request.location}'")
+        report.location_id = geo["location_id"]
+
+        yield {"type": "tool_call", "content": f"🔍 Searching {request.job_count} '{request.keywords}' jobs"}
+        jobs_result = await self._call(
+            search_jobs,
+            location_id=report.location_id,
+            keywords=request.keywords,
+            count=request.job_count,
+            skip_processed=request.new_jobs_only,
+        )
+        if not jobs_result.get("success"):
+            raise RuntimeError(jobs_result.get("error"))
+        raw_jobs = jobs_result.get("jobs", [])
+        skipped = jobs_result.get("skippedProcessed", 0)
+        if not raw_jobs:
+            raise RuntimeError("No new jobs found" if skipped else "No jobs found")
+        found = f"✅ {len(raw_jobs)} jobs found"
+        if skipped:
+            found += f" ({skipped} already handled, skipped)"
+        yield {"type": "tool_result", "content": found}
+
+        yield {"type": "tool_call", "content": "👤 Finding hiring managers for every job"}
+        fan_out = await fan_out_hiring_managers(raw_jobs, request.candidates_per_company)
+        managers_by_job = fan_out.get("managers_by_job", {})
+
+        profile_ids = list(dict.fromkeys(
+            m["profileId"] for people in managers_by_job.values() for m in people
+        ))
+        statuses: Dict[str, Any] = {}
+        if profile_ids:
+            yield {"type": "tool_call", "content": f"🔗 Checking {len(profile_ids)} connection statuses"}
+            checked = await self._call(batch_check_connection_status, profile_ids=profile_ids)
+            statuses = checked.get("statuses", {})
+
+        candidates: Dict[str, List[Manager]] = {}
+        for raw in raw_jobs:
+            job = Job(
+                job_id=job_id(raw),
+                title=raw.get("title", ""),
+                company_name=job_company_name(raw) or "",
+                company_id=raw.get("companyId"),
+            )
+            outreach = Outreach(job)
+            report.outreach.append(outreach)
+            eligible = [
+                Manager(
+                    m["profileId"], m.get("name", "").strip(), m.get("headline") or "",
+                    m.get("profileUrl"), m.get("score", 0.0),
+                )
+                for m in managers_by_job.get(job.job_id, [])
+                if _can_invite(statuses.get(m["profileId"]))
+            ]
+            if eligible:
+                # Managers arrive ranked; the model only chooses among a tied top
+                candidates[job.job_id] = [m for m in eligible if eligible[0].score - m.score < TIE_MARGIN]
+            else:
+                outreach.detail = "No managers found who aren't already connected or invited"
+        yield {"type": "tool_result", "content": f"✅ {len(candidates)} jobs have candidates"}
+
+        if not candidates:
+            return
+
+        yield {"type": "tool_call", "content": "🧠 Choosing managers and writing messages"}
+        plan = await self._plan(report, candidates)
+        report.model_calls += 1
+        if report.warning:
+            yield {"type": "tool_result", "content": f"⚠️ {report.warning}"}
+
+        timed_out: List[Outreach] = []
+        # Two jobs at one company can share a manager; contact each person once per run
+        picked: Set[str] = set()
+        for outreach in report.outreach:
+            choice = plan.get(outreach.job.job_id)
+            if choice is None:
+                if outreach.job.job_id in candidates:
+                    outreach.detail = "Model found no suitable manager"
+                continue
+            if choice[0].profile_id in picked:
+                outreach.detail = f"{choice[0].name or choice[0].profile_id} was already picked for another job"
+                continue
+            picked.add(choice[0].profile_id)
+            outreach.manager, outreach.message = choice
+            if not request.send:
+                outreach.status = "planned"
+                continue
+            if request.queue:
+                added = await asyncio.to_thread(
+                    get_outreach_queue().enqueue,
+                    outreach.manager.profile_id,
+                    outreach.message,
+                    outreach.job.job_id,
+                    "pipeline",
+                )
+                outreach.status = "queued"
+                outreach.detail = "" if added else "Already in the outreach queue"
+                continue
+
+            yield {"type": "tool_call", "content": f"📨 Connecting with {outreach.manager.name}"}
+            sent = await self._call(
+                send_connection_request,
+                profile_id=outreach.manager.profile_id,
+                custom_message=outreach.message,
+                job_id=outreach.job.job_id,
+            )
+            outreach.status = sent.get("status", "sent") if sent.get("success") else "failed"
+            outreach.detail = sent.get("message") or sent.get("error") or ""
+            if outreach.status == "unverified":
+                timed_out.append(outreach)
+
+        if timed_out:
+            # Timed-out sends are verified together, after every other request went out
+            yield {"type": "tool_call", "content": f"⏳ Verifying {len(timed_out)} timed-out request(s)"}
+            outcomes = await asyncio.gather(*(
+                asyncio.wrap_future(verify_in_background(o.manager.profile_id)) for o in timed_out
+            ))
+            for outreach, outcome in zip(timed_out, outcomes):
+                outreach.status = outcome
+                outreach.detail = "" if outcome != "unverified" else "Timed out; check LinkedIn before resending"
+
+    async def _plan(
+        self, report: OutreachReport, candidates: Dict[str, List[Manager]]
+    ) -> Dict[str, tuple]:
+        """
+        One model call: jobId -> (chosen manager, message).
+
+        A job with a single candidate is decided here; the model only writes
+        its message, and the template fills in if the model leaves it out.
+        If the call fails or its reply can't be read, every job gets its
+        top-ranked manager and the template message, and `report.warning` says so.
+        """
+        jobs = {o.job.job_id: o.job for o in report.outreach}
+        decided = {jid: managers[0] for jid, managers in candidates.items() if len(managers) == 1}
+        brief = []
+        for jid, managers in candidates.items():
+            people = [{"profileId": m.profile_id, "name": m.name, "headline": m.headline} for m in managers]
+            brief.append({
+                "jobId": jid,
+                "title": jobs[jid].title,
+                "company": jobs[jid].company_name,
+                **({"manager": people[0]} if jid in decided else {"candidates": people}),
+            })
+        try:
+            result = await self.model_client.create([
+                SystemMessage(content=PLANNER_PROMPT),
+                UserMessage(content=json.dumps(brief), source="user"),
+            ])
+            items = parse_json_array(result.content)
+            # An empty array is a valid "skip every job"; anything else unreadable is a failure
+            if not items and "[]" not in "".join(str(result.content).split()):
+                raise ValueError("reply had no JSON plan")
+        except Exception as e:
+            report.warning = f"Choosing managers failed ({e}); used the top-ranked managers and template messages"
+            items = [{"jobId": jid, "profileId": managers[0].profile_id} for jid, managers in candidates.items()]
+        replied = {str(item.get("jobId")) for item in items}
+        # Decided jobs the model left out still go ahead, with the template message
+        items += [{"jobId": jid} for jid in decided if jid not in replied]
+
+        plan = {}
+        for item in items:
+            jid = str(item.get("jobId"))
+            by_id = {m.profile_id: m for m in candidates.get(jid, [])}
+            manager = decided.get(jid) or by_id.get(str(item.get("profileId")))
+            if manager is None:
+                continue
+            message = str(item.get("message") or "").strip()
+            if not message:
+                first_name = manager.name.split()[0] if manager.name else None
+                message = default_message(first_name, jobs[jid].title, jobs[jid].company_name)
+            plan[jid] = (manager, fit_message(message))
+        return plan
+
+    async def _call(self, tool: Callable[..., Awaitable[Dict[str, Any]]], **kwargs: Any) -> Dict[str, Any]:
+        """Await a tool and record its full result."""
+        result = await tool(**kwargs)
+        if self.store is not None:
+            self.store.record(tool.__name__, kwargs, result)
+        return result
+
+
+def _can_invite(status: Optional[Dict[str, Any]]) -> bool:
+    """Only invite profiles whose status is known and who aren't connected or invited."""
+    return bool(
+        status
+        and status.get("success")
+        and not status.get("connected")
+        and not status.get("invitationSent")
+    )
@@ -1,10 +1,15 @@
 from .search_geo_location_tool import search_geo_location
 from .search_jobs_tool import search_jobs
+from .search_jobs_all_tool import search_jobs_all, iter_job_pages
 from .search_hiring_managers_tool import search_hiring_managers
 from .check_connection_status_tool import check_connection_status
+from .batch_check_connection_status_tool import batch_check_connection_status
 from .send_connection_request_tool import send_connection_request
 from .fetch_profile_details_tool import fetch_profile_details
 from .get_company_details_tool import get_company_details
+from .get_company_details_batch_tool import get_company_details_batch
+from .compaction import compact_tool
+from .result_store import ToolResultStore
 
 
 def get_linkedin_tools():
@@ -12,9 +17,12 @@ def get_linkedin_tools():
     return {
         "search_geo_location": search_geo_location,
         "search_jobs": search_jobs,
+        "search_jobs_all": search_jobs_all,
         "search_hiring_managers": search_hiring_managers,
         "check_connection_status": check_connection_status,
+        "batch_check_connection_status": batch_check_connection_status,
         "send_connection_request": send_connection_request,
         "fetch_profile_details": fetch_profile_details,
         "get_company_details": get_company_details,
+        "get_company_details_batch": get_company_details_batch,
     }
@@ -0,0 +1,39 @@
+import os
+from typing import Dict, Any, List
+
+from .cache import relationship_cache
+from .check_connection_status_tool import check_connection_status
+from .http_client import map_concurrently
+
+MAX_CONCURRENCY = int(os.getenv("CONNECTION_STATUS_CONCURRENCY", "5"))
+
+
+async def batch_check_connection_status(profile_ids: List[str]) -> Dict[str, Any]:
+    """
+    Check the connection status of many profiles at once.
+    Use this instead of repeated check_connection_status calls when vetting
+    a list of hiring managers before outreach.
+    """
+    # Dedupe while keeping the caller's order
+    unique_ids = list(dict.fromkeys(str(pid) for pid in profile_ids if pid))
+    if not unique_ids:
+        return {"success": False, "error": "No profile IDs given"}
+
+    # One cache query up front; only the misses go to the API
+    statuses = {
+        pid: {"success": True, **status, "profileId": pid, "cached": True}
+        for pid, status in relationship_cache.get_many(unique_ids).items()
+    }
+    missing = [pid for pid in unique_ids if pid not in statuses]
+    if missing:
+        checked = await map_concurrently(check_connection_status, missing, MAX_CONCURRENCY)
+        statuses.update(zip(missing, checked))
+    statuses = {pid: statuses[pid] for pid in unique_ids}
+
+    failed = [pid for pid, status in statuses.items() if not status.get("success")]
+    return {
+        "success": len(failed) < len(unique_ids),
+        "checked": len(unique_ids),
+        "failed": failed,
+        "statuses": statuses,
+    }
@@ -0,0 +1,16 @@
+from .sqlite_cache import SQLiteTTLCache
+from .relationship_cache import relationship_cache
+from .company_cache import company_cache
+from .geo_index import geo_index
+from .seen_jobs import seen_jobs, flag_seen_jobs
+from .profile_store import profile_store
+
+__all__ = [
+    "SQLiteTTLCache",
+    "relationship_cache",
+    "company_cache",
+    "geo_index",
+    "seen_jobs",
+    "flag_seen_jobs",
+    "profile_store",
+]
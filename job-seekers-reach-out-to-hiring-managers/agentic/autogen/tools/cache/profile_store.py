@@ -0,0 +1,89 @@
+"""Enriched LinkedIn profiles, keyed by profile ID (vanity name)."""
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional
+
+from .sqlite_cache import CACHE_DIR
+
+# A stored profile younger than this is reused instead of fetched again
+PROFILE_CACHE_TTL = float(os.getenv("PROFILE_CACHE_TTL", str(7 * 24 * 3600)))
+# Profiles not refreshed for this long are deleted
+PROFILE_RETENTION_DAYS = float(os.getenv("PROFILE_RETENTION_DAYS", "180"))
+
+
+class ProfileStore:
+    """
+    One row per profile ID: the full profile from the API and when it was fetched.
+
+    Unlike the TTL caches, rows outlive their freshness window, so enriched
+    shortlists stay readable; `max_age` decides what counts as fresh. Shares
+    cache.db in CONNECTSAFELY_CACHE_DIR with the other caches. Storage errors
+    are logged and treated as "not stored".
+    """
+
+    def __init__(self, db_path: Optional[str] = None, retention_days: float = PROFILE_RETENTION_DAYS):
+        self.db_path = db_path or os.path.join(CACHE_DIR, "cache.db")
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            with self._connect() as db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    """CREATE TABLE IF NOT EXISTS profiles (
+                        profile_id TEXT PRIMARY KEY, profile TEXT NOT NULL, fetched_at REAL NOT NULL)"""
+                )
+                db.execute(
+                    "DELETE FROM profiles WHERE fetched_at < ?",
+                    (time.time() - retention_days * 86400,),
+                )
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Profile store unavailable: {e}")
+
+    def get(self, profile_id: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return a stored profile, or None if missing or older than `max_age` seconds."""
+        return self.get_many([profile_id], max_age).get(str(profile_id))
+
+    def get_many(self, profile_ids: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Return the stored profiles among `profile_ids` in one query, optionally only fresh ones."""
+        profile_ids = [str(pid) for pid in profile_ids]
+        if not profile_ids:
+            return {}
+        oldest = time.time() - max_age if max_age is not None else 0
+        placeholders = ", ".join("?" for _ in profile_ids)
+        try:
+            with self._connect() as db:
+                rows = db.execute(
+                    f"SELECT profile_id, profile FROM profiles WHERE fetched_at >= ? "
+                    f"AND profile_id IN ({placeholders})",
+                    (oldest, *profile_ids),
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"⚠️ Profile store read failed: {e}")
+            return {}
+        return {profile_id: json.loads(profile) for profile_id, profile in rows}
+
+    def save_many(self, profiles: Dict[str, Dict[str, Any]]) -> None:
+        """Store freshly fetched profiles in one transaction, replacing older copies."""
+        now = time.time()
+        rows = [(str(pid), json.dumps(profile), now) for pid, profile in profiles.items()]
+        if not rows:
+            return
+        try:
+            with self._connect() as db:
+                db.executemany("INSERT OR REPLACE INTO profiles VALUES (?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"⚠️ Profile store write failed: {e}")
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+
+profile_store = ProfileStore()
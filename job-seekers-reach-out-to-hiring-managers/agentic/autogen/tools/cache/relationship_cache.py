@@ -0,0 +1,9 @@
+"""Short-lived cache of LinkedIn relationship status, keyed by profile ID."""
+import os
+
+from .sqlite_cache import SQLiteTTLCache
+
+# Relationship state changes when invitations are sent or accepted, so keep it short
+RELATIONSHIP_CACHE_TTL = float(os.getenv("RELATIONSHIP_CACHE_TTL", "300"))
+
+relationship_cache = SQLiteTTLCache("relationship", RELATIONSHIP_CACHE_TTL)
@@ -0,0 +1,101 @@
+"""Small SQLite key/value cache with per-entry expiry, shared by every app on the host."""
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional
+
+CACHE_DIR = os.getenv(
+    "CONNECTSAFELY_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".connectsafely")
+)
+
+
+class SQLiteTTLCache:
+    """
+    JSON values keyed by (namespace, key), each expiring after `ttl_seconds`.
+
+    The database lives in CONNECTSAFELY_CACHE_DIR (default ~/.connectsafely), so the
+    AutoGen and CrewAI apps on the same host share entries. Storage errors are
+    logged and treated as cache misses.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: float, db_path: Optional[str] = None):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path or os.path.join(CACHE_DIR, "cache.db")
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            with self._connect() as db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    """CREATE TABLE IF NOT EXISTS cache (
+                        namespace TEXT NOT NULL, key TEXT NOT NULL,
+                        value TEXT NOT NULL, expires_at REAL NOT NULL,
+                        PRIMARY KEY (namespace, key))"""
+                )
+                db.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND expires_at <= ?",
+                    (namespace, time.time()),
+                )
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Cache unavailable ({self.namespace}): {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        return self.get_many([key]).get(str(key))
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the fresh entries among `keys` in one query."""
+        keys = [str(key) for key in keys]
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        try:
+            with self._connect() as db:
+                rows = db.execute(
+                    f"SELECT key, value FROM cache WHERE namespace = ? AND expires_at > ? "
+                    f"AND key IN ({placeholders})",
+                    (self.namespace, time.time(), *keys),
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"⚠️ Cache read failed ({self.namespace}): {e}")
+            return {}
+        return {key: json.loads(value) for key, value in rows}
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, replacing any previous entry."""
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store several values in one transaction."""
+        expires_at = time.time() + self.ttl_seconds
+        rows = [
+            (self.namespace, str(key), json.dumps(value), expires_at)
+            for key, value in items.items()
+        ]
+        try:
+            with self._connect() as db:
+                db.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"⚠️ Cache write failed ({self.namespace}): {e}")
+
+    def delete(self, key: str) -> None:
+        """Drop an entry so the next read goes to the API."""
+        try:
+            with self._connect() as db:
+                db.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, str(key)),
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️ Cache delete failed ({self.namespace}): {e}")
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
@@ -1,13 +1,31 @@
 import os
-import requests
 from typing import Dict, Any
 
-def check_connection_status(profile_id: str) -> Dict[str, Any]:
+from .cache import relationship_cache
+from .http_client import auth_headers, get_http_client
+
+async def check_connection_status(profile_id: str) -> Dict[str, Any]:
     """
     Step 5: Check Connection Status.
     Matches TypeScript 'checkConnectionStatus' logic.
     Used to prevent sending duplicate connection requests.
     """
+    cached = relationship_cache.get(profile_id)
+    if cached is not None:
+        return {"success": True, **cached, "profileId": profile_id, "cached": True}
+
+    result = await fetch_relationship_status(profile_id)
+    if result.get("success"):
+        relationship_cache.set(profile_id, {
+            "connected": result["connected"],
+            "invitationSent": result["invitationSent"],
+            "invitationReceived": result["invitationReceived"],
+        })
+    return result
+
+
+async def fetch_relationship_status(profile_id: str, timeout: int = 30) -> Dict[str, Any]:
+    """Fetch the relationship status from the API, bypassing the cache."""
     api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
     if not api_token:
         return {
@@ -16,19 +34,15 @@ def check_connection_status(profile_id: str) -> Dict[str, Any]:
         }
 
     # Ensure we use the clean vanity name if possible, though the function signature expects it
-    endpoint = f"https://api.connectsafely.ai/linkedin/relationship/{profile_id}"
 
     try:
-        response = requests.get(
-            endpoint,
-            headers={
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=30,
+        response = await get_http_client().get(
+            f"/relationship/{profile_id}",
+            headers=auth_headers(api_token),
+            timeout=timeout,
         )
 
-        if not response.ok:
+        if not response.is_success:
             return {
                 "success": False,
                 "error": f"API Error {response.status_code}: {response.text}",
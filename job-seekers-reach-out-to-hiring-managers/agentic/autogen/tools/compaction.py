@@ -0,0 +1,102 @@
+"""Token-aware compaction of tool results before they reach the model."""
+import functools
+import inspect
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from .result_store import ToolResultStore
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv("TOOL_OUTPUT_TOKEN_BUDGET", "1200"))
+
+# Tool name -> (list key in the result, fields the model needs from each row)
+COMPACTION_SPECS = {
+    "search_geo_location": ("all_locations", ["name", "geoId", "id"]),
+    "search_jobs": (
+        "jobs",
+        ["jobId", "id", "title", "companyName", "companyId", "company", "location", "seenBefore", "processed"],
+    ),
+    "search_jobs_all": (
+        "jobs",
+        ["jobId", "id", "title", "companyName", "companyId", "company", "location", "seenBefore", "processed"],
+    ),
+    "search_hiring_managers": ("people", ["name", "headline", "profileId", "profileUrl", "score"]),
+    "find_hiring_managers_for_jobs": ("jobs", ["jobId", "title", "companyName", "managers", "recommended", "tied"]),
+    "enrich_profiles": ("profiles", ["profileId", "firstName", "lastName", "headline", "location"]),
+}
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count (~4 characters per token) of a value as the model sees it."""
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return len(text) // 4 + 1
+
+
+def compact_result(
+    result: Any,
+    list_key: str,
+    fields: List[str],
+    max_tokens: int = DEFAULT_TOKEN_BUDGET,
+) -> Any:
+    """
+    Project a tool result down to its key fields and as many rows as fit the budget.
+
+    Scalars such as 'success' or 'total' are kept as-is. When rows are dropped,
+    a 'compaction' entry tells the model how many were shown out of how many.
+    """
+    if not isinstance(result, dict) or not isinstance(result.get(list_key), list):
+        return result
+
+    rows = [
+        {field: row[field] for field in fields if row.get(field) not in (None, "")}
+        for row in result[list_key]
+        if isinstance(row, dict)
+    ]
+    compact = {key: value for key, value in result.items() if key != list_key}
+    shown = len(rows)
+    compact[list_key] = rows
+
+    while shown > 1 and estimate_tokens(compact) > max_tokens:
+        shown = max(1, min(shown - 1, shown * max_tokens // estimate_tokens(compact)))
+        compact[list_key] = rows[:shown]
+
+    if shown < len(rows):
+        compact["compaction"] = {"shown": shown, "total": len(rows)}
+    return compact
+
+
+def compact_tool(
+    func: Callable,
+    store: Optional[ToolResultStore] = None,
+    max_tokens: Optional[int] = None,
+) -> Callable:
+    """
+    Wrap a tool so the agent receives a compacted result.
+
+    The full result is recorded in `store` (when given) so code can still use it.
+    The wrapper keeps the tool's name, docstring and signature for AutoGen.
+    """
+    spec = COMPACTION_SPECS.get(func.__name__)
+    budget = max_tokens or DEFAULT_TOKEN_BUDGET
+    if store is not None:
+        store.register(func)
+
+    def finish(kwargs: Dict[str, Any], result: Any) -> Any:
+        if store is not None:
+            store.record(func.__name__, kwargs, result)
+        if spec is None:
+            return result
+        return compact_result(result, spec[0], spec[1], budget)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(**kwargs):
+            return finish(kwargs, await func(**kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(**kwargs):
+        return finish(kwargs, func(**kwargs))
+
+    return wrapper
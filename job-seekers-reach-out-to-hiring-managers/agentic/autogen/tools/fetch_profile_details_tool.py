@@ -1,8 +1,11 @@
 import os
-import requests
 import re
 from typing import Dict, Any
 
+from .cache import profile_store
+from .cache.profile_store import PROFILE_CACHE_TTL
+from .http_client import auth_headers, get_http_client
+
 def extract_profile_id_from_url(profile_input: str) -> str:
     """
     Helper: Extract vanity name from LinkedIn URL.
@@ -18,11 +21,26 @@ def extract_profile_id_from_url(profile_input: str) -> str:
     
     return profile_input
 
-def fetch_profile_details(profile_id: str) -> Dict[str, Any]:
+async def fetch_profile_details(profile_id: str) -> Dict[str, Any]:
     """
     Step 4: Fetch Profile Details.
     Matches TypeScript 'fetchProfileDetails' logic.
     """
+    # Ensure we are using the vanity name (clean ID), not a URL
+    clean_id = extract_profile_id_from_url(profile_id)
+
+    cached = profile_store.get(clean_id, max_age=PROFILE_CACHE_TTL)
+    if cached is not None:
+        return {"success": True, "profile": cached, "profileId": clean_id, "cached": True}
+
+    result = await fetch_profile(clean_id)
+    if result.get("success"):
+        profile_store.save_many({clean_id: result["profile"]})
+    return result
+
+
+async def fetch_profile(clean_id: str) -> Dict[str, Any]:
+    """Fetch a profile from the API by vanity name, bypassing the store."""
     api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
     if not api_token:
         return {
@@ -30,23 +48,15 @@ def fetch_profile_details(profile_id: str) -> Dict[str, Any]:
             "error": "CONNECTSAFELY_API_TOKEN not set in environment variables",
         }
 
-    # Ensure we are using the vanity name (clean ID), not a URL
-    clean_id = extract_profile_id_from_url(profile_id)
-    
-    endpoint = "https://api.connectsafely.ai/linkedin/profile"
-
     try:
-        response = requests.post(
-            endpoint,
-            headers={
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            },
+        response = await get_http_client().post(
+            "/profile",
+            headers=auth_headers(api_token),
             json={"profileId": clean_id},
             timeout=30,
         )
 
-        if not response.ok:
+        if not response.is_success:
             return {
                 "success": False,
                 "error": f"API Error {response.status_code}: {response.text}",
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import threading
+from typing import Dict, Any, Iterable, List, Optional
+
+from .cache import company_cache
+from .get_company_details_tool import get_company_details
+from .http_client import background_loop, map_concurrently
+
+MAX_CONCURRENCY = int(os.getenv("COMPANY_DETAILS_CONCURRENCY", "4"))
+
+# Pre-warming runs on the background loop so it outlives the search that started it;
+# in-flight IDs are fetched once
+_in_flight: set = set()
+_in_flight_lock = threading.Lock()
+_prewarm_slots: Optional[asyncio.Semaphore] = None
+
+
+async def get_company_details_batch(company_ids: List[str]) -> Dict[str, Any]:
+    """
+    Get details for many companies in one call.
+    Cached companies are served locally; the rest are fetched concurrently.
+    """
+    unique_ids = list(dict.fromkeys(str(cid) for cid in company_ids if cid))
+    if not unique_ids:
+        return {"success": False, "error": "No company IDs given"}
+
+    companies = company_cache.get_many(unique_ids)
+    missing = [cid for cid in unique_ids if cid not in companies]
+    failed = {}
+    if missing:
+        results = await map_concurrently(get_company_details, missing, MAX_CONCURRENCY)
+        for cid, result in zip(missing, results):
+            if result.get("success"):
+                companies[cid] = result["company"]
+            else:
+                failed[cid] = result.get("error")
+
+    return {
+        "success": len(failed) < len(unique_ids),
+        "companies": {cid: companies[cid] for cid in unique_ids if cid in companies},
+        "fromCache": len(unique_ids) - len(missing),
+        "failed": failed,
+    }
+
+
+def prewarm_company_cache(company_ids: Iterable[str]) -> None:
+    """Fetch uncached companies in the background so later lookups are local."""
+    unique_ids = list(dict.fromkeys(str(cid) for cid in company_ids if cid))
+    cached = company_cache.get_many(unique_ids)
+    with _in_flight_lock:
+        todo = [cid for cid in unique_ids if cid not in cached and cid not in _in_flight]
+        _in_flight.update(todo)
+    for cid in todo:
+        asyncio.run_coroutine_threadsafe(_prewarm_one(cid), background_loop())
+
+
+async def _prewarm_one(company_id: str) -> None:
+    global _prewarm_slots
+    if _prewarm_slots is None:
+        _prewarm_slots = asyncio.Semaphore(MAX_CONCURRENCY)
+    try:
+        async with _prewarm_slots:
+            await get_company_details(company_id)
+    finally:
+        with _in_flight_lock:
+            _in_flight.discard(company_id)
+
+
+def job_company_id(job: Dict[str, Any]) -> Optional[str]:
+    """A job's companyId, whether flat or nested under 'company'."""
+    company = job.get("company")
+    cid = job.get("companyId") or (company.get("id") if isinstance(company, dict) else None)
+    return str(cid) if cid else None
+
+
+def job_company_ids(jobs: List[Dict[str, Any]]) -> List[str]:
+    """companyId of each job that has one."""
+    return [cid for cid in map(job_company_id, jobs) if cid]
@@ -1,13 +1,27 @@
 import os
-import requests
 from typing import Dict, Any
 
-def get_company_details(company_id: str) -> Dict[str, Any]:
+from .cache import company_cache
+from .http_client import auth_headers, get_http_client
+
+async def get_company_details(company_id: str) -> Dict[str, Any]:
     """
     Step 2: Get Company Details.
     Matches TypeScript 'getCompanyDetails' logic.
     Useful for verifying the exact company name or getting more metadata.
     """
+    cached = company_cache.get(company_id)
+    if cached is not None:
+        return {"success": True, "company": cached, "company_id": company_id, "cached": True}
+
+    result = await fetch_company_details(company_id)
+    if result.get("success"):
+        company_cache.set(company_id, result["company"])
+    return result
+
+
+async def fetch_company_details(company_id: str) -> Dict[str, Any]:
+    """Fetch company details from the API, bypassing the cache."""
     api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
     if not api_token:
         return {
@@ -15,20 +29,15 @@ def get_company_details(company_id: str) -> Dict[str, Any]:
             "error": "CONNECTSAFELY_API_TOKEN not set in environment variables",
         }
 
-    endpoint = "https://api.connectsafely.ai/linkedin/search/companies/details"
-
     try:
-        response = requests.post(
-            endpoint,
-            headers={
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            },
+        response = await get_http_client().post(
+            "/search/companies/details",
+            headers=auth_headers(api_token),
             json={"companyId": company_id},
             timeout=30,
         )
 
-        if not response.ok:
+        if not response.is_success:
             return {
                 "success": False,
                 "error": f"API Error {response.status_code}: {response.text}",
@@ -0,0 +1,86 @@
+"""Shared async HTTP client for the ConnectSafely API, plus a background loop for synchronous callers."""
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Iterable, List, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+API_BASE_URL = "https://api.connectsafely.ai/linkedin"
+MAX_CONNECTIONS = int(os.getenv("CONNECTSAFELY_MAX_CONNECTIONS", "20"))
+DEFAULT_TIMEOUT = 30
+
+# httpx clients are bound to the loop they were first used on, so each loop gets its own
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_background: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The running loop's client, created on first use; every tool call on the loop shares its connection pool."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's client. Call it before a short-lived loop finishes."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def auth_headers(api_token: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_token}",
+        "Content-Type": "application/json",
+    }
+
+
+async def map_concurrently(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int,
+) -> List[R]:
+    """Await func(item) for every item, at most `max_concurrency` at a time, keeping the input order."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """One daemon event loop for work that must outlive the caller or comes from plain threads."""
+    global _background
+    with _background_lock:
+        if _background is None:
+            _background = asyncio.new_event_loop()
+            threading.Thread(target=_background.run_forever, name="connectsafely-io", daemon=True).start()
+        return _background
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a tool coroutine from synchronous code (a worker thread, not an event loop) and wait for it."""
+    loop = background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is not None:
+        coro.close()
+        raise RuntimeError("run_sync() would block the running event loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
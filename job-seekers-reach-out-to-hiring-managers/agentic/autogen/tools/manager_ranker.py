@@ -0,0 +1,175 @@
+"""Deterministic ranking of hiring-manager candidates for a job, without a model call."""
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .manager_titles import job_function, manager_titles
+
+# Headline words that place a person in a job function
+FUNCTION_KEYWORDS = {
+    "engineering": {"engineering", "engineer", "software", "platform", "infrastructure", "technology", "technical", "developer", "cto"},
+    "sales": {"sales", "revenue", "account", "accounts", "commercial"},
+    "marketing": {"marketing", "growth", "brand", "demand", "cmo"},
+    "product": {"product", "products", "cpo"},
+}
+RECRUITING_KEYWORDS = {"recruiter", "recruiting", "recruitment", "talent", "hiring", "acquisition"}
+
+# Line managers and directors usually own a hire; executives rarely answer requests
+SENIORITY = {
+    "manager": 3.0, "head": 3.0, "director": 3.0,
+    "vp": 2.0, "vice": 2.0, "svp": 1.5, "lead": 1.5,
+    "chief": 1.0, "cto": 1.0, "cpo": 1.0, "cmo": 1.0, "founder": 1.0, "cofounder": 1.0, "principal": 1.0,
+}
+DEMOTE = {"aspiring": -5.0, "intern": -5.0, "student": -5.0, "freelance": -1.0}
+# 'Former'/'ex' count against only right before a role: "Ex-VP Sales", not "Manager, ex-Google"
+PAST_ROLE_WORDS = {"former", "ex"}
+PAST_ROLE_PENALTY = -5.0
+_ROLE_WORDS = set(SENIORITY) | RECRUITING_KEYWORDS | set().union(*FUNCTION_KEYWORDS.values())
+
+FUNCTION_WEIGHT = 3.0
+RECRUITER_WEIGHT = 1.5
+TITLE_WEIGHT = 2.0
+OVERLAP_WEIGHT = 0.5
+MAX_OVERLAP = 3
+SECOND_DEGREE = {"S", "2nd", "DISTANCE_2", 2}
+SECOND_DEGREE_BONUS = 1.0
+
+# Top candidates closer than this are a tie the model has to break
+TIE_MARGIN = 1.0
+
+_WORD = re.compile(r"[a-z0-9]+")
+_GENERIC_TITLE_WORDS = {"senior", "sr", "junior", "jr", "staff", "i", "ii", "iii", "iv", "and", "of", "the", "remote", "hybrid"}
+
+
+@dataclass
+class RankedManager:
+    person: Dict[str, Any]
+    score: float
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def profile_id(self) -> Optional[str]:
+        return self.person.get("profileId") or self.person.get("publicIdentifier")
+
+
+class HeadlineIndex:
+    """Inverted index from headline word to the candidates whose headline contains it."""
+
+    def __init__(self, tokenized_headlines: Iterable[List[str]]):
+        self.postings: Dict[str, Set[int]] = {}
+        for position, headline in enumerate(tokenized_headlines):
+            for word in set(headline):
+                self.postings.setdefault(word, set()).add(position)
+
+    def matches(self, query: Iterable[str]) -> Dict[int, Set[str]]:
+        """Candidate position -> the query words its headline contains."""
+        hits: Dict[int, Set[str]] = {}
+        for word in query:
+            for position in self.postings.get(word, ()):
+                hits.setdefault(position, set()).add(word)
+        return hits
+
+
+def words(text: Optional[str]) -> List[str]:
+    return _WORD.findall((text or "").lower())
+
+
+def rank_managers(
+    people: List[Dict[str, Any]],
+    job_title: Optional[str],
+    top_k: Optional[int] = None,
+) -> List[RankedManager]:
+    """
+    Score every candidate for `job_title` and return them best first.
+
+    Scores add up function match (or recruiter), seniority, a mapped manager
+    title in the headline, job-title words in the headline and 2nd-degree
+    connection; 'intern' and the like, or 'former'/'ex' right before a role,
+    count against. Equal scores keep the search API's order.
+    """
+    headlines = [words(person.get("headline")) for person in people]
+    index = HeadlineIndex(headlines)
+    function = job_function(job_title)
+    # Without a known function, recruiters are the people who hire
+    function_words = FUNCTION_KEYWORDS.get(function, RECRUITING_KEYWORDS)
+    title_words = set(words(job_title)) - _GENERIC_TITLE_WORDS - set(SENIORITY)
+    phrases = [" ".join(words(title)) for title in manager_titles(job_title)]
+
+    by_function = index.matches(function_words)
+    by_recruiting = index.matches(RECRUITING_KEYWORDS)
+    by_seniority = index.matches(SENIORITY)
+    by_demotion = index.matches(DEMOTE)
+    by_past_role = index.matches(PAST_ROLE_WORDS)
+    by_title_words = index.matches(title_words)
+
+    ranked = []
+    for position, person in enumerate(people):
+        score, reasons = 0.0, []
+        if position in by_function:
+            score += FUNCTION_WEIGHT
+            reasons.append(function or "recruiter")
+        elif position in by_recruiting:
+            score += RECRUITER_WEIGHT
+            reasons.append("recruiter")
+        if position in by_seniority:
+            level = max(by_seniority[position], key=SENIORITY.__getitem__)
+            score += SENIORITY[level]
+            reasons.append(level)
+        demotions = {word: DEMOTE[word] for word in by_demotion.get(position, ())}
+        if position in by_past_role and _names_past_role(headlines[position]):
+            demotions["former"] = PAST_ROLE_PENALTY
+        if demotions:
+            score += min(demotions.values())
+            reasons.extend(sorted(demotions))
+        padded = f" {' '.join(headlines[position])} "
+        title = next((phrase for phrase in phrases if f" {phrase} " in padded), None)
+        if title:
+            score += TITLE_WEIGHT
+            reasons.append(title)
+        overlap = by_title_words.get(position, set())
+        if overlap:
+            score += OVERLAP_WEIGHT * min(len(overlap), MAX_OVERLAP)
+        if person.get("connectionDegree") in SECOND_DEGREE:
+            score += SECOND_DEGREE_BONUS
+            reasons.append("2nd degree")
+        ranked.append(RankedManager(person, score, reasons))
+
+    ranked.sort(key=lambda candidate: candidate.score, reverse=True)
+    return ranked[:top_k] if top_k else ranked
+
+
+def _names_past_role(headline: List[str]) -> bool:
+    """Whether 'former' or 'ex' directly precedes a role word, as in "former engineering manager"."""
+    return any(
+        word in PAST_ROLE_WORDS and following in _ROLE_WORDS
+        for word, following in zip(headline, headline[1:])
+    )
+
+
+def tied(ranked: List[RankedManager], margin: float = TIE_MARGIN) -> List[RankedManager]:
+    """The top candidates that are too close to call (just the winner when there is one)."""
+    if not ranked:
+        return []
+    return [candidate for candidate in ranked if ranked[0].score - candidate.score < margin]
+
+
+def rank_result(result: Dict[str, Any], job_title: Optional[str]) -> Dict[str, Any]:
+    """
+    Order a manager search result best first and say who to contact.
+
+    Adds a 'score' to each person and either 'recommended' (a profile ID) or,
+    when the top candidates are too close, 'tied' (the profile IDs to choose from).
+    """
+    if not result.get("success") or not result.get("people"):
+        return result
+    ranked = rank_managers(result["people"], job_title)
+    top = tied(ranked)
+    ranked_result = {
+        **result,
+        "people": [{**candidate.person, "score": round(candidate.score, 1)} for candidate in ranked],
+    }
+    if len(top) == 1:
+        ranked_result["recommended"] = top[0].profile_id
+    else:
+        ranked_result["tied"] = [candidate.profile_id for candidate in top]
+    return ranked_result
@@ -0,0 +1,25 @@
+"""Template connection messages and LinkedIn's message length limit."""
+from typing import Optional
+
+MAX_MESSAGE_LENGTH = 300
+
+
+def default_message(
+    profile_name: Optional[str] = None,
+    job_title: Optional[str] = None,
+    company_name: Optional[str] = None,
+) -> str:
+    """The fixed message used when no personalized one is available."""
+    if job_title and company_name:
+        return f"Hi {profile_name or 'there'}, I'm interested in the {job_title} position at {company_name} and would love to connect to learn more about the role and your team."
+    if job_title:
+        return f"Hi {profile_name or 'there'}, I'm interested in the {job_title} position and would love to connect to learn more about the opportunity."
+    return f"Hi {profile_name or 'there'}, I'd love to connect and learn more about your work."
+
+
+def fit_message(message: str) -> str:
+    """Trim a message to LinkedIn's limit."""
+    message = message.strip()
+    if len(message) > MAX_MESSAGE_LENGTH:
+        message = message[:MAX_MESSAGE_LENGTH - 3] + "..."
+    return message
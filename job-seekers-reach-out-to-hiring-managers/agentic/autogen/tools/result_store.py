@@ -0,0 +1,75 @@
+"""Keeps the full result of every tool call available to code."""
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+
+class ToolResultStore:
+    """Bounded store of uncompacted tool results, keyed by tool name and arguments."""
+
+    def __init__(self, max_entries: int = 50):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, Any]" = OrderedDict()
+        self._latest: Dict[str, Any] = {}
+        # tool name -> position of its latest call, to compare recency across tools
+        self._latest_order: Dict[str, int] = {}
+        self._calls = 0
+        self._signatures: Dict[str, inspect.Signature] = {}
+        self._listeners: List[Callable[[str, Dict[str, Any], Any], None]] = []
+        # Parallel tool calls can record from several threads at once
+        self._lock = threading.Lock()
+
+    def register(self, func: Callable) -> None:
+        """Remember a tool's signature so lookups can apply its defaults."""
+        self._signatures[func.__name__] = inspect.signature(func)
+
+    def subscribe(self, listener: Callable[[str, Dict[str, Any], Any], None]) -> None:
+        """Call listener(tool_name, arguments, result) after every recorded call."""
+        self._listeners.append(listener)
+
+    def record(self, tool_name: str, arguments: Dict[str, Any], result: Any) -> None:
+        """Store the full result of a tool call."""
+        key = self._key(tool_name, arguments)
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            self._latest[tool_name] = result
+            self._calls += 1
+            self._latest_order[tool_name] = self._calls
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        for listener in self._listeners:
+            listener(tool_name, arguments, result)
+
+    def lookup(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Any]:
+        """Return the full result of the call made with these arguments, if stored."""
+        return self._results.get(self._key(tool_name, arguments))
+
+    def latest(self, tool_name: str) -> Optional[Any]:
+        """Return the full result of the most recent call to a tool."""
+        return self._latest.get(tool_name)
+
+    def latest_of(self, *tool_names: str) -> Optional[Any]:
+        """Return the full result of the most recent call to any of these tools."""
+        called = [name for name in tool_names if name in self._latest]
+        if not called:
+            return None
+        return self._latest[max(called, key=self._latest_order.__getitem__)]
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._latest.clear()
+        self._latest_order.clear()
+
+    def _key(self, tool_name: str, arguments: Dict[str, Any]) -> str:
+        signature = self._signatures.get(tool_name)
+        if signature is not None:
+            try:
+                bound = signature.bind(**arguments)
+                bound.apply_defaults()
+                arguments = dict(bound.arguments)
+            except TypeError:
+                pass
+        return f"{tool_name}:{json.dumps(arguments, sort_keys=True, default=str)}"
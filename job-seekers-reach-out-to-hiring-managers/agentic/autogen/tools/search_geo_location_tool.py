@@ -1,12 +1,25 @@
 import os
-import requests
 from typing import Dict, Any
 
-def search_geo_location(keywords: str) -> Dict[str, Any]:
+from .cache import geo_index
+from .http_client import auth_headers, get_http_client
+
+async def search_geo_location(keywords: str) -> Dict[str, Any]:
     """
     Step 0: Search for geographic locations to get the numeric location_id.
     Matches the TypeScript 'searchGeoLocation' logic.
     """
+    # Known locations are served from the local index without an API call
+    known = geo_index.search(keywords)
+    if known:
+        return {
+            "success": True,
+            "location_id": known[0]["geoId"],
+            "location_name": known[0]["name"],
+            "all_locations": known,
+            "cached": True,
+        }
+
     api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
     if not api_token:
         return {
@@ -14,20 +27,15 @@ def search_geo_location(keywords: str) -> Dict[str, Any]:
             "error": "CONNECTSAFELY_API_TOKEN not set in environment variables",
         }
 
-    endpoint = "https://api.connectsafely.ai/linkedin/search/geo"
-    
     try:
-        response = requests.post(
-            endpoint,
-            headers={
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            },
+        response = await get_http_client().post(
+            "/search/geo",
+            headers=auth_headers(api_token),
             json={"keywords": keywords},
             timeout=30,
         )
 
-        if not response.ok:
+        if not response.is_success:
             return {
                 "success": False,
                 "error": f"API Error {response.status_code}: {response.text}",
@@ -35,6 +43,7 @@ def search_geo_location(keywords: str) -> Dict[str, Any]:
 
         data = response.json()
         locations = data.get("locations", [])
+        geo_index.learn(keywords, locations)
         
         # Logic matches TS: const australiaId = locations[0]?.id
         if locations:
@@ -1,9 +1,18 @@
 import os
-import requests
 import re
 from typing import Dict, Any, Optional, List
 
-def search_hiring_managers(
+from .http_client import auth_headers, get_http_client
+from .manager_ranker import rank_result
+from .manager_titles import manager_titles
+
+
+def manager_search_title(job_title: Optional[str] = None) -> str:
+    """People-search keywords for the managers who hire for `job_title`."""
+    return " OR ".join(manager_titles(job_title))
+
+
+async def search_hiring_managers(
     company_id: str,
     job_title: Optional[str] = None,
     count: Optional[int] = 5
@@ -20,27 +29,12 @@ def search_hiring_managers(
         }
 
     # 1. Determine manager title (Logic matches TS script + extended)
-    search_title = "Hiring Manager OR Recruiter"
-    if job_title:
-        lower_title = job_title.lower()
-        if "engineer" in lower_title or "developer" in lower_title:
-            search_title = "Engineering Manager OR VP Engineering OR CTO"
-        elif "sales" in lower_title:
-            search_title = "Sales Director OR VP Sales"
-        elif "marketing" in lower_title:
-            search_title = "Marketing Director OR CMO"
-        elif "product" in lower_title:
-            search_title = "Product Manager OR VP Product OR CPO"
-
-    endpoint = "https://api.connectsafely.ai/linkedin/search/people"
+    search_title = manager_search_title(job_title)
 
     try:
-        response = requests.post(
-            endpoint,
-            headers={
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            },
+        response = await get_http_client().post(
+            "/search/people",
+            headers=auth_headers(api_token),
             json={
                 "keywords": search_title,
                 "count": min(count, 10),
@@ -52,7 +46,7 @@ def search_hiring_managers(
             timeout=30,
         )
 
-        if not response.ok:
+        if not response.is_success:
             return {
                 "success": False,
                 "error": f"API Error {response.status_code}: {response.text}",
@@ -81,13 +75,15 @@ def search_hiring_managers(
                     "lastName": person.get("lastName"),
                     "headline": person.get("headline"),
                     "profileId": vanity_name, # CRITICAL: Use vanity name as the ID for next steps
-                    "profileUrl": person.get("profileUrl")
+                    "profileUrl": person.get("profileUrl"),
+                    "connectionDegree": person.get("connectionDegree"),
                 })
         
-        return {
+        # 3. Rank locally so the agent doesn't spend a turn choosing
+        return rank_result({
             "success": True,
             "people": valid_people,
-        }
+        }, job_title)
 
     except Exception as e:
         return {"success": False, "error": f"Exception searching managers: {str(e)}"}
\ No newline at end of file
@@ -0,0 +1,109 @@
+import asyncio
+import os
+from typing import Dict, Any, AsyncIterator
+
+from .search_jobs_tool import search_jobs
+
+PAGE_SIZE = 25
+MAX_JOBS = 500
+MAX_CONCURRENCY = int(os.getenv("JOB_SEARCH_CONCURRENCY", "4"))
+
+
+async def search_jobs_all(
+    location_id: str,
+    keywords: str = "software engineer",
+    count: int = 100,
+    date_posted: str = "past-week",
+    skip_processed: bool = False
+) -> Dict[str, Any]:
+    """Search for MANY LinkedIn jobs (more than 25) in one call. Pages are fetched in parallel.
+
+    Args:
+        location_id: Geographic location ID from search_geo_location (REQUIRED)
+        keywords: Job search keywords (e.g., 'Software Engineer', 'Product Manager')
+        count: Number of jobs to return (default 100, max 500)
+        date_posted: Date filter - 'past-24-hours', 'past-week', 'past-month' (default 'past-week')
+        skip_processed: Leave out jobs someone was already contacted or queued about (default False)
+
+    Returns:
+        Dict with 'success', 'jobs' (each job once), 'total', 'pages' fetched and 'failed_pages' offsets
+    """
+    pages = [
+        page
+        async for page in iter_job_pages(location_id, keywords, count, date_posted, skip_processed=skip_processed)
+    ]
+    pages.sort(key=lambda p: p["start"])
+    failed = {page["start"]: page["error"] for page in pages if not page["success"]}
+    if len(failed) == len(pages):
+        return {"success": False, "error": next(iter(failed.values()))}
+
+    jobs = [job for page in pages if page["success"] for job in page["jobs"]]
+    result = {
+        "success": True,
+        "jobs": jobs[:count],
+        "total": next((page["total"] for page in pages if page.get("total") is not None), None),
+        "pages": len(pages),
+        "failed_pages": sorted(failed),
+    }
+    if skip_processed:
+        result["skippedProcessed"] = sum(page.get("skippedProcessed", 0) for page in pages)
+    return result
+
+
+async def iter_job_pages(
+    location_id: str,
+    keywords: str,
+    count: int = 100,
+    date_posted: str = "past-week",
+    max_concurrency: int = MAX_CONCURRENCY,
+    skip_processed: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Fetch every page needed for `count` jobs concurrently, yielding pages as they arrive.
+
+    A job already yielded by another page is dropped, so each jobId appears once.
+    Pages still pending are cancelled if the caller stops iterating.
+
+    Args:
+        max_concurrency: Pages in flight at once (JOB_SEARCH_CONCURRENCY, default 4)
+        skip_processed: Passed to search_jobs for every page
+
+    Yields:
+        Dicts with 'start' (page offset), 'success', and 'jobs' (new jobs only) and 'total', or 'error'
+    """
+    count = max(1, min(count, MAX_JOBS))
+    slots = asyncio.Semaphore(max(1, max_concurrency))
+    seen = set()
+
+    async def fetch(start: int) -> tuple:
+        async with slots:
+            page = await search_jobs(
+                location_id, keywords, min(PAGE_SIZE, count - start), start, date_posted, skip_processed
+            )
+        return start, page
+
+    tasks = [asyncio.ensure_future(fetch(start)) for start in range(0, count, PAGE_SIZE)]
+    try:
+        for next_page in asyncio.as_completed(tasks):
+            start, result = await next_page
+            if not result.get("success"):
+                yield {"start": start, "success": False, "error": result.get("error")}
+                continue
+            jobs = []
+            for job in result.get("jobs") or []:
+                job_id = str(job.get("jobId") or job.get("id") or "")
+                if job_id in seen:
+                    continue
+                if job_id:
+                    seen.add(job_id)
+                jobs.append(job)
+            yield {
+                "start": start,
+                "success": True,
+                "jobs": jobs,
+                "total": result.get("total"),
+                "skippedProcessed": result.get("skippedProcessed", 0),
+            }
+    finally:
+        for task in tasks:
+            task.cancel()
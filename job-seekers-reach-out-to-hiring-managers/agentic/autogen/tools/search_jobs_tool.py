@@ -1,14 +1,18 @@
 import os
-import requests
 from typing import Dict, Any, Optional
 
+from .cache import flag_seen_jobs
+from .get_company_details_batch_tool import prewarm_company_cache, job_company_ids
+from .http_client import auth_headers, get_http_client
 
-def search_jobs(
+
+async def search_jobs(
     location_id: str,
     keywords: str = "software engineer",
     count: int = 5,
     start: int = 0,
-    date_posted: str = "past-week"
+    date_posted: str = "past-week",
+    skip_processed: bool = False
 ) -> Dict[str, Any]:
     """Search for LinkedIn jobs by keywords and location. Returns list of jobs with job IDs.
     
@@ -18,9 +22,40 @@ def search_jobs(
         count: Number of jobs to return (default 5, max 25)
         start: Pagination offset (default 0)
         date_posted: Date filter - 'past-24-hours', 'past-week', 'past-month' (default 'past-week')
+        skip_processed: Leave out jobs someone was already contacted or queued about (default False)
     
     Returns:
-        Dict with 'success', 'jobs' list containing job details (title, company, location, jobId), and 'total' count
+        Dict with 'success', 'jobs' list containing job details (title, company, location, jobId), and 'total' count.
+        Jobs returned by an earlier search have 'seenBefore'; already processed ones have 'processed'
+    """
+    result = await fetch_jobs_page(location_id, keywords, count, start, date_posted)
+    if not result.get("success"):
+        return result
+
+    jobs, skipped = flag_seen_jobs(result["jobs"], skip_processed)
+    # Hiring-manager and company lookups usually follow; warm the cache now
+    prewarm_company_cache(job_company_ids(jobs))
+    result["jobs"] = jobs
+    if skip_processed:
+        result["skippedProcessed"] = skipped
+    return result
+
+
+async def fetch_jobs_page(
+    location_id: str,
+    keywords: str,
+    count: int = 25,
+    start: int = 0,
+    date_posted: str = "past-week",
+) -> Dict[str, Any]:
+    """
+    One page of job search results straight from the API.
+
+    Unlike search_jobs, it doesn't record the jobs as seen or pre-warm the
+    company cache, so background callers cost exactly one API call.
+
+    Returns:
+        Dict with 'success', 'jobs' and 'total'
     """
     api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
     if not api_token:
@@ -40,17 +75,14 @@ def search_jobs(
             },
         }
 
-        response = requests.post(
-            "https://api.connectsafely.ai/linkedin/search/jobs",
-            headers={
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            },
+        response = await get_http_client().post(
+            "/search/jobs",
+            headers=auth_headers(api_token),
             json=payload,
             timeout=30,
         )
 
-        if not response.ok:
+        if not response.is_success:
             return {
                 "success": False,
                 "error": f"ConnectSafely API error: {response.status_code} - {response.text}",
@@ -1,18 +1,27 @@
+import asyncio
 import os
-import requests
-import time
 from typing import Dict, Any, Optional
 
-def send_connection_request(
+import httpx
+
+from .cache import relationship_cache, seen_jobs
+from .http_client import auth_headers, get_http_client
+from .invitation_verifier import record_status, verify_in_background
+from .message_templates import default_message, fit_message
+
+async def send_connection_request(
     profile_id: str, 
     custom_message: str = "",
     job_title: Optional[str] = None,
     company_name: Optional[str] = None,
-    profile_name: Optional[str] = None
+    profile_name: Optional[str] = None,
+    job_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Step 6: Send Connection Request.
     Matches TypeScript 'sendConnectionRequest' logic.
+
+    Pass the `job_id` the request is about so later searches mark that job processed.
     """
     api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
     if not api_token:
@@ -23,41 +32,34 @@ def send_connection_request(
 
     # 1. Message Generation Logic (Matches your TS demo logic)
     if not custom_message:
-        if job_title and company_name:
-            custom_message = f"Hi {profile_name or 'there'}, I'm interested in the {job_title} position at {company_name} and would love to connect to learn more about the role and your team."
-        elif job_title:
-            custom_message = f"Hi {profile_name or 'there'}, I'm interested in the {job_title} position and would love to connect to learn more about the opportunity."
-        else:
-            custom_message = f"Hi {profile_name or 'there'}, I'd love to connect and learn more about your work."
+        custom_message = default_message(profile_name, job_title, company_name)
 
     # 2. Hard Limit Check (LinkedIn Limit)
-    if len(custom_message) > 300:
-        custom_message = custom_message[:297] + "..."
+    custom_message = fit_message(custom_message)
 
-    endpoint = "https://api.connectsafely.ai/linkedin/connect"
     payload = {
         "profileId": profile_id,
         "customMessage": custom_message
     }
 
     try:
-        response = requests.post(
-            endpoint,
-            headers={
-                "Authorization": f"Bearer {api_token}",
-                "Content-Type": "application/json",
-            },
+        response = await get_http_client().post(
+            "/connect",
+            headers=auth_headers(api_token),
             json=payload,
             timeout=60,
         )
 
-        if not response.ok:
+        if not response.is_success:
             return {
                 "success": False,
                 "error": f"API Error {response.status_code}: {response.text}",
             }
 
         data = response.json()
+        record_status(profile_id, invitation_sent=True)
+        if job_id:
+            await asyncio.to_thread(seen_jobs.mark_contacted, job_id, profile_id)
         return {
             "success": True,
             "status": "sent",
@@ -66,31 +68,19 @@ def send_connection_request(
             "customMessage": custom_message,
         }
 
-    except requests.exceptions.Timeout:
-        # Double-check verification logic (Very useful for slow APIs)
-        time.sleep(2)
-        try:
-            status_check = requests.get(
-                f"https://api.connectsafely.ai/linkedin/relationship/{profile_id}",
-                headers={"Authorization": f"Bearer {api_token}"},
-                timeout=10
-            )
-            if status_check.ok and status_check.json().get("invitationSent"):
-                return {
-                    "success": True, 
-                    "status": "sent", 
-                    "message": "Verified sent after timeout.",
-                    "profileId": profile_id
-                }
-        except:
-            pass
-            
+    except httpx.TimeoutException:
+        # The request may still have gone through; confirm it off this thread
+        relationship_cache.delete(profile_id)
+        verify_in_background(profile_id)
+        if job_id:
+            await asyncio.to_thread(seen_jobs.mark_contacted, job_id, profile_id)
         return {
             "success": True,
-            "status": "sent", 
-            "message": "Request likely sent (Timeout occurred).",
-            "profileId": profile_id
+            "status": "unverified",
+            "message": "Request timed out and may have been sent. It is being verified; check the status before resending.",
+            "profileId": profile_id,
+            "customMessage": custom_message,
         }
 
     except Exception as e:
-        return {"success": False, "error": f"Exception sending request: {str(e)}"}
\ No newline at end of file
+        return {"success": False, "error": f"Exception sending request: {str(e)}"}
@@ -1,4 +1,8 @@
+from typing import Dict, Iterator
+
 from agents.assistant import LinkedInAssistant
+from agents.config.async_bridge import iterate_async
+from pipelines import OutreachPipeline, OutreachRequest
 
 
 class JobSearchWorkflows:
@@ -6,13 +10,11 @@ class JobSearchWorkflows:
     
     def __init__(self):
         self.assistant = LinkedInAssistant()
+        # Fixed outreach sequence; shares the assistant's results so chat can follow up
+        self.outreach = OutreachPipeline(self.assistant.model_client, store=self.assistant.results)
     
     def execute_command(self, command: str, context: str | None = None) -> any:
         """Execute a user command."""
-        # Limit context size
-        if context and len(context) > 1500:
-            context = context[-1500:]
-        
         print(f"\n🚀 Executing: {command}")
         
         try:
@@ -26,3 +28,20 @@ class JobSearchWorkflows:
                 "error": str(e),
                 "command": command
             }
+
+    def stream_command(self, command: str, context: str | None = None) -> Iterator[Dict[str, str]]:
+        """Execute a user command, yielding progress events and a final result."""
+        print(f"\n🚀 Streaming: {command}")
+        return self.assistant.stream_command(command, context)
+
+    def stream_outreach(self, request: OutreachRequest) -> Iterator[Dict[str, str]]:
+        """Run the outreach pipeline, yielding progress events and a final summary."""
+        print(f"\n🚀 Outreach: {request.keywords} in {request.location}")
+        for event in iterate_async(lambda: self.outreach.stream(request)):
+            if event["type"] == "final":
+                # Its results are already in the assistant's context; the summary makes it a turn
+                self.assistant.conversation.record_turn(
+                    f"Outreach: {request.job_count} '{request.keywords}' jobs in {request.location}",
+                    event["content"],
+                )
+            yield event
@@ -6,7 +6,7 @@ os.environ["CREWAI_TELEMETRY_OPT_OUT"] = "true"
 
 import streamlit as st
 from dotenv import load_dotenv
-from crew import JobSearchCrew
+from streaming import describe_step, describe_task
 
 load_dotenv()
 
@@ -21,6 +21,42 @@ def check_env():
     return True
 
 
+@st.cache_resource
+def start_outreach_worker():
+    """Start the process-wide queue worker once; it keeps sending between reruns."""
+    from pipelines import get_outreach_worker
+
+    worker = get_outreach_worker()
+    worker.start()
+    return worker
+
+
+def render_outreach_queue():
+    """Sidebar panel: queue counts and worker controls."""
+    worker = start_outreach_worker()
+    stats = worker.queue.stats()
+
+    st.divider()
+    st.subheader("📬 Outreach Queue")
+    col1, col2 = st.columns(2)
+    col1.metric("Queued", stats["queued"] + stats["sending"])
+    col2.metric("Sent today", f"{stats['sent_today']}/{worker.daily_budget}")
+    st.caption(
+        f"Sent {stats['sent']} · Unverified {stats['unverified']} · Failed {stats['failed']} · "
+        f"Already connected {stats['already_connected']} · Already invited {stats['already_invited']}"
+    )
+    if worker.running:
+        if st.button("⏸️ Pause Sending"):
+            worker.pause()
+            st.rerun()
+    elif st.button("▶️ Resume Sending"):
+        worker.start()
+        st.rerun()
+    if stats["failed"] and st.button("🔁 Retry Failed"):
+        worker.queue.requeue_failed()
+        st.rerun()
+
+
 def main():
     st.set_page_config(
         page_title="Job Search Agent", 
@@ -36,8 +72,11 @@ def main():
     # Initialize session state
     if "messages" not in st.session_state:
         st.session_state.messages = []
-    if "context" not in st.session_state:
-        st.session_state.context = ""
+    if "conversation" not in st.session_state:
+        from conversation_context import ConversationContext
+
+        # Carried across commands: earlier turns within a token budget, IDs verbatim
+        st.session_state.conversation = ConversationContext()
     
     # Display chat history
     st.subheader("💬 Command Interface")
@@ -74,15 +113,18 @@ def main():
         st.header("⚙️ Controls")
         if st.button("🗑️ Clear History"):
             st.session_state.messages = []
-            st.session_state.context = ""
+            st.session_state.conversation.reset()
             st.rerun()
         
         st.divider()
         st.subheader("📋 Context Size")
-        context_size = len(st.session_state.context)
-        st.metric("Characters", context_size)
-        if context_size > 1500:
-            st.warning("Context is large. Consider clearing for better performance.")
+        conversation = st.session_state.conversation
+        last = conversation.last_stats
+        col1, col2 = st.columns(2)
+        col1.metric("Context tokens", f"{last.context_tokens if last else 0}/{conversation.token_budget}")
+        col2.metric("Last prompt tokens", (last.prompt_tokens if last else None) or "-")
+
+        render_outreach_queue()
     
     # Process command
     if command:
@@ -93,44 +135,42 @@ def main():
         st.chat_message("user").write(command)
         
         with st.chat_message("assistant"):
-            with st.spinner("🤖 Agent working..."):
-                try:
-                    crew = JobSearchCrew()
-                    
-                    # Execute with context
-                    result = crew.execute(
-                        command=command,
-                        context=st.session_state.context if st.session_state.context else None
-                    )
-                    
-                    # Update context with result (keep it manageable)
-                    result_str = str(result.get("result", ""))
-                    
-                    # Keep only last 1500 chars of context
-                    if len(st.session_state.context) > 1500:
-                        st.session_state.context = st.session_state.context[-1500:]
-                    
-                    # Append new result
-                    st.session_state.context += f"\n\n{command}: {result_str}\n"
-                    
-                    # Display result
-                    st.write(result_str)
-                    
-                    # Add assistant response
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": result_str
-                    })
-                    
-                except Exception as e:
-                    error_msg = f"❌ Error: {str(e)}"
-                    st.error(error_msg)
-                    st.info("💡 Try: 1) Clearing history 2) Using simpler command 3) Starting with 1 job")
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_msg
-                    })
+            # Agent steps and finished tasks stream into this panel
+            status = st.status("🤖 Agent working...", expanded=True)
+            try:
+                # Imported on first command so the UI renders before CrewAI is loaded
+                from crew import JobSearchCrew
 
+                crew = JobSearchCrew(
+                    step_callback=lambda step: status.write(describe_step(step)),
+                    task_callback=lambda output: status.write(describe_task(output)),
+                    conversation=st.session_state.conversation,
+                )
+                
+                # Earlier turns come from the session's conversation context
+                result = crew.execute(command=command)
+                status.update(label="✅ Done", state="complete", expanded=False)
+                
+                result_str = str(result.get("result", ""))
+                
+                # Display result
+                st.write(result_str)
+                
+                # Add assistant response
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": result_str
+                })
+                
+            except Exception as e:
+                status.update(label="❌ Failed", state="error")
+                error_msg = f"❌ Error: {str(e)}"
+                st.error(error_msg)
+                st.info("💡 Try: 1) Clearing history 2) Using simpler command 3) Starting with 1 job")
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": error_msg
+                })
 
 if __name__ == "__main__":
     main()
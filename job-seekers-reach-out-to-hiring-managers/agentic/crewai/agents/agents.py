@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from crewai import Agent, LLM
 from tools import linkedin_tools
 
@@ -7,8 +8,9 @@ class JobSearchAgents:
     """Factory class for creating job search automation agents."""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_llm():
-        """Get the Gemini LLM instance."""
+        """Get the Gemini LLM instance, shared by every agent in the process."""
         return LLM(
             model="gemini/gemini-2.0-flash-exp",
             temperature=0.1,  # Lower temperature for more consistent responses
@@ -24,8 +26,18 @@ class JobSearchAgents:
             backstory=(
                 "You execute LinkedIn automation tasks:\n"
                 "- Job search: SearchGeoLocationTool + SearchJobsTool\n"
-                "- Find managers: SearchHiringManagersTool\n"
-                "- Connect: CheckConnectionStatusTool + SendConnectionRequestTool\n\n"
+                "- More than 25 jobs: SearchJobsAllTool (one call, pages fetched in parallel)\n"
+                "- New jobs only (repeat searches): set skipProcessed to leave out jobs already handled\n"
+                "- Find managers: SearchHiringManagersTool (results are ranked: contact 'recommended', "
+                "or choose among 'tied' only when there is no recommendation)\n"
+                "- Managers for several jobs: FindHiringManagersForJobsTool (one call for all)\n"
+                "- Connect: CheckConnectionStatusTool + SendConnectionRequestTool (pass the jobId it is about)\n"
+                "- Messages for several managers: WriteConnectionMessagesTool (one call for all)\n"
+                "- Contact each manager only once, even if they fit several jobs\n"
+                "- Connect with many managers, or when asked to queue: QueueConnectionRequestTool (with its jobId)\n"
+                "- Vet several managers: BatchCheckConnectionStatusTool (one call for all)\n"
+                "- Several companies: GetCompanyDetailsBatchTool (one call for all)\n"
+                "- Several profiles (e.g. a manager shortlist): EnrichProfilesTool (one call for all)\n\n"
                 "Return results in simple JSON format."
             ),
             tools=linkedin_tools,
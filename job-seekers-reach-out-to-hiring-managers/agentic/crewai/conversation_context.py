@@ -0,0 +1,272 @@
+"""Token-budgeted conversation context: IDs kept verbatim, older turns summarized."""
+import ast
+import json
+import os
+import re
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from pipelines.hiring_managers import job_company_name
+from tools.compaction import estimate_tokens
+from tools.get_company_details_batch_tool import job_company_id
+
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONVERSATION_TOKEN_BUDGET", "500"))
+# Newest turns kept close to verbatim; older ones shrink to one line each
+RECENT_TURNS = int(os.getenv("CONVERSATION_RECENT_TURNS", "2"))
+MAX_TURNS = 20
+MAX_FACTS = 50
+
+
+@dataclass
+class Turn:
+    command: str
+    reply: str
+
+
+@dataclass
+class TurnStats:
+    """Token counts for one turn. Prompt and completion tokens are the model's own usage."""
+    context_tokens: int
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+
+
+class ConversationContext:
+    """
+    Conversation context that fits a fixed token budget.
+
+    Structured facts (job IDs, company IDs, chosen managers, contacted profiles)
+    come from tool results and are always rendered verbatim, newest first. The
+    rest of the budget holds the last `recent_turns` turns, trimmed, and a
+    one-line summary of each older turn; summaries that don't fit are dropped,
+    oldest first.
+    """
+
+    def __init__(self, token_budget: int = CONTEXT_TOKEN_BUDGET, recent_turns: int = RECENT_TURNS):
+        self.token_budget = token_budget
+        self.recent_turns = recent_turns
+        self._turns: Deque[Turn] = deque(maxlen=MAX_TURNS)
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._companies: "OrderedDict[str, str]" = OrderedDict()
+        self._managers: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats: Deque[TurnStats] = deque(maxlen=MAX_TURNS)
+        self._context_tokens = 0
+
+    def record_tool_result(self, tool_name: str, arguments: Dict[str, Any], result: Any) -> None:
+        """ToolResultStore listener: keep the IDs from every successful result."""
+        if isinstance(result, dict) and result.get("success", True):
+            self.record_facts(result)
+
+    def record_facts(self, result: Dict[str, Any]) -> None:
+        """Pick jobs, companies and managers out of a tool result or a JSON reply, by shape."""
+        for job in _dicts(result.get("jobs")):
+            self._add_job(job)
+        for person in _dicts(result.get("people")) + _dicts(result.get("managers")):
+            if person.get("profileId"):
+                self._add_manager(str(person["profileId"]), name=person.get("name") or _full_name(person))
+        if result.get("recommended"):
+            self._add_manager(str(result["recommended"]), role="recommended")
+        company = result.get("company")
+        if isinstance(company, dict) and result.get("company_id"):
+            self._add_company(str(result["company_id"]), company.get("name"))
+        companies = result.get("companies")
+        if isinstance(companies, dict):
+            for company_id, details in companies.items():
+                if isinstance(details, dict):
+                    self._add_company(str(company_id), details.get("name"))
+        if result.get("profileId") and (result.get("status") or result.get("queued") is not None):
+            status = result.get("status") or ("queued" if result.get("queued") else "already queued")
+            self._add_manager(str(result["profileId"]), role=status)
+
+    def record_turn(
+        self,
+        command: str,
+        reply: str,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+    ) -> None:
+        """Add a finished turn, with the model's token usage for it when known."""
+        self._turns.append(Turn(command, str(reply)))
+        parsed = parse_structured(reply)
+        if isinstance(parsed, dict):
+            self.record_facts(parsed)
+        self.stats.append(TurnStats(self._context_tokens, prompt_tokens, completion_tokens))
+
+    def render(self, extra: Optional[str] = None) -> str:
+        """
+        Build the context for the next prompt, within `token_budget`.
+
+        Args:
+            extra: Caller-supplied context; its tail is kept if it doesn't fit
+
+        Returns:
+            Context text, empty if there is nothing to carry over
+        """
+        budget = self.token_budget
+        sections = []
+        facts = self._render_facts(budget * 3 // 5)
+        if facts:
+            sections.append(facts)
+            budget -= estimate_tokens(facts)
+
+        turns = list(self._turns)
+        recent = turns[-self.recent_turns:] if self.recent_turns else []
+        older = turns[: len(turns) - len(recent)]
+        # Recent turns get two thirds of what the facts left; summaries get the rest
+        turn_tokens = budget * 2 // (3 * max(1, len(recent)))
+        recent_lines = [
+            f"User: {_clip(t.command, 30)}\nAgent: {_clip(t.reply, max(10, turn_tokens - 35))}"
+            for t in recent
+        ]
+        budget -= sum(estimate_tokens(line) for line in recent_lines)
+
+        summary: List[str] = []
+        for turn in reversed(older):
+            line = f"- {_clip(turn.command, 15)} → {_clip(_first_line(turn.reply), 25)}"
+            if estimate_tokens(line) > budget:
+                break
+            summary.insert(0, line)
+            budget -= estimate_tokens(line)
+        if older:
+            dropped = len(older) - len(summary)
+            header = "EARLIER TURNS:" + (f" ({dropped} older turn(s) omitted)" if dropped else "")
+            sections.append("\n".join([header] + summary))
+        if recent_lines:
+            sections.append("RECENT TURNS:\n" + "\n".join(recent_lines))
+        if extra and budget > 0:
+            sections.append(_clip_tail(extra, budget * 4))
+
+        text = "\n\n".join(sections)
+        self._context_tokens = estimate_tokens(text) if text else 0
+        return text
+
+    @property
+    def last_stats(self) -> Optional[TurnStats]:
+        return self.stats[-1] if self.stats else None
+
+    def reset(self) -> None:
+        self._turns.clear()
+        self._jobs.clear()
+        self._companies.clear()
+        self._managers.clear()
+        self.stats.clear()
+        self._context_tokens = 0
+
+    def _render_facts(self, budget: int) -> str:
+        """Chosen or contacted managers first, then jobs, companies and other managers."""
+        chosen = [(pid, m) for pid, m in reversed(self._managers.items()) if m.get("role")]
+        found = [(pid, m) for pid, m in reversed(self._managers.items()) if not m.get("role")]
+        lines = [_manager_line(pid, m) for pid, m in chosen]
+        for jid, job in reversed(self._jobs.items()):
+            company_id = job.get("companyId")
+            company = self._companies.get(company_id or "") or job.get("companyName")
+            line = f"- Job {jid}: {job.get('title') or '?'} @ {company or '?'}"
+            if company_id:
+                line += f" (companyId {company_id})"
+            lines.append(line)
+        for company_id, name in reversed(self._companies.items()):
+            if not any(job.get("companyId") == company_id for job in self._jobs.values()):
+                lines.append(f"- Company {company_id}: {name}")
+        lines += [_manager_line(pid, m) for pid, m in found]
+
+        kept = []
+        budget -= estimate_tokens("KNOWN IDS (use verbatim):")
+        for line in lines:
+            cost = estimate_tokens(line)
+            if cost > budget:
+                break
+            kept.append(line)
+            budget -= cost
+        return "\n".join(["KNOWN IDS (use verbatim):"] + kept) if kept else ""
+
+    def _add_job(self, job: Dict[str, Any]) -> None:
+        jid = job.get("jobId") or job.get("id")
+        if not jid:
+            return
+        entry = self._jobs.pop(str(jid), {})
+        entry.update({
+            key: value
+            for key, value in (
+                ("title", job.get("title")),
+                ("companyName", job_company_name(job)),
+                ("companyId", job_company_id(job)),
+            )
+            if value
+        })
+        self._jobs[str(jid)] = entry
+        _trim(self._jobs)
+        if job.get("recommended"):
+            self._add_manager(str(job["recommended"]), role=f"recommended for job {jid}")
+
+    def _add_company(self, company_id: str, name: Optional[str]) -> None:
+        if name:
+            self._companies.pop(company_id, None)
+            self._companies[company_id] = name
+            _trim(self._companies)
+
+    def _add_manager(self, profile_id: str, name: Optional[str] = None, role: Optional[str] = None) -> None:
+        entry = self._managers.pop(profile_id, {})
+        if name and name.strip():
+            entry["name"] = name.strip()
+        if role:
+            entry["role"] = role
+        self._managers[profile_id] = entry
+        _trim(self._managers)
+
+
+def parse_structured(text: Any) -> Any:
+    """
+    The JSON object in a reply or a stringified tool result, or None.
+
+    Accepts JSON and Python literals (how CrewAI stringifies tool return values),
+    with or without surrounding prose.
+    """
+    if isinstance(text, (dict, list)):
+        return text
+    text = str(text or "")
+    match = re.search(r"\{.*\}", text, re.DOTALL)
+    if not match:
+        return None
+    for parse in (json.loads, ast.literal_eval):
+        try:
+            return parse(match.group(0))
+        except (ValueError, SyntaxError, MemoryError, RecursionError):
+            continue
+    return None
+
+
+def _dicts(value: Any) -> List[Dict[str, Any]]:
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+def _manager_line(profile_id: str, manager: Dict[str, Any]) -> str:
+    line = f"- Manager {profile_id}"
+    if manager.get("name"):
+        line += f": {manager['name']}"
+    if manager.get("role"):
+        line += f" [{manager['role']}]"
+    return line
+
+
+def _full_name(person: Dict[str, Any]) -> str:
+    return f"{person.get('firstName') or ''} {person.get('lastName') or ''}".strip()
+
+
+def _first_line(text: str) -> str:
+    return next((line.strip() for line in text.splitlines() if line.strip()), "")
+
+
+def _clip(text: str, max_tokens: int) -> str:
+    text = " ".join(str(text).split())
+    limit = max_tokens * 4
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def _clip_tail(text: str, max_chars: int) -> str:
+    return text if len(text) <= max_chars else "..." + text[-max_chars + 3:]
+
+
+def _trim(entries: "OrderedDict[str, Any]") -> None:
+    while len(entries) > MAX_FACTS:
+        entries.popitem(last=False)
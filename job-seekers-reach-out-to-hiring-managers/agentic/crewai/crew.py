@@ -8,8 +8,8 @@ from workflows import JobSearchWorkflows
 class JobSearchCrew:
     """Command-based job search crew."""
 
-    def __init__(self):
-        self.workflows = JobSearchWorkflows()
+    def __init__(self, step_callback=None, task_callback=None, conversation=None):
+        self.workflows = JobSearchWorkflows(step_callback, task_callback, conversation)
 
     def execute(self, command: str, context: str | None = None) -> dict:
         """Execute a command with optional context."""
@@ -0,0 +1,16 @@
+"""Deterministic multi-step flows that run without an LLM round-trip per step."""
+from .hiring_managers import fan_out_hiring_managers
+from .messages import MessageTarget, write_messages
+from .profile_enrichment import enrich_profiles
+from .outreach_queue import OutreachQueue, OutreachWorker, get_outreach_queue, get_outreach_worker
+
+__all__ = [
+    "fan_out_hiring_managers",
+    "MessageTarget",
+    "write_messages",
+    "enrich_profiles",
+    "OutreachQueue",
+    "OutreachWorker",
+    "get_outreach_queue",
+    "get_outreach_worker",
+]
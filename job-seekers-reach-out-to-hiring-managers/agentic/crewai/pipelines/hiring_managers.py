@@ -0,0 +1,91 @@
+"""Find hiring managers for every job in a search result with one concurrent fan-out."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from tools.get_company_details_batch_tool import job_company_id
+from tools.manager_ranker import rank_result
+from tools.search_hiring_managers_tool import SearchHiringManagersTool, manager_search_title
+
+MAX_CONCURRENCY = int(os.getenv("HIRING_MANAGER_CONCURRENCY", "5"))
+
+
+def job_id(job: Dict[str, Any]) -> Optional[str]:
+    """A job's ID, whichever key the API used."""
+    jid = job.get("jobId") or job.get("id")
+    return str(jid) if jid else None
+
+
+def job_company_name(job: Dict[str, Any]) -> Optional[str]:
+    """A job's company name, whether flat or nested under 'company'."""
+    company = job.get("company")
+    return job.get("companyName") or (company.get("name") if isinstance(company, dict) else None)
+
+
+def fan_out_hiring_managers(
+    jobs: Union[Dict[str, Any], List[Dict[str, Any]]],
+    count: int = 5,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Search hiring managers for every job concurrently.
+
+    Jobs at the same company that need the same kind of manager share one
+    search, so a 25-job result usually costs a handful of API calls.
+
+    Args:
+        jobs: A full SearchJobsTool().search(...) result, or its list of jobs
+        count: Managers to return per company (max 25)
+        max_concurrency: Searches in flight at once (HIRING_MANAGER_CONCURRENCY, default 5)
+
+    Returns:
+        Dict with 'success', 'managers_by_job' (jobId -> managers, best first),
+        'picks_by_job' (jobId -> 'recommended' profile ID or 'tied' profile IDs),
+        'searches' (API calls made), 'failed' (companyId -> an error for each of its
+        title searches that failed) and 'skipped' (jobs without a company)
+    """
+    if isinstance(jobs, dict):
+        jobs = jobs.get("jobs") or []
+
+    # (companyId, manager keywords) -> the job title to search with and the jobs it serves
+    searches: Dict[tuple, Dict[str, Any]] = {}
+    skipped = []
+    for job in jobs:
+        jid, cid = job_id(job), job_company_id(job)
+        if not jid or not cid:
+            skipped.append(jid or job.get("title"))
+            continue
+        key = (cid, manager_search_title(job.get("title")))
+        searches.setdefault(key, {"title": job.get("title"), "jobs": []})["jobs"].append((jid, job.get("title")))
+
+    if not searches:
+        return {"success": False, "error": "No jobs with a company ID to search"}
+
+    tool = SearchHiringManagersTool()
+
+    def run(key: tuple) -> Dict[str, Any]:
+        return tool.search(key[0], jobTitle=searches[key]["title"], count=count)
+
+    managers_by_job: Dict[str, List[Dict[str, Any]]] = {}
+    picks_by_job: Dict[str, Dict[str, Any]] = {}
+    failed: Dict[str, List[str]] = {}
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(searches))) as pool:
+        for key, result in zip(searches, pool.map(run, searches)):
+            if not result.get("success"):
+                # A company can have several title searches; keep every error
+                failed.setdefault(key[0], []).append(f"{searches[key]['title']}: {result.get('error')}")
+                continue
+            # One search can serve several titles; rank it for each job's own title
+            for jid, title in searches[key]["jobs"]:
+                ranked = rank_result(result, title)
+                managers_by_job[jid] = ranked.get("people", [])
+                picks_by_job[jid] = {k: ranked[k] for k in ("recommended", "tied") if k in ranked}
+
+    return {
+        "success": sum(map(len, failed.values())) < len(searches),
+        "managers_by_job": managers_by_job,
+        "picks_by_job": picks_by_job,
+        "searches": len(searches),
+        "failed": failed,
+        "skipped": skipped,
+    }
@@ -0,0 +1,83 @@
+"""Personalize many connection messages with one model call."""
+import json
+import re
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from tools.message_templates import default_message, fit_message
+
+WRITER_PROMPT = """You write LinkedIn connection requests for a job seeker.
+For every person, write one short, specific message (under 280 characters) that greets
+them by first name and names the role and company. No placeholders, no sign-off.
+Reply with ONLY a JSON array: [{"profileId": "...", "message": "..."}]"""
+
+
+@dataclass
+class MessageTarget:
+    """One manager to write to, and the job the message is about."""
+    profile_id: str
+    name: str = ""
+    headline: str = ""
+    job_title: Optional[str] = None
+    company_name: Optional[str] = None
+
+
+def write_messages(llm: Any, targets: List[MessageTarget]) -> Dict[str, str]:
+    """
+    Write a personalized message for every target in a single model call.
+
+    Targets the model skips, or all of them if the call fails, get the
+    template message instead, so every target always has a message.
+
+    Args:
+        llm: CrewAI LLM used for the call
+        targets: Managers to write to, with the job each message is about
+
+    Returns:
+        Dict mapping profile ID to a message within LinkedIn's 300-character limit
+    """
+    messages = {t.profile_id: _template(t) for t in targets}
+    if not targets:
+        return messages
+
+    brief = [
+        {"profileId": t.profile_id, **{k: v for k, v in asdict(t).items() if v and k != "profile_id"}}
+        for t in targets
+    ]
+    try:
+        reply = llm.call([
+            {"role": "system", "content": WRITER_PROMPT},
+            {"role": "user", "content": json.dumps(brief)},
+        ])
+    except Exception as e:
+        print(f"⚠️ Message personalization failed, using templates: {e}")
+        return messages
+
+    written = 0
+    for item in parse_json_array(reply):
+        profile_id = str(item.get("profileId"))
+        message = str(item.get("message") or "").strip()
+        if profile_id in messages and message:
+            messages[profile_id] = fit_message(message)
+            written += 1
+    if written < len(targets):
+        print(f"⚠️ {len(targets) - written} of {len(targets)} messages fell back to the template")
+    return messages
+
+
+def parse_json_array(content: Any) -> List[Dict[str, Any]]:
+    """Pull the JSON array out of a model reply, tolerating code fences and prose."""
+    text = content if isinstance(content, str) else str(content)
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if not match:
+        return []
+    try:
+        items = json.loads(match.group(0))
+    except ValueError:
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+
+def _template(target: MessageTarget) -> str:
+    first_name = target.name.split()[0] if target.name else None
+    return fit_message(default_message(first_name, target.job_title, target.company_name))
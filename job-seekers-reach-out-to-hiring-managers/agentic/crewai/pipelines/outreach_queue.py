@@ -0,0 +1,309 @@
+"""Persistent outreach queue: idempotent enqueueing, paced sending within a daily budget."""
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from tools.check_connection_status_tool import CheckConnectionStatusTool
+from tools.send_connection_request_tool import SendConnectionRequestTool
+from tools.invitation_verifier import verify_in_background
+from tools.cache import seen_jobs
+from tools.cache.sqlite_cache import CACHE_DIR
+
+QUEUE_DB_PATH = os.getenv("OUTREACH_QUEUE_DB", os.path.join(CACHE_DIR, "outreach.db"))
+RATE_PER_HOUR = float(os.getenv("OUTREACH_RATE_PER_HOUR", "10"))
+DAILY_BUDGET = int(os.getenv("OUTREACH_DAILY_BUDGET", "20"))
+MAX_ATTEMPTS = int(os.getenv("OUTREACH_MAX_ATTEMPTS", "3"))
+RETRY_BASE_SECONDS = 300
+# A 'sending' claim older than this belongs to a worker that died; its row is sent again
+CLAIM_LEASE_SECONDS = float(os.getenv("OUTREACH_CLAIM_LEASE", "600"))
+
+# When any app last sent, or started sending, a request from the shared queue
+LAST_SEND_SQL = (
+    "MAX(COALESCE((SELECT MAX(sent_at) FROM outreach), 0), "
+    "COALESCE((SELECT MAX(claimed_at) FROM outreach WHERE status = 'sending'), 0))"
+)
+
+# queued -> sending -> sent | unverified | failed | already_connected | already_invited
+# (unverified: the send timed out; it becomes sent or already_connected once confirmed)
+STATES = ("queued", "sending", "sent", "unverified", "failed", "already_connected", "already_invited")
+
+
+class OutreachQueue:
+    """
+    Connection requests waiting to be sent, one row per profile.
+
+    Enqueueing the same profile again is a no-op, whichever app or session
+    does it, so a profile is never invited twice from the queue.
+    """
+
+    def __init__(self, db_path: str = QUEUE_DB_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS outreach (
+                    profile_id TEXT PRIMARY KEY, message TEXT NOT NULL,
+                    job_id TEXT, source TEXT, status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT,
+                    next_attempt_at REAL NOT NULL, claim TEXT, claimed_at REAL,
+                    created_at REAL NOT NULL, updated_at REAL NOT NULL, sent_at REAL)"""
+            )
+            columns = {row["name"] for row in db.execute("PRAGMA table_info(outreach)")}
+            if "claimed_at" not in columns:
+                # Queues created before claims had a lease
+                db.execute("ALTER TABLE outreach ADD COLUMN claimed_at REAL")
+            db.execute("CREATE INDEX IF NOT EXISTS idx_outreach_due ON outreach (status, next_attempt_at)")
+            db.execute("CREATE INDEX IF NOT EXISTS idx_outreach_sent ON outreach (sent_at)")
+
+    def enqueue(
+        self,
+        profile_id: str,
+        message: str,
+        job_id: Optional[str] = None,
+        source: str = "",
+    ) -> bool:
+        """Queue a request; returns False if the profile was already in the queue."""
+        now = time.time()
+        with self._connect() as db:
+            cursor = db.execute(
+                "INSERT OR IGNORE INTO outreach (profile_id, message, job_id, source, status, "
+                "next_attempt_at, created_at, updated_at) VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (str(profile_id), message, job_id, source, now, now, now),
+            )
+        added = cursor.rowcount == 1
+        if added and job_id:
+            seen_jobs.mark_contacted(job_id, profile_id)
+        return added
+
+    def claim_next(
+        self,
+        min_interval: float = 0,
+        lease: float = CLAIM_LEASE_SECONDS,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Atomically take the oldest due request and mark it 'sending'.
+
+        Args:
+            min_interval: Seconds that must have passed since any app last sent from the queue
+            lease: Age after which another worker's 'sending' claim is taken over
+
+        Returns:
+            The claimed row, or None if nothing is due or it is too soon to send
+        """
+        claim = uuid.uuid4().hex
+        now = time.time()
+        # An expired claim is retried; the status check stops a double invite
+        due = (
+            "((status = 'queued' AND next_attempt_at <= ?) "
+            "OR (status = 'sending' AND COALESCE(claimed_at, 0) < ?))"
+        )
+        with self._connect() as db:
+            db.execute(
+                f"UPDATE outreach SET status = 'sending', claim = ?, claimed_at = ?, updated_at = ? "
+                f"WHERE profile_id = (SELECT profile_id FROM outreach WHERE {due} "
+                f"ORDER BY created_at LIMIT 1) AND {due} AND {LAST_SEND_SQL} <= ?",
+                (claim, now, now, now, now - lease, now, now - lease, now - min_interval),
+            )
+            row = db.execute("SELECT * FROM outreach WHERE claim = ?", (claim,)).fetchone()
+        return dict(row) if row else None
+
+    def seconds_until_send(self, min_interval: float) -> float:
+        """Seconds until `min_interval` has passed since any app last sent from the queue."""
+        with self._connect() as db:
+            last = db.execute(f"SELECT {LAST_SEND_SQL}").fetchone()[0]
+        return max(0.0, last + min_interval - time.time())
+
+    def mark(self, profile_id: str, status: str, error: Optional[str] = None) -> None:
+        """Record a final outcome for a claimed request."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "UPDATE outreach SET status = ?, last_error = ?, claim = NULL, claimed_at = NULL, "
+                "updated_at = ?, sent_at = CASE WHEN ? IN ('sent', 'unverified') "
+                "THEN COALESCE(sent_at, ?) ELSE sent_at END WHERE profile_id = ?",
+                (status, error, now, status, now, profile_id),
+            )
+
+    def retry_later(self, profile_id: str, error: str, max_attempts: int = MAX_ATTEMPTS) -> str:
+        """Count a failed attempt; requeue with backoff or give up. Returns the new status."""
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT attempts FROM outreach WHERE profile_id = ?", (profile_id,)
+            ).fetchone()
+            attempts = (row["attempts"] if row else 0) + 1
+            status = "failed" if attempts >= max_attempts else "queued"
+            now = time.time()
+            db.execute(
+                "UPDATE outreach SET status = ?, attempts = ?, last_error = ?, claim = NULL, "
+                "claimed_at = NULL, next_attempt_at = ?, updated_at = ? WHERE profile_id = ?",
+                (status, attempts, error, now + RETRY_BASE_SECONDS * 2 ** (attempts - 1), now, profile_id),
+            )
+        return status
+
+    def requeue_failed(self) -> int:
+        """Give every failed request a fresh set of attempts."""
+        now = time.time()
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE outreach SET status = 'queued', attempts = 0, next_attempt_at = ?, "
+                "updated_at = ? WHERE status = 'failed'",
+                (now, now),
+            )
+        return cursor.rowcount
+
+    def sent_today(self) -> int:
+        """Requests sent (or possibly sent) since local midnight; what the daily budget counts."""
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        with self._connect() as db:
+            return db.execute(
+                "SELECT COUNT(*) FROM outreach WHERE sent_at >= ?", (midnight,)
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Count of requests in each state, plus 'sent_today'."""
+        with self._connect() as db:
+            rows = db.execute("SELECT status, COUNT(*) FROM outreach GROUP BY status").fetchall()
+        counts = {state: 0 for state in STATES}
+        counts.update({status: count for status, count in rows})
+        counts["sent_today"] = self.sent_today()
+        return counts
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recently updated requests, optionally in one state."""
+        query = "SELECT * FROM outreach"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._connect() as db:
+            rows = db.execute(query + " ORDER BY updated_at DESC LIMIT ?", (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=10)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+
+class OutreachWorker:
+    """
+    Background thread that drains the queue through the send tool.
+
+    Sends at most `rate_per_hour` requests an hour and `daily_budget` a day,
+    counted across every app and worker using the same queue database,
+    checks each profile's status first, and retries failures with backoff.
+    """
+
+    def __init__(
+        self,
+        queue: OutreachQueue,
+        send: Callable[[str, str], Dict[str, Any]] = SendConnectionRequestTool()._run,
+        check: Callable[[str], Dict[str, Any]] = CheckConnectionStatusTool().check,
+        rate_per_hour: float = RATE_PER_HOUR,
+        daily_budget: int = DAILY_BUDGET,
+        poll_seconds: float = 30,
+        verify: Callable[[str], Future] = verify_in_background,
+    ):
+        self.queue = queue
+        self.send = send
+        self.check = check
+        self.rate_per_hour = rate_per_hour
+        self.daily_budget = daily_budget
+        self.poll_seconds = poll_seconds
+        self.verify = verify
+        self._stop = threading.Event()
+        self._paused = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._paused.is_set()
+
+    def start(self) -> None:
+        """Start the thread (or resume it if paused)."""
+        self._paused.clear()
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="outreach-worker", daemon=True)
+            self._thread.start()
+
+    def pause(self) -> None:
+        """Stop sending after the current request; the queue is kept."""
+        self._paused.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _loop(self) -> None:
+        interval = 3600 / self.rate_per_hour
+        while not self._stop.is_set():
+            if self._paused.is_set() or self.queue.sent_today() >= self.daily_budget:
+                self._stop.wait(self.poll_seconds)
+                continue
+            # Pacing is read from the shared queue, so other apps' sends count too
+            wait = self.queue.seconds_until_send(interval)
+            if wait > 0:
+                self._stop.wait(min(wait, self.poll_seconds))
+                continue
+            job = self.queue.claim_next(interval)
+            if job is None:
+                self._stop.wait(self.poll_seconds)
+                continue
+            try:
+                self._process(job)
+            except Exception as e:
+                self.queue.retry_later(job["profile_id"], str(e))
+
+    def _process(self, job: Dict[str, Any]) -> None:
+        profile_id = job["profile_id"]
+        status = self.check(profile_id)
+        if status.get("success") and status.get("connected"):
+            self.queue.mark(profile_id, "already_connected")
+            return
+        if status.get("success") and status.get("invitationSent"):
+            self.queue.mark(profile_id, "already_invited")
+            return
+
+        result = self.send(profile_id, job["message"])
+        if result.get("status") == "unverified":
+            # Counted as sent for pacing; the verifier settles the final state later
+            self.queue.mark(profile_id, "unverified")
+            self.verify(profile_id).add_done_callback(lambda done: self._settle(profile_id, done))
+            print(f"⏳ Outreach to {profile_id} timed out, verifying")
+            return
+        if result.get("success"):
+            self.queue.mark(profile_id, "sent")
+            print(f"📨 Outreach sent to {profile_id}")
+            return
+        status = self.queue.retry_later(profile_id, result.get("error") or "Unknown error")
+        print(f"⚠️ Outreach to {profile_id} failed ({status}): {result.get('error')}")
+
+    def _settle(self, profile_id: str, verification: Future) -> None:
+        """Record a timed-out request's verified outcome; 'unverified' stays as it is."""
+        if verification.exception() is None and verification.result() != "unverified":
+            self.queue.mark(profile_id, verification.result())
+
+
+@lru_cache(maxsize=1)
+def get_outreach_queue() -> OutreachQueue:
+    """The process-wide queue (OUTREACH_QUEUE_DB, default ~/.connectsafely/outreach.db)."""
+    return OutreachQueue()
+
+
+@lru_cache(maxsize=1)
+def get_outreach_worker() -> OutreachWorker:
+    """The process-wide worker; call .start() to begin sending."""
+    return OutreachWorker(get_outreach_queue())
@@ -0,0 +1,69 @@
+"""Bulk profile enrichment: fetch many LinkedIn profiles concurrently into the local profile store."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from tools.cache import profile_store
+from tools.cache.profile_store import PROFILE_CACHE_TTL
+from tools.fetch_profile_details_tool import FetchProfileDetailsTool, extract_profile_id_from_url
+
+MAX_CONCURRENCY = int(os.getenv("PROFILE_ENRICH_CONCURRENCY", "8"))
+
+
+def enrich_profiles(
+    profiles: List[str],
+    refresh: bool = False,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Fetch details for many LinkedIn profiles, e.g. a shortlist of managers.
+
+    Profiles fetched recently are served from the local store; the rest are
+    fetched concurrently, at most `max_concurrency` at a time, and saved
+    there. One failing profile doesn't stop the others.
+
+    Args:
+        profiles: Profile IDs (vanity names) or LinkedIn profile URLs
+        refresh: Fetch every profile again, even if stored recently
+        max_concurrency: Most profile requests in flight at once
+
+    Returns:
+        Dict with 'profiles' (one row per profile, with its 'profileId'),
+        'fromCache', 'fetched' and 'failed' (profile ID -> error)
+    """
+    profile_ids = list(dict.fromkeys(
+        extract_profile_id_from_url(str(p).strip()) for p in profiles if p and str(p).strip()
+    ))
+    if not profile_ids:
+        return {"success": False, "error": "No profile IDs given"}
+
+    enriched = {} if refresh else profile_store.get_many(profile_ids, max_age=PROFILE_CACHE_TTL)
+    missing = [pid for pid in profile_ids if pid not in enriched]
+    tool = FetchProfileDetailsTool()
+
+    def fetch(profile_id: str) -> Dict[str, Any]:
+        try:
+            return tool.fetch(profile_id)
+        except Exception as e:
+            return {"success": False, "error": f"Error fetching profile details: {str(e)}"}
+
+    fetched: Dict[str, Dict[str, Any]] = {}
+    failed = {}
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(missing))) as pool:
+            for profile_id, result in zip(missing, pool.map(fetch, missing)):
+                if result.get("success"):
+                    fetched[profile_id] = result["profile"]
+                else:
+                    failed[profile_id] = result.get("error") or "Unknown error"
+    # One write for the whole batch
+    profile_store.save_many(fetched)
+    enriched.update(fetched)
+
+    return {
+        "success": len(failed) < len(profile_ids),
+        "profiles": [{**enriched[pid], "profileId": pid} for pid in profile_ids if pid in enriched],
+        "fromCache": len(profile_ids) - len(missing),
+        "fetched": len(fetched),
+        "failed": failed,
+    }
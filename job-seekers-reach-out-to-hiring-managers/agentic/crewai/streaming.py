@@ -0,0 +1,31 @@
+"""
+Progress descriptions for CrewAI step and task callbacks.
+
+CrewAI reports agent steps and finished tasks rather than model tokens, so the
+UI streams those as they happen.
+"""
+
+from typing import Any
+
+
+def _shorten(text: Any, limit: int = 160) -> str:
+    text = " ".join(str(text or "").split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def describe_step(step: Any) -> str:
+    """Describe an agent step (AgentAction / AgentFinish) for display."""
+    tool = getattr(step, "tool", None)
+    if tool:
+        return f"🔧 Using `{tool}`"
+    thought = getattr(step, "thought", "")
+    if thought:
+        return f"💭 {_shorten(thought)}"
+    return "🧠 Agent is working on its answer..."
+
+
+def describe_task(output: Any) -> str:
+    """Describe a finished task (TaskOutput) for display."""
+    agent = getattr(output, "agent", "") or "Agent"
+    summary = getattr(output, "summary", "") or getattr(output, "description", "")
+    return f"✅ **{_shorten(agent, 60)}** finished: {_shorten(summary, 100)}"
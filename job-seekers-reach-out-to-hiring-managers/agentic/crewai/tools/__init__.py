@@ -1,19 +1,33 @@
 from .search_geo_location_tool import SearchGeoLocationTool
 from .search_jobs_tool import SearchJobsTool
+from .search_jobs_all_tool import SearchJobsAllTool
 from .get_company_details_tool import GetCompanyDetailsTool
+from .get_company_details_batch_tool import GetCompanyDetailsBatchTool
 from .search_hiring_managers_tool import SearchHiringManagersTool
+from .find_hiring_managers_for_jobs_tool import FindHiringManagersForJobsTool
 from .fetch_profile_details_tool import FetchProfileDetailsTool
+from .enrich_profiles_tool import EnrichProfilesTool
 from .check_connection_status_tool import CheckConnectionStatusTool
+from .batch_check_connection_status_tool import BatchCheckConnectionStatusTool
 from .send_connection_request_tool import SendConnectionRequestTool
+from .queue_connection_request_tool import QueueConnectionRequestTool
+from .write_connection_messages_tool import WriteConnectionMessagesTool
 
 linkedin_tools = [
     SearchGeoLocationTool(),
     SearchJobsTool(),
+    SearchJobsAllTool(),
     GetCompanyDetailsTool(),
+    GetCompanyDetailsBatchTool(),
     SearchHiringManagersTool(),
+    FindHiringManagersForJobsTool(),
     FetchProfileDetailsTool(),
+    EnrichProfilesTool(),
     CheckConnectionStatusTool(),
+    BatchCheckConnectionStatusTool(),
+    WriteConnectionMessagesTool(),
     SendConnectionRequestTool(),
+    QueueConnectionRequestTool(),
 ]
 
 __all__ = ["linkedin_tools"]
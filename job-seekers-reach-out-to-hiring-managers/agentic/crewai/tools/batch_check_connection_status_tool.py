@@ -0,0 +1,45 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+from .check_connection_status_tool import CheckConnectionStatusTool
+
+MAX_CONCURRENCY = int(os.getenv("CONNECTION_STATUS_CONCURRENCY", "5"))
+
+
+class BatchCheckConnectionStatusInput(BaseModel):
+    """Input schema for BatchCheckConnectionStatus tool."""
+    profileIds: List[str] = Field(..., description="Profile IDs (vanity names) to check")
+
+
+class BatchCheckConnectionStatusTool(BaseTool):
+    name: str = "Batch Check Connection Status"
+    description: str = (
+        "Check the connection status of many LinkedIn profiles in one call. "
+        "Use this to vet a list of hiring managers before outreach instead of calling "
+        "Check Connection Status once per manager. Returns a status map keyed by profile ID."
+    )
+    args_schema: Type[BaseModel] = BatchCheckConnectionStatusInput
+
+    def _run(self, profileIds: List[str]) -> dict[str, Any]:
+        """Execute the tool, checking profiles concurrently."""
+        # Dedupe while keeping the caller's order
+        unique_ids = list(dict.fromkeys(str(pid) for pid in profileIds if pid))
+        if not unique_ids:
+            return {"success": False, "error": "No profile IDs given"}
+
+        checker = CheckConnectionStatusTool()
+        workers = min(MAX_CONCURRENCY, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(checker.check, unique_ids))
+
+        statuses = dict(zip(unique_ids, results))
+        failed = [pid for pid, status in statuses.items() if not status.get("success")]
+        return {
+            "success": len(failed) < len(unique_ids),
+            "checked": len(unique_ids),
+            "failed": failed,
+            "statuses": statuses,
+        }
@@ -0,0 +1,9 @@
+"""Long-lived cache of company details, keyed by company ID."""
+import os
+
+from .sqlite_cache import SQLiteTTLCache
+
+# Company metadata barely changes; default to a week
+COMPANY_CACHE_TTL = float(os.getenv("COMPANY_CACHE_TTL", str(7 * 24 * 3600)))
+
+company_cache = SQLiteTTLCache("company", COMPANY_CACHE_TTL)
@@ -0,0 +1,155 @@
+"""Jobs returned by earlier searches, and how far outreach got for each."""
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .sqlite_cache import CACHE_DIR
+
+# Postings older than this are forgotten, so a re-listed job counts as new again
+SEEN_JOBS_RETENTION_DAYS = float(os.getenv("SEEN_JOBS_RETENTION_DAYS", "90"))
+
+
+class SeenJobsStore:
+    """
+    One row per jobId: when it was first and last seen and who was contacted
+    (or queued) about it.
+
+    Shares cache.db in CONNECTSAFELY_CACHE_DIR with the other caches. Storage
+    errors are logged and treated as "never seen".
+    """
+
+    def __init__(self, db_path: Optional[str] = None, retention_days: float = SEEN_JOBS_RETENTION_DAYS):
+        self.db_path = db_path or os.path.join(CACHE_DIR, "cache.db")
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            with self._connect() as db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    """CREATE TABLE IF NOT EXISTS seen_jobs (
+                        job_id TEXT PRIMARY KEY, title TEXT, company_id TEXT,
+                        first_seen_at REAL NOT NULL, last_seen_at REAL NOT NULL,
+                        contacted_at REAL, contacted_profile_id TEXT)"""
+                )
+                db.execute(
+                    "DELETE FROM seen_jobs WHERE last_seen_at < ?",
+                    (time.time() - retention_days * 86400,),
+                )
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Seen-jobs store unavailable: {e}")
+
+    def record(self, jobs: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Record jobs from a search result.
+
+        Returns:
+            The stored rows of the jobs that had been seen before, by jobId, as
+            they were before this search
+        """
+        rows = {}
+        for job in jobs:
+            job_id = job.get("jobId") or job.get("id")
+            if job_id:
+                company = job.get("company")
+                company_id = job.get("companyId") or (company.get("id") if isinstance(company, dict) else None)
+                rows[str(job_id)] = (job.get("title"), str(company_id) if company_id else None)
+        if not rows:
+            return {}
+
+        now = time.time()
+        try:
+            with self._connect() as db:
+                previous = self._select(db, list(rows))
+                db.executemany(
+                    "INSERT INTO seen_jobs (job_id, title, company_id, first_seen_at, last_seen_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (job_id) DO UPDATE SET last_seen_at = excluded.last_seen_at",
+                    [(job_id, title, company_id, now, now) for job_id, (title, company_id) in rows.items()],
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️ Seen-jobs write failed: {e}")
+            return {}
+        return previous
+
+    def get_many(self, job_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return the stored rows for the jobs among `job_ids` that have been seen."""
+        try:
+            with self._connect() as db:
+                return self._select(db, [str(job_id) for job_id in job_ids])
+        except sqlite3.Error as e:
+            print(f"⚠️ Seen-jobs read failed: {e}")
+            return {}
+
+    def mark_contacted(self, job_id: str, profile_id: str) -> None:
+        """Note that a manager was contacted (or queued) about this job."""
+        self._update(
+            "contacted_at = ?, contacted_profile_id = ?",
+            [(time.time(), str(profile_id), str(job_id))],
+        )
+
+    def _update(self, assignments: str, params: List[tuple]) -> None:
+        try:
+            with self._connect() as db:
+                db.executemany(f"UPDATE seen_jobs SET {assignments} WHERE job_id = ?", params)
+        except sqlite3.Error as e:
+            print(f"⚠️ Seen-jobs write failed: {e}")
+
+    @staticmethod
+    def _select(db: sqlite3.Connection, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not job_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in job_ids)
+        rows = db.execute(
+            f"SELECT * FROM seen_jobs WHERE job_id IN ({placeholders})", job_ids
+        ).fetchall()
+        return {row["job_id"]: dict(row) for row in rows}
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.db_path, timeout=10)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+
+def is_processed(row: Optional[Dict[str, Any]]) -> bool:
+    """
+    True once someone was contacted, or queued, about a job.
+
+    Finding managers alone doesn't count, so preview runs and failed sends
+    leave a job new for the next search.
+    """
+    return bool(row and row.get("contacted_at"))
+
+
+def flag_seen_jobs(
+    jobs: List[Dict[str, Any]], skip_processed: bool = False
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Record a search's jobs and mark the ones earlier searches already returned.
+
+    Jobs seen before get 'seenBefore'; those someone was already contacted
+    or queued about also get 'processed', or are dropped when
+    `skip_processed` is set.
+
+    Returns:
+        The jobs to show, and how many processed jobs were dropped
+    """
+    previous = seen_jobs.record(jobs)
+    kept = []
+    for job in jobs:
+        row = previous.get(str(job.get("jobId") or job.get("id")))
+        if row is not None:
+            job["seenBefore"] = True
+            if is_processed(row):
+                if skip_processed:
+                    continue
+                job["processed"] = True
+        kept.append(job)
+    return kept, len(jobs) - len(kept)
+
+
+seen_jobs = SeenJobsStore()
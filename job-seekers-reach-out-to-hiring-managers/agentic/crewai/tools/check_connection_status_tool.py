@@ -4,6 +4,8 @@ from typing import Any, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
+from .cache import relationship_cache
+
 
 class CheckConnectionStatusInput(BaseModel):
     """Input schema for CheckConnectionStatus tool."""
@@ -21,6 +23,25 @@ class CheckConnectionStatusTool(BaseTool):
 
     def _run(self, profileId: str) -> dict[str, Any]:
         """Execute the tool to check connection status."""
+        return self.check(profileId)
+
+    def check(self, profileId: str) -> dict[str, Any]:
+        """Return the relationship status for one profile, from cache when fresh."""
+        cached = relationship_cache.get(profileId)
+        if cached is not None:
+            return {"success": True, **cached, "cached": True}
+
+        result = self.fetch(profileId)
+        if result.get("success"):
+            relationship_cache.set(profileId, {
+                "connected": result["connected"],
+                "invitationSent": result["invitationSent"],
+                "invitationReceived": result["invitationReceived"],
+            })
+        return result
+
+    def fetch(self, profileId: str, timeout: int = 30) -> dict[str, Any]:
+        """Fetch the relationship status from the API, bypassing the cache."""
         api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
         if not api_token:
             return {
@@ -35,7 +56,7 @@ class CheckConnectionStatusTool(BaseTool):
                     "Authorization": f"Bearer {api_token}",
                     "Content-Type": "application/json",
                 },
-                timeout=30,
+                timeout=timeout,
             )
 
             if not response.ok:
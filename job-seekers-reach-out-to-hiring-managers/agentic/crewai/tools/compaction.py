@@ -0,0 +1,48 @@
+"""Token-aware compaction of tool results before they reach the model."""
+import json
+import os
+from typing import Any
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv("TOOL_OUTPUT_TOKEN_BUDGET", "1200"))
+
+JOB_FIELDS = ["jobId", "id", "title", "companyName", "companyId", "company", "location", "seenBefore", "processed"]
+LOCATION_FIELDS = ["name", "geoId", "id"]
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count (~4 characters per token) of a value as the model sees it."""
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return len(text) // 4 + 1
+
+
+def compact_result(
+    result: Any,
+    list_key: str,
+    fields: list[str],
+    max_tokens: int = DEFAULT_TOKEN_BUDGET,
+) -> Any:
+    """
+    Project a tool result down to its key fields and as many rows as fit the budget.
+
+    Scalars such as 'success' or 'total' are kept as-is. When rows are dropped,
+    a 'compaction' entry tells the model how many were shown out of how many.
+    """
+    if not isinstance(result, dict) or not isinstance(result.get(list_key), list):
+        return result
+
+    rows = [
+        {field: row[field] for field in fields if row.get(field) not in (None, "")}
+        for row in result[list_key]
+        if isinstance(row, dict)
+    ]
+    compact = {key: value for key, value in result.items() if key != list_key}
+    shown = len(rows)
+    compact[list_key] = rows
+
+    while shown > 1 and estimate_tokens(compact) > max_tokens:
+        shown = max(1, min(shown - 1, shown * max_tokens // estimate_tokens(compact)))
+        compact[list_key] = rows[:shown]
+
+    if shown < len(rows):
+        compact["compaction"] = {"shown": shown, "total": len(rows)}
+    return compact
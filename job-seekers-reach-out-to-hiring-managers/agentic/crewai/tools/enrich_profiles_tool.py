@@ -0,0 +1,30 @@
+from typing import Any, List, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+from .compaction import compact_result
+
+PROFILE_FIELDS = ["profileId", "firstName", "lastName", "headline", "location"]
+
+
+class EnrichProfilesInput(BaseModel):
+    """Input schema for EnrichProfiles tool."""
+    profiles: List[str] = Field(..., description="Profile IDs (vanity names) or LinkedIn profile URLs")
+    refresh: Optional[bool] = Field(False, description="Fetch again even if fetched recently")
+
+
+class EnrichProfilesTool(BaseTool):
+    name: str = "Enrich Profiles"
+    description: str = (
+        "Fetch details for MANY LinkedIn profiles in one call, e.g. a shortlist of managers. "
+        "Profiles are fetched concurrently and saved locally. Use this instead of calling "
+        "Fetch Profile Details once per profile."
+    )
+    args_schema: Type[BaseModel] = EnrichProfilesInput
+
+    def _run(self, profiles: List[str], refresh: Optional[bool] = False) -> dict[str, Any]:
+        """Enrich the profiles and return a compacted row per profile."""
+        # Imported here: pipelines depends on this package
+        from pipelines import enrich_profiles
+
+        return compact_result(enrich_profiles(profiles, bool(refresh)), "profiles", PROFILE_FIELDS)
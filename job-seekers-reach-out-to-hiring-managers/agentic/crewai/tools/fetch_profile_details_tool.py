@@ -1,13 +1,32 @@
 import os
+import re
 import requests
 from typing import Any, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
+from .cache import profile_store
+from .cache.profile_store import PROFILE_CACHE_TTL
+
+
+def extract_profile_id_from_url(profile_input: str) -> str:
+    """
+    Helper: Extract vanity name from LinkedIn URL.
+    Matches the regex logic from the TS script: /linkedin\.com\/in\/([^\/\?]+)/
+    """
+    if not profile_input.startswith(('http://', 'https://')):
+        return profile_input
+
+    match = re.search(r'linkedin\.com/in/([^/?]+)', profile_input)
+    if match:
+        return match.group(1)
+
+    return profile_input
+
 
 class FetchProfileDetailsInput(BaseModel):
     """Input schema for FetchProfileDetails tool."""
-    profileId: str = Field(..., description="Profile ID (vanity name from publicIdentifier or profileUrl)")
+    profileId: str = Field(..., description="Profile ID (vanity name from publicIdentifier) or LinkedIn profile URL")
 
 
 class FetchProfileDetailsTool(BaseTool):
@@ -21,6 +40,22 @@ class FetchProfileDetailsTool(BaseTool):
 
     def _run(self, profileId: str) -> dict[str, Any]:
         """Execute the tool to fetch profile details."""
+        return self.lookup(profileId)
+
+    def lookup(self, profileId: str) -> dict[str, Any]:
+        """Return profile details, from the local store when fetched recently."""
+        clean_id = extract_profile_id_from_url(profileId)
+        cached = profile_store.get(clean_id, max_age=PROFILE_CACHE_TTL)
+        if cached is not None:
+            return {"success": True, "profile": cached, "profileId": clean_id, "cached": True}
+
+        result = self.fetch(clean_id)
+        if result.get("success"):
+            profile_store.save_many({clean_id: result["profile"]})
+        return result
+
+    def fetch(self, profileId: str) -> dict[str, Any]:
+        """Fetch a profile from the API by vanity name, bypassing the store."""
         api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
         if not api_token:
             return {
@@ -49,6 +84,7 @@ class FetchProfileDetailsTool(BaseTool):
             return {
                 "success": True,
                 "profile": data.get("profile", {}),
+                "profileId": profileId,
             }
 
         except Exception as e:
@@ -0,0 +1,65 @@
+from typing import Any, List, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+from .compaction import compact_result
+
+MANAGER_FIELDS = ["profileId", "publicIdentifier", "firstName", "lastName", "headline", "profileUrl", "score"]
+
+
+class JobRef(BaseModel):
+    """A job from a previous job search."""
+    jobId: str = Field(..., description="Job ID")
+    companyId: str = Field(..., description="Numeric company ID of the job")
+    title: Optional[str] = Field(None, description="Job title, used to pick manager titles")
+    companyName: Optional[str] = Field(None, description="Company name")
+
+
+class FindHiringManagersForJobsInput(BaseModel):
+    """Input schema for FindHiringManagersForJobs tool."""
+    jobs: List[JobRef] = Field(..., description="Jobs from the job search (jobId, companyId, title)")
+    count: Optional[int] = Field(3, description="Managers to return per company")
+
+
+class FindHiringManagersForJobsTool(BaseTool):
+    name: str = "Find Hiring Managers For Jobs"
+    description: str = (
+        "Find hiring managers for MANY jobs in one call. Searches every company concurrently "
+        "and returns the managers for each job. Use this instead of calling "
+        "Search Hiring Managers once per job."
+    )
+    args_schema: Type[BaseModel] = FindHiringManagersForJobsInput
+
+    def _run(self, jobs: List[Any], count: Optional[int] = 3) -> dict[str, Any]:
+        """Execute the fan-out and return one compacted row per job."""
+        # Imported here: pipelines depends on this package
+        from pipelines import fan_out_hiring_managers
+
+        jobs = [job.model_dump() if isinstance(job, BaseModel) else dict(job) for job in jobs]
+        result = fan_out_hiring_managers(jobs, count or 3)
+        if "managers_by_job" not in result:
+            return result
+
+        rows = [
+            {
+                "jobId": job["jobId"],
+                "title": job.get("title"),
+                "companyName": job.get("companyName"),
+                "managers": [
+                    {field: m[field] for field in MANAGER_FIELDS if m.get(field) is not None}
+                    for m in result["managers_by_job"].get(str(job["jobId"]), [])
+                ],
+                **result["picks_by_job"].get(str(job["jobId"]), {}),
+            }
+            for job in jobs
+        ]
+        return compact_result(
+            {
+                "success": result["success"],
+                "jobs": rows,
+                "searches": result["searches"],
+                "failed": result["failed"],
+            },
+            "jobs",
+            ["jobId", "title", "companyName", "managers", "recommended", "tied"],
+        )
@@ -0,0 +1,86 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+from .cache import company_cache
+from .get_company_details_tool import GetCompanyDetailsTool
+
+MAX_CONCURRENCY = int(os.getenv("COMPANY_DETAILS_CONCURRENCY", "4"))
+
+# Background pre-warming shares one small pool; in-flight IDs are fetched once
+_prewarm_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="company-prewarm")
+_in_flight: set = set()
+_in_flight_lock = threading.Lock()
+
+
+class GetCompanyDetailsBatchInput(BaseModel):
+    """Input schema for GetCompanyDetailsBatch tool."""
+    companyIds: List[str] = Field(..., description="Company IDs to look up")
+
+
+class GetCompanyDetailsBatchTool(BaseTool):
+    name: str = "Get Company Details Batch"
+    description: str = (
+        "Get details for many companies in one call. Use this instead of calling "
+        "Get Company Details once per company, e.g. for all companies in a job search."
+    )
+    args_schema: Type[BaseModel] = GetCompanyDetailsBatchInput
+
+    def _run(self, companyIds: List[str]) -> dict[str, Any]:
+        """Serve cached companies locally and fetch the rest concurrently."""
+        unique_ids = list(dict.fromkeys(str(cid) for cid in companyIds if cid))
+        if not unique_ids:
+            return {"success": False, "error": "No company IDs given"}
+
+        companies = company_cache.get_many(unique_ids)
+        missing = [cid for cid in unique_ids if cid not in companies]
+        failed = {}
+        if missing:
+            lookup = GetCompanyDetailsTool().lookup
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(missing))) as pool:
+                for cid, result in zip(missing, pool.map(lookup, missing)):
+                    if result.get("success"):
+                        companies[cid] = result["company"]
+                    else:
+                        failed[cid] = result.get("error")
+
+        return {
+            "success": len(failed) < len(unique_ids),
+            "companies": {cid: companies[cid] for cid in unique_ids if cid in companies},
+            "fromCache": len(unique_ids) - len(missing),
+            "failed": failed,
+        }
+
+
+def prewarm_company_cache(company_ids: Iterable[str]) -> None:
+    """Fetch uncached companies in the background so later lookups are local."""
+    unique_ids = list(dict.fromkeys(str(cid) for cid in company_ids if cid))
+    cached = company_cache.get_many(unique_ids)
+    with _in_flight_lock:
+        todo = [cid for cid in unique_ids if cid not in cached and cid not in _in_flight]
+        _in_flight.update(todo)
+    for cid in todo:
+        _prewarm_pool.submit(_prewarm_one, cid)
+
+
+def _prewarm_one(company_id: str) -> None:
+    try:
+        GetCompanyDetailsTool().lookup(company_id)
+    finally:
+        with _in_flight_lock:
+            _in_flight.discard(company_id)
+
+
+def job_company_id(job: Dict[str, Any]) -> Optional[str]:
+    """A job's companyId, whether flat or nested under 'company'."""
+    company = job.get("company")
+    cid = job.get("companyId") or (company.get("id") if isinstance(company, dict) else None)
+    return str(cid) if cid else None
+
+
+def job_company_ids(jobs: List[Dict[str, Any]]) -> List[str]:
+    """companyId of each job that has one."""
+    return [cid for cid in map(job_company_id, jobs) if cid]
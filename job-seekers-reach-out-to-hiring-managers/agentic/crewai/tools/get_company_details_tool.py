@@ -4,6 +4,8 @@ from typing import Any, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
+from .cache import company_cache
+
 
 class GetCompanyDetailsInput(BaseModel):
     """Input schema for GetCompanyDetails tool."""
@@ -21,6 +23,21 @@ class GetCompanyDetailsTool(BaseTool):
 
     def _run(self, companyId: str) -> dict[str, Any]:
         """Execute the tool to get company details."""
+        return self.lookup(companyId)
+
+    def lookup(self, companyId: str) -> dict[str, Any]:
+        """Return company details, from cache when fresh."""
+        cached = company_cache.get(companyId)
+        if cached is not None:
+            return {"success": True, "company": cached, "cached": True}
+
+        result = self.fetch(companyId)
+        if result.get("success"):
+            company_cache.set(companyId, result["company"])
+        return result
+
+    def fetch(self, companyId: str) -> dict[str, Any]:
+        """Fetch company details from the API, bypassing the cache."""
         api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
         if not api_token:
             return {
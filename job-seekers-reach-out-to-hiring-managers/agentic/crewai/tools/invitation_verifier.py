@@ -0,0 +1,96 @@
+"""Confirm connection requests whose send call timed out, without blocking the caller."""
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from .cache import relationship_cache
+from .check_connection_status_tool import CheckConnectionStatusTool
+
+# How long to keep polling before giving up and reporting 'unverified'
+VERIFY_DEADLINE = float(os.getenv("INVITATION_VERIFY_DEADLINE", "60"))
+FIRST_POLL_DELAY = 2.0
+MAX_POLL_DELAY = 15.0
+POLL_TIMEOUT = 10
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_pending: Dict[str, Future] = {}
+_lock = threading.Lock()
+_loop_lock = threading.Lock()
+
+
+def record_status(profile_id: str, connected: bool = False, invitation_sent: bool = False) -> None:
+    """Write-through so the next status check doesn't need the API."""
+    relationship_cache.set(profile_id, {
+        "connected": connected,
+        "invitationSent": invitation_sent,
+        "invitationReceived": False,
+    })
+
+
+async def verify_invitation(
+    profile_id: str,
+    deadline: float = VERIFY_DEADLINE,
+    fetch: Callable[[str, int], Dict[str, Any]] = CheckConnectionStatusTool().fetch,
+) -> str:
+    """
+    Poll the relationship status with backoff until the invitation shows up.
+
+    Args:
+        profile_id: Profile the timed-out request was sent to
+        deadline: Seconds to keep polling (INVITATION_VERIFY_DEADLINE, default 60)
+        fetch: Uncached status lookup, called as fetch(profile_id, timeout)
+
+    Returns:
+        'sent', 'already_connected', or 'unverified' if neither showed up in time
+    """
+    loop = asyncio.get_running_loop()
+    give_up_at = loop.time() + deadline
+    delay = FIRST_POLL_DELAY
+    while (remaining := give_up_at - loop.time()) > 0:
+        await asyncio.sleep(min(delay, remaining))
+        status = await asyncio.to_thread(fetch, profile_id, POLL_TIMEOUT)
+        if status.get("success") and status.get("invitationSent"):
+            record_status(profile_id, invitation_sent=True)
+            return "sent"
+        if status.get("success") and status.get("connected"):
+            record_status(profile_id, connected=True)
+            return "already_connected"
+        delay = min(delay * 2, MAX_POLL_DELAY)
+
+    # Still unknown: make the next status check ask the API
+    relationship_cache.delete(profile_id)
+    return "unverified"
+
+
+def verify_in_background(profile_id: str) -> Future:
+    """
+    Verify a timed-out request on the shared verifier loop.
+
+    Calls for a profile already being verified join that verification. Await
+    the result from async code with `asyncio.wrap_future(...)`.
+    """
+    with _lock:
+        future = _pending.get(profile_id)
+        if future is None or future.done():
+            future = asyncio.run_coroutine_threadsafe(verify_invitation(profile_id), _verifier_loop())
+            future.add_done_callback(lambda done: _forget(profile_id, done))
+            _pending[profile_id] = future
+        return future
+
+
+def _forget(profile_id: str, future: Future) -> None:
+    with _lock:
+        if _pending.get(profile_id) is future:
+            del _pending[profile_id]
+
+
+def _verifier_loop() -> asyncio.AbstractEventLoop:
+    """One daemon event loop runs every verification, so polls interleave on their sleeps."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="invitation-verifier", daemon=True).start()
+        return _loop
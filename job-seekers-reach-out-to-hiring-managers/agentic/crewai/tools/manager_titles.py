@@ -0,0 +1,27 @@
+"""Job title → hiring-manager title mapping, shared by manager search and ranking."""
+from typing import Optional, Tuple
+
+# function: (words in a job title that mark it, manager titles that hire for it, best first)
+JOB_FUNCTIONS = {
+    "engineering": (("engineer", "developer"), ("Engineering Manager", "VP Engineering", "CTO")),
+    "sales": (("sales",), ("Sales Director", "VP Sales")),
+    "marketing": (("marketing",), ("Marketing Director", "CMO")),
+    "product": (("product",), ("Product Manager", "VP Product", "CPO")),
+}
+
+DEFAULT_MANAGER_TITLES = ("Hiring Manager", "Recruiter")
+
+
+def job_function(job_title: Optional[str]) -> Optional[str]:
+    """The function ('engineering', 'sales', ...) a job title belongs to, if recognised."""
+    lower_title = (job_title or "").lower()
+    for function, (markers, _) in JOB_FUNCTIONS.items():
+        if any(marker in lower_title for marker in markers):
+            return function
+    return None
+
+
+def manager_titles(job_title: Optional[str]) -> Tuple[str, ...]:
+    """Titles of the people who hire for `job_title`, best first."""
+    function = job_function(job_title)
+    return JOB_FUNCTIONS[function][1] if function else DEFAULT_MANAGER_TITLES
@@ -0,0 +1,32 @@
+from typing import Any, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+
+class QueueConnectionRequestInput(BaseModel):
+    """Input schema for QueueConnectionRequest tool."""
+    profileId: str = Field(..., description="Profile ID (vanity name)")
+    customMessage: str = Field(..., description="Custom message to include with the connection request (max 300 characters)")
+    jobId: Optional[str] = Field(None, description="The job this outreach is about")
+
+
+class QueueConnectionRequestTool(BaseTool):
+    name: str = "Queue Connection Request"
+    description: str = (
+        "Queue a LinkedIn connection request to be sent later at a safe pace, instead of sending it now. "
+        "Use this when contacting many managers. Queueing a profile that is already queued does nothing, "
+        "and the queue checks connection status before sending."
+    )
+    args_schema: Type[BaseModel] = QueueConnectionRequestInput
+
+    def _run(self, profileId: str, customMessage: str, jobId: Optional[str] = None) -> dict[str, Any]:
+        """Execute the tool to add a request to the outreach queue."""
+        # Imported here: pipelines depends on this package
+        from pipelines import get_outreach_queue
+
+        try:
+            queue = get_outreach_queue()
+            queued = queue.enqueue(profileId, customMessage, jobId, source="agent")
+            return {"success": True, "profileId": profileId, "queued": queued, "stats": queue.stats()}
+        except Exception as e:
+            return {"success": False, "error": f"Could not queue request: {str(e)}"}
@@ -3,6 +3,8 @@ import requests
 from typing import Any, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
+from .compaction import compact_result, LOCATION_FIELDS
+from .cache import geo_index
 
 
 class SearchGeoLocationInput(BaseModel):
@@ -19,7 +21,16 @@ class SearchGeoLocationTool(BaseTool):
     args_schema: Type[BaseModel] = SearchGeoLocationInput
 
     def _run(self, keywords: str) -> dict[str, Any]:
-        """Execute the tool to search for geographic locations."""
+        """Execute the tool and return a compacted result for the agent."""
+        return compact_result(self.search(keywords), "locations", LOCATION_FIELDS)
+
+    def search(self, keywords: str) -> dict[str, Any]:
+        """Search for geographic locations and return the full API result."""
+        # Known locations are served from the local index without an API call
+        known = geo_index.search(keywords)
+        if known:
+            return {"success": True, "locations": known, "cached": True}
+
         api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
         if not api_token:
             return {
@@ -45,9 +56,11 @@ class SearchGeoLocationTool(BaseTool):
                 }
 
             data = response.json()
+            locations = data.get("locations", [])
+            geo_index.learn(keywords, locations)
             return {
                 "success": True,
-                "locations": data.get("locations", []),
+                "locations": locations,
             }
 
         except Exception as e:
@@ -4,6 +4,14 @@ from typing import Any, Optional, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
+from .manager_ranker import rank_result
+from .manager_titles import manager_titles
+
+
+def manager_search_title(job_title: Optional[str] = None) -> str:
+    """People-search keywords for the managers who hire for `job_title`."""
+    return " OR ".join(manager_titles(job_title))
+
 
 class SearchHiringManagersInput(BaseModel):
     """Input schema for SearchHiringManagers tool."""
@@ -32,6 +40,17 @@ class SearchHiringManagersTool(BaseTool):
         connectionDegree: Optional[list[str]] = None,
     ) -> dict[str, Any]:
         """Execute the tool to search for hiring managers."""
+        return self.search(companyId, jobTitle, managerTitle, count, connectionDegree)
+
+    def search(
+        self,
+        companyId: str,
+        jobTitle: Optional[str] = None,
+        managerTitle: Optional[str] = None,
+        count: Optional[int] = 5,
+        connectionDegree: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        """Search for hiring managers at a company and return them best first."""
         api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
         if not api_token:
             return {
@@ -40,15 +59,7 @@ class SearchHiringManagersTool(BaseTool):
             }
 
         # Determine manager title based on job title if not provided
-        search_title = managerTitle or "Hiring Manager OR Recruiter"
-        if jobTitle and not managerTitle:
-            lower_title = jobTitle.lower()
-            if "engineer" in lower_title:
-                search_title = "Engineering Manager OR VP Engineering OR CTO"
-            elif "sales" in lower_title:
-                search_title = "Sales Director OR VP Sales"
-            elif "marketing" in lower_title:
-                search_title = "Marketing Director OR CMO"
+        search_title = managerTitle or manager_search_title(jobTitle)
 
         try:
             response = requests.post(
@@ -75,10 +86,11 @@ class SearchHiringManagersTool(BaseTool):
                 }
 
             data = response.json()
-            return {
+            # Rank locally so the agent doesn't spend a turn choosing
+            return rank_result({
                 "success": True,
                 "people": data.get("people", []),
-            }
+            }, jobTitle)
 
         except Exception as e:
             return {"success": False, "error": f"Error searching hiring managers: {str(e)}"}
\ No newline at end of file
@@ -0,0 +1,131 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+from .compaction import compact_result, JOB_FIELDS
+from .search_jobs_tool import SearchJobsTool
+
+PAGE_SIZE = 25
+MAX_JOBS = 500
+MAX_CONCURRENCY = int(os.getenv("JOB_SEARCH_CONCURRENCY", "4"))
+
+
+class SearchJobsAllInput(BaseModel):
+    """Input schema for SearchJobsAll tool."""
+    keywords: str = Field(..., description="Job search keywords (e.g., 'Software Engineer')")
+    count: Optional[int] = Field(100, description="Number of jobs to return (max 500)")
+    locationId: Optional[str] = Field(None, description="Geographic location ID from search-geo-location")
+    datePosted: Optional[str] = Field("past-week", description="Date filter: 'past-24-hours', 'past-week', 'past-month'")
+    skipProcessed: Optional[bool] = Field(
+        False, description="Leave out jobs someone was already contacted or queued about"
+    )
+
+
+class SearchJobsAllTool(BaseTool):
+    name: str = "Search All LinkedIn Jobs"
+    description: str = (
+        "Search for MANY LinkedIn jobs (more than 25) in one call. Fetches all pages in parallel "
+        "and returns each job once. Use this instead of paging Search LinkedIn Jobs."
+    )
+    args_schema: Type[BaseModel] = SearchJobsAllInput
+
+    def _run(
+        self,
+        keywords: str,
+        count: Optional[int] = 100,
+        locationId: Optional[str] = None,
+        datePosted: Optional[str] = "past-week",
+        skipProcessed: Optional[bool] = False,
+    ) -> dict[str, Any]:
+        """Execute the tool and return a compacted result for the agent."""
+        result = self.search(keywords, count, locationId, datePosted, skipProcessed)
+        return compact_result(result, "jobs", JOB_FIELDS)
+
+    def search(
+        self,
+        keywords: str,
+        count: Optional[int] = 100,
+        locationId: Optional[str] = None,
+        datePosted: Optional[str] = "past-week",
+        skipProcessed: Optional[bool] = False,
+    ) -> dict[str, Any]:
+        """Fetch every page and return the full, de-duplicated result."""
+        count = count or 100
+        pages = sorted(
+            iter_job_pages(keywords, count, locationId, datePosted, skip_processed=bool(skipProcessed)),
+            key=lambda p: p["start"],
+        )
+        failed = {page["start"]: page["error"] for page in pages if not page["success"]}
+        if len(failed) == len(pages):
+            return {"success": False, "error": next(iter(failed.values()))}
+
+        jobs = [job for page in pages if page["success"] for job in page["jobs"]]
+        result = {
+            "success": True,
+            "jobs": jobs[:count],
+            "total": next((page["total"] for page in pages if page.get("total") is not None), None),
+            "pages": len(pages),
+            "failed_pages": sorted(failed),
+        }
+        if skipProcessed:
+            result["skippedProcessed"] = sum(page.get("skippedProcessed", 0) for page in pages)
+        return result
+
+
+def iter_job_pages(
+    keywords: str,
+    count: int = 100,
+    locationId: Optional[str] = None,
+    datePosted: Optional[str] = "past-week",
+    max_concurrency: int = MAX_CONCURRENCY,
+    skip_processed: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch every page needed for `count` jobs concurrently, yielding pages as they arrive.
+
+    A job already yielded by another page is dropped, so each jobId appears once.
+    Pages still pending are cancelled if the caller stops iterating.
+
+    Args:
+        max_concurrency: Pages in flight at once (JOB_SEARCH_CONCURRENCY, default 4)
+        skip_processed: Passed to every page's search
+
+    Yields:
+        Dicts with 'start' (page offset), 'success', and 'jobs' (new jobs only) and 'total', or 'error'
+    """
+    count = max(1, min(count, MAX_JOBS))
+    starts = range(0, count, PAGE_SIZE)
+    search = SearchJobsTool().search
+    seen = set()
+    pool = ThreadPoolExecutor(max_workers=min(max_concurrency, len(starts)), thread_name_prefix="job-pages")
+    try:
+        futures = {
+            pool.submit(
+                search, keywords, min(PAGE_SIZE, count - start), start, locationId, datePosted, skip_processed
+            ): start
+            for start in starts
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            if not result.get("success"):
+                yield {"start": futures[future], "success": False, "error": result.get("error")}
+                continue
+            jobs = []
+            for job in result.get("jobs") or []:
+                job_id = str(job.get("jobId") or job.get("id") or "")
+                if job_id in seen:
+                    continue
+                if job_id:
+                    seen.add(job_id)
+                jobs.append(job)
+            yield {
+                "start": futures[future],
+                "success": True,
+                "jobs": jobs,
+                "total": result.get("total"),
+                "skippedProcessed": result.get("skippedProcessed", 0),
+            }
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -3,6 +3,9 @@ import requests
 from typing import Any, Optional, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
+from .cache import flag_seen_jobs
+from .compaction import compact_result, JOB_FIELDS
+from .get_company_details_batch_tool import prewarm_company_cache, job_company_ids
 
 
 class SearchJobsInput(BaseModel):
@@ -12,13 +15,17 @@ class SearchJobsInput(BaseModel):
     start: Optional[int] = Field(0, description="Pagination offset")
     locationId: Optional[str] = Field(None, description="Geographic location ID from search-geo-location")
     datePosted: Optional[str] = Field("past-week", description="Date filter: 'past-24-hours', 'past-week', 'past-month'")
+    skipProcessed: Optional[bool] = Field(
+        False, description="Leave out jobs someone was already contacted or queued about"
+    )
 
 
 class SearchJobsTool(BaseTool):
     name: str = "Search LinkedIn Jobs"
     description: str = (
         "Search for LinkedIn jobs by keywords and location. "
-        "Use this tool to find relevant job postings based on job title keywords and location."
+        "Use this tool to find relevant job postings based on job title keywords and location. "
+        "Jobs returned by an earlier search are marked 'seenBefore'; already handled ones 'processed'."
     )
     args_schema: Type[BaseModel] = SearchJobsInput
 
@@ -29,8 +36,22 @@ class SearchJobsTool(BaseTool):
         start: Optional[int] = 0,
         locationId: Optional[str] = None,
         datePosted: Optional[str] = "past-week",
+        skipProcessed: Optional[bool] = False,
+    ) -> dict[str, Any]:
+        """Execute the tool and return a compacted result for the agent."""
+        result = self.search(keywords, count, start, locationId, datePosted, skipProcessed)
+        return compact_result(result, "jobs", JOB_FIELDS)
+
+    def search(
+        self,
+        keywords: str,
+        count: Optional[int] = 5,
+        start: Optional[int] = 0,
+        locationId: Optional[str] = None,
+        datePosted: Optional[str] = "past-week",
+        skipProcessed: Optional[bool] = False,
     ) -> dict[str, Any]:
-        """Execute the tool to search for LinkedIn jobs."""
+        """Search for LinkedIn jobs and return the full API result, with seen jobs flagged."""
         api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
         if not api_token:
             return {
@@ -67,11 +88,17 @@ class SearchJobsTool(BaseTool):
                 }
 
             data = response.json()
-            return {
+            jobs, skipped = flag_seen_jobs(data.get("jobs", []), bool(skipProcessed))
+            # Hiring-manager and company lookups usually follow; warm the cache now
+            prewarm_company_cache(job_company_ids(jobs))
+            result = {
                 "success": True,
-                "jobs": data.get("jobs", []),
+                "jobs": jobs,
                 "total": data.get("total"),
             }
+            if skipProcessed:
+                result["skippedProcessed"] = skipped
+            return result
 
         except Exception as e:
             return {"success": False, "error": f"Error searching jobs: {str(e)}"}
\ No newline at end of file
@@ -1,15 +1,19 @@
 import os
 import requests
-import time
-from typing import Any, Type
+from typing import Any, Optional, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 
+from .cache import relationship_cache, seen_jobs
+from .invitation_verifier import record_status, verify_in_background
+from .message_templates import fit_message
+
 
 class SendConnectionRequestInput(BaseModel):
     """Input schema for SendConnectionRequest tool."""
     profileId: str = Field(..., description="Profile ID (vanity name)")
     customMessage: str = Field(..., description="Custom message to include with the connection request (max 300 characters)")
+    jobId: Optional[str] = Field(None, description="The job this outreach is about")
 
 
 class SendConnectionRequestTool(BaseTool):
@@ -18,11 +22,12 @@ class SendConnectionRequestTool(BaseTool):
         "Send a LinkedIn connection request with a custom message. "
         "IMPORTANT: Always check connection status first using CheckConnectionStatusTool before sending. "
         "Do not send if already connected or if an invitation was already sent. "
-        "The message should be personalized and reference the specific job opportunity."
+        "The message should be personalized and reference the specific job opportunity. "
+        "Pass the jobId so later searches with skipProcessed leave that job out."
     )
     args_schema: Type[BaseModel] = SendConnectionRequestInput
 
-    def _run(self, profileId: str, customMessage: str) -> dict[str, Any]:
+    def _run(self, profileId: str, customMessage: str, jobId: Optional[str] = None) -> dict[str, Any]:
         """Execute the tool to send a connection request."""
         api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
         if not api_token:
@@ -32,8 +37,7 @@ class SendConnectionRequestTool(BaseTool):
             }
 
         # Truncate message if too long (LinkedIn limit is typically 300 characters)
-        if len(customMessage) > 300:
-            customMessage = customMessage[:297] + "..."
+        customMessage = fit_message(customMessage)
 
         try:
             response = requests.post(
@@ -58,6 +62,9 @@ class SendConnectionRequestTool(BaseTool):
                 }
 
             data = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+            record_status(profileId, invitation_sent=True)
+            if jobId:
+                seen_jobs.mark_contacted(jobId, profileId)
             return {
                 "success": True,
                 "message": data.get("message", "Connection request sent successfully"),
@@ -65,44 +72,16 @@ class SendConnectionRequestTool(BaseTool):
             }
 
         except requests.exceptions.Timeout:
-            # Timeout occurred - verify if request actually went through
-            time.sleep(2)
-            
-            try:
-                # Check connection status to verify if request succeeded
-                status_response = requests.get(
-                    f"https://api.connectsafely.ai/linkedin/relationship/{profileId}",
-                    headers={
-                        "Authorization": f"Bearer {api_token}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=10,
-                )
-                
-                if status_response.ok:
-                    status_data = status_response.json()
-                    if status_data.get("invitationSent", False):
-                        # Request actually succeeded despite timeout
-                        return {
-                            "success": True,
-                            "message": "Connection request sent successfully (verified after timeout)",
-                            "profileId": profileId,
-                        }
-                    elif status_data.get("connected", False):
-                        return {
-                            "success": True,
-                            "message": "Already connected",
-                            "profileId": profileId,
-                        }
-            except:
-                pass
-            
-            # Couldn't verify - return success with note
+            # The request may still have gone through; confirm it off this thread
+            relationship_cache.delete(profileId)
+            verify_in_background(profileId)
+            if jobId:
+                seen_jobs.mark_contacted(jobId, profileId)
             return {
                 "success": True,
-                "message": "Connection request likely sent (timeout occurred but request may have succeeded)",
+                "status": "unverified",
+                "message": "Connection request timed out and may have been sent. It is being verified; check the status before resending.",
                 "profileId": profileId,
-                "note": "Request timed out - check LinkedIn to confirm",
             }
 
         except Exception as e:
@@ -0,0 +1,46 @@
+from typing import Any, List, Optional, Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool
+
+
+class ManagerRef(BaseModel):
+    """A manager from a previous manager search, and the job to write about."""
+    profileId: str = Field(..., description="Profile ID (vanity name)")
+    name: Optional[str] = Field(None, description="Manager's full name")
+    headline: Optional[str] = Field(None, description="Manager's headline")
+    jobTitle: Optional[str] = Field(None, description="Job the message is about")
+    companyName: Optional[str] = Field(None, description="Company of that job")
+
+
+class WriteConnectionMessagesInput(BaseModel):
+    """Input schema for WriteConnectionMessages tool."""
+    managers: List[ManagerRef] = Field(..., description="Managers to write to, each with its job title and company")
+
+
+class WriteConnectionMessagesTool(BaseTool):
+    name: str = "Write Connection Messages"
+    description: str = (
+        "Write personalized connection messages for MANY managers in one call. "
+        "Returns a message (max 300 characters) per profile ID. Use this instead of "
+        "writing each message yourself, then send or queue each request with its message."
+    )
+    args_schema: Type[BaseModel] = WriteConnectionMessagesInput
+
+    def _run(self, managers: List[Any]) -> dict[str, Any]:
+        """Execute the tool to write every message with one model call."""
+        # Imported here: both packages depend on this one
+        from agents.agents import JobSearchAgents
+        from pipelines import MessageTarget, write_messages
+
+        targets = []
+        for manager in managers:
+            ref = manager if isinstance(manager, ManagerRef) else ManagerRef(**manager)
+            targets.append(MessageTarget(
+                profile_id=ref.profileId,
+                name=(ref.name or "").strip(),
+                headline=ref.headline or "",
+                job_title=ref.jobTitle,
+                company_name=ref.companyName,
+            ))
+        messages = write_messages(JobSearchAgents._get_llm(), targets)
+        return {"success": True, "messages": messages}
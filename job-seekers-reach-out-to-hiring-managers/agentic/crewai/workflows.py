@@ -1,18 +1,25 @@
+from typing import Any, Optional
+
 from crewai import Crew, Process, Task
 from agents.agents import JobSearchAgents
+from conversation_context import ConversationContext, parse_structured
 
 
 class JobSearchWorkflows:
     """Handles command-based task execution."""
 
-    def __init__(self):
+    def __init__(self, step_callback=None, task_callback=None, conversation: Optional[ConversationContext] = None):
         self.agent = JobSearchAgents.unified_agent()
+        # Called after every agent step / finished task so the UI can stream progress
+        self.step_callback = step_callback
+        self.task_callback = task_callback
+        # Earlier turns within a fixed token budget; pass the session's to keep it across commands
+        self.conversation = conversation or ConversationContext()
 
     def execute_command(self, command: str, context: str | None = None) -> any:
         """Execute a user command."""
-        # Limit context size to prevent overwhelming the model
-        if context and len(context) > 1500:
-            context = context[-1500:]
+        # Earlier turns summarized to the token budget, with their IDs verbatim
+        context = self.conversation.render(extra=context)
         
         # Build task description
         if context:
@@ -52,7 +59,16 @@ Use context data if needed."""
                 process=Process.sequential,
                 verbose=True,
                 max_rpm=10,
+                step_callback=self._on_step,
+                task_callback=self.task_callback,
             ).kickoff()
+            usage = getattr(result, "token_usage", None)
+            self.conversation.record_turn(
+                command,
+                str(result),
+                prompt_tokens=getattr(usage, "prompt_tokens", None),
+                completion_tokens=getattr(usage, "completion_tokens", None),
+            )
             print(f"\n✅ Completed!\n")
             return result
         except Exception as e:
@@ -62,3 +78,12 @@ Use context data if needed."""
                 "error": str(e),
                 "command": command
             }
+
+    def _on_step(self, step: Any) -> None:
+        """Keep the IDs from each tool result, then pass the step on to the UI."""
+        tool = getattr(step, "tool", None)
+        result = parse_structured(getattr(step, "result", None)) if tool else None
+        if isinstance(result, dict):
+            self.conversation.record_tool_result(tool, {}, result)
+        if self.step_callback:
+            self.step_callback(step)
@@ -1,7 +1,8 @@
 import os
+from contextlib import closing
+
 import streamlit as st
 from dotenv import load_dotenv
-from autogen_client import LinkedInExportClient
 
 # Disable AutoGen telemetry if available
 os.environ.setdefault("AUTOGEN_TELEMETRY_OPT_OUT", "true")
@@ -19,6 +20,45 @@ def check_env():
     return True
 
 
+def get_agent_client():
+    """Return this session's client, creating it on first use."""
+    if "agent_client" not in st.session_state:
+        # Imported here so the UI renders before AutoGen is loaded
+        from autogen_client import LinkedInExportClient
+
+        with st.spinner("Initializing Agent..."):
+            st.session_state.agent_client = LinkedInExportClient()
+            print("Agent initialized in Session State")
+    return st.session_state.agent_client
+
+
+def render_stream(events) -> str:
+    """Render streamed agent events live and return the final answer."""
+    status = st.status("Agent working...", expanded=False)
+    answer = st.empty()
+    tokens = ""
+    final = ""
+
+    # closing() cancels the run if Streamlit interrupts the script (e.g. Stop button)
+    with closing(events):
+        for event in events:
+            kind = event["type"]
+            if kind == "token":
+                tokens += event["content"]
+                answer.markdown(tokens + "▌")
+            elif kind in ("tool_call", "tool_result"):
+                status.write(event["content"])
+                # Tokens before a tool call are the model thinking aloud
+                tokens = ""
+                answer.empty()
+            elif kind == "final":
+                final = event["content"]
+
+    status.update(label="Done", state="complete")
+    answer.markdown(final)
+    return final
+
+
 def main():
     st.set_page_config(
         page_title="LinkedIn to Sheets Export (AutoGen)",
@@ -37,12 +77,6 @@ def main():
     if "context" not in st.session_state:
         st.session_state.context = ""
 
-    # Initialize the Agent ONCE and persist it
-    if "agent_client" not in st.session_state:
-        with st.spinner("Initializing Agent..."):
-            st.session_state.agent_client = LinkedInExportClient()
-            print("Agent initialized in Session State")
-
     # Display chat history
     st.subheader("Command Interface")
 
@@ -95,7 +129,8 @@ def main():
         if st.button("Clear History & Reset"):
             st.session_state.messages = []
             st.session_state.context = ""
-            st.session_state.agent_client = LinkedInExportClient()
+            # A fresh client is created on the next command
+            st.session_state.pop("agent_client", None)
             st.rerun()
 
         st.divider()
@@ -118,39 +153,34 @@ def main():
         st.chat_message("user").write(command)
 
         with st.chat_message("assistant"):
-            with st.spinner("Agent working..."):
-                try:
-                    client = st.session_state.agent_client
-
-                    result = client.execute(
-                        command=command,
-                        context=st.session_state.context if st.session_state.context else None
-                    )
-
-                    result_str = str(result.get("result", ""))
-
-                    # Update context (keep last 2000 chars)
-                    if len(st.session_state.context) > 2000:
-                        st.session_state.context = st.session_state.context[-2000:]
-
-                    st.session_state.context += f"\n\nUser: {command}\nAgent: {result_str}\n"
-
-                    # Display Result
-                    st.markdown(result_str)
-
-                    # Save to history
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": result_str
-                    })
-
-                except Exception as e:
-                    error_msg = f"Error: {str(e)}"
-                    st.error(error_msg)
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_msg
-                    })
+            try:
+                client = get_agent_client()
+
+                # Stream tool progress and tokens as the agent works
+                result_str = render_stream(client.stream(
+                    command=command,
+                    context=st.session_state.context if st.session_state.context else None
+                ))
+
+                # Update context (keep last 2000 chars)
+                if len(st.session_state.context) > 2000:
+                    st.session_state.context = st.session_state.context[-2000:]
+
+                st.session_state.context += f"\n\nUser: {command}\nAgent: {result_str}\n"
+
+                # Save to history
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": result_str
+                })
+
+            except Exception as e:
+                error_msg = f"Error: {str(e)}"
+                st.error(error_msg)
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": error_msg
+                })
 
 
 if __name__ == "__main__":
@@ -3,20 +3,26 @@ LinkedIn Export Assistant - Main orchestration class.
 Searches LinkedIn profiles and exports to Google Sheets or JSON.
 """
 import os
-import asyncio
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+from autogen_agentchat.base import TaskResult
 
 from tools import (
     search_geo_location,
     search_people,
     export_to_sheets,
-    export_to_json
+    export_to_json,
+    record_tool,
+    ToolResultStore,
 )
 
 from .config.agent_factory import create_assistant_agent
-from .config.response_processor import clean_response
+from .config.response_processor import clean_response, ends_with_tool_output, format_tool_results
 from .config.memory_manager import MemoryManager
-from .config.execution_utils import is_raw_output, get_continuation_instruction
+from .config.execution_utils import get_continuation_instruction
+from .config.tool_results import ToolResultCollector
+from .config.stream_events import to_progress_event
+from .config.async_bridge import iterate_async, run_sync
 
 
 class LinkedInExportAssistant:
@@ -28,11 +34,16 @@ class LinkedInExportAssistant:
             raise ValueError("GEMINI_API_KEY not found.")
 
         self.model = model
+        # Full tool results are kept here so runs get typed results, not reply text
+        self.results = ToolResultStore()
         self.tools = [
-            search_geo_location,
-            search_people,
-            export_to_sheets,
-            export_to_json
+            record_tool(tool, self.results)
+            for tool in (
+                search_geo_location,
+                search_people,
+                export_to_sheets,
+                export_to_json,
+            )
         ]
 
         self.memory = MemoryManager()
@@ -40,45 +51,71 @@ class LinkedInExportAssistant:
         self.conversation_history = []
         print(f"LinkedInExportAssistant initialized with {model}")
 
-    async def execute_async(self, command: str, context: Optional[str] = None) -> str:
-        """Execute command asynchronously with context management."""
+    async def execute_stream(
+        self, command: str, context: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, str]]:
+        """Execute command, yielding progress events and finally a 'final' event."""
         if self.memory.should_reset_memory(command):
             self.memory.reset_memory()
 
         memory_context = self.memory.build_memory_context(command)
         full_prompt = f"{context or ''}\n{memory_context}\nUSER REQUEST: {command}"
 
-        max_turns = 8
+        # One run already loops model -> (parallel) tools -> model until the model
+        # replies; another run is only needed if it used up its tool rounds
+        max_turns = 3
         current_turn = 0
 
         while current_turn < max_turns:
             try:
-                result = await self.assistant.run(task=full_prompt)
-                response_text = clean_response(result)
-                self.memory.extract_search_results(response_text)
-
-                if is_raw_output(response_text):
-                    instruction = get_continuation_instruction(response_text)
-                    full_prompt = f"TOOL OUTPUT: {response_text}\n\nNEXT STEP: {instruction}"
-                    current_turn += 1
-                    continue
+                result = None
+                tool_results = ToolResultCollector(self.results)
+                async for item in self.assistant.run_stream(task=full_prompt):
+                    if isinstance(item, TaskResult):
+                        result = item
+                        continue
+                    tool_results.observe(item)
+                    if (event := to_progress_event(item)) is not None:
+                        yield event
+                self.memory.record_tool_results(tool_results.results)
+
+                if ends_with_tool_output(result):
+                    # Finished exports are reported directly; other results go back to the model
+                    response_text = format_tool_results(tool_results.results)
+                    if response_text is None:
+                        # The results are already in the agent's context; don't send them twice
+                        instruction = get_continuation_instruction(tool_results.results)
+                        full_prompt = f"NEXT STEP: {instruction}"
+                        current_turn += 1
+                        continue
+                else:
+                    response_text = clean_response(result)
 
                 self.conversation_history.append({"role": "user", "content": command})
                 self.conversation_history.append({"role": "assistant", "content": response_text})
-                return response_text
+                yield {"type": "final", "content": response_text}
+                return
 
             except Exception as e:
-                return f"Error: {str(e)}"
+                yield {"type": "final", "content": f"Error: {str(e)}"}
+                return
 
-        return "Stopped after max turns."
+        yield {"type": "final", "content": "Stopped after max turns."}
+
+    async def execute_async(self, command: str, context: Optional[str] = None) -> str:
+        """Execute command asynchronously with context management."""
+        response_text = ""
+        async for event in self.execute_stream(command, context):
+            if event["type"] == "final":
+                response_text = event["content"]
+        return response_text
 
     def execute_command(self, command: str, context: Optional[str] = None) -> str:
-        """Execute command synchronously."""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                return loop.create_task(self.execute_async(command, context))
-            else:
-                return loop.run_until_complete(self.execute_async(command, context))
-        except RuntimeError:
-            return asyncio.run(self.execute_async(command, context))
+        """Execute command synchronously on the shared event loop."""
+        return run_sync(self.execute_async(command, context))
+
+    def stream_command(
+        self, command: str, context: Optional[str] = None
+    ) -> Iterator[Dict[str, str]]:
+        """Execute command synchronously, yielding progress events as they arrive."""
+        return iterate_async(lambda: self.execute_stream(command, context))
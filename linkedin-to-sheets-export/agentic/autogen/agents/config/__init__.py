@@ -1,14 +1,24 @@
 """AutoGen Agent Configuration Modules."""
 
 from .agent_factory import create_assistant_agent
-from .response_processor import clean_response
+from .response_processor import clean_response, ends_with_tool_output, format_tool_results
 from .memory_manager import MemoryManager
-from .execution_utils import is_raw_output, get_continuation_instruction
+from .execution_utils import get_continuation_instruction
+from .tool_results import ToolResult, ToolResultCollector
+from .stream_events import to_progress_event
+from .async_bridge import get_event_loop, iterate_async, run_sync
 
 __all__ = [
     "create_assistant_agent",
     "clean_response",
+    "ends_with_tool_output",
+    "format_tool_results",
     "MemoryManager",
-    "is_raw_output",
     "get_continuation_instruction",
+    "ToolResult",
+    "ToolResultCollector",
+    "to_progress_event",
+    "get_event_loop",
+    "iterate_async",
+    "run_sync",
 ]
@@ -1,9 +1,14 @@
 """Agent Factory - Creates and configures the AutoGen assistant agent."""
 
+import os
+
 from autogen_agentchat.agents import AssistantAgent
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_core.models import ModelInfo
 
+# Model -> tools -> model rounds one agent run may take before handing back
+MAX_TOOL_ITERATIONS = int(os.getenv("AGENT_MAX_TOOL_ITERATIONS", "6"))
+
 
 SYSTEM_PROMPT = """You are a LinkedIn Export Assistant that helps users search for LinkedIn profiles and export results to Google Sheets or JSON files.
 
@@ -23,6 +28,7 @@ SYSTEM_PROMPT = """You are a LinkedIn Export Assistant that helps users search f
 - Show a count and brief summary of results before exporting
 - For Google Sheets export, ensure the user has set up credentials
 - Provide the spreadsheet URL or file path after successful export
+- Independent calls (e.g. exporting to Google Sheets and JSON) go in the same turn; they run at the same time
 
 ## Response Format
 - Keep responses concise and actionable
@@ -35,6 +41,9 @@ def create_assistant_agent(api_key: str, model: str, tools: list) -> AssistantAg
     """
     Create an AutoGen AssistantAgent with the specified model and tools.
 
+    Tool calls the model makes in one turn run concurrently and their results
+    go back together; a run takes up to MAX_TOOL_ITERATIONS such rounds.
+
     Args:
         api_key: Google Gemini API key
         model: Model name (e.g., "gemini-2.5-pro")
@@ -54,6 +63,7 @@ def create_assistant_agent(api_key: str, model: str, tools: list) -> AssistantAg
             family="gemini",
             structured_output=False,
         ),
+        parallel_tool_calls=True,
     )
 
     agent = AssistantAgent(
@@ -61,6 +71,10 @@ def create_assistant_agent(api_key: str, model: str, tools: list) -> AssistantAg
         model_client=model_client,
         tools=tools,
         system_message=SYSTEM_PROMPT,
+        model_client_stream=True,
+        max_tool_iterations=MAX_TOOL_ITERATIONS,
+        # The model's own next turn summarizes results; a separate reflection call would repeat it
+        reflect_on_tool_use=False,
     )
 
     return agent
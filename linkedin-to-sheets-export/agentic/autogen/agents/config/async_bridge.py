@@ -0,0 +1,86 @@
+"""Bridge between the synchronous Streamlit script and AutoGen's async API."""
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    The process-wide event loop, running on its own daemon thread.
+
+    Every agent run is submitted here, so model clients and their connection
+    pools stay bound to one live loop across Streamlit reruns and sessions.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="autogen-loop", daemon=True).start()
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the shared loop and wait for its result."""
+    loop = get_event_loop()
+    if _on_loop_thread(loop):
+        coro.close()
+        raise RuntimeError("run_sync() called from the shared loop; await the coroutine instead")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except BaseException:
+        # Interrupted or timed out: don't leave the run going on its own
+        future.cancel()
+        raise
+
+
+def iterate_async(make_stream: Callable[[], AsyncIterator[T]]) -> Iterator[T]:
+    """
+    Consume an async iterator from synchronous code, yielding items as they arrive.
+
+    The iterator runs on the shared loop. Closing the returned generator early
+    (for example when Streamlit reruns the script) cancels the run.
+    """
+    items: "queue.Queue" = queue.Queue()
+
+    async def pump():
+        try:
+            async for item in make_stream():
+                items.put(item)
+        except Exception as e:
+            items.put(_Failure(e))
+        finally:
+            items.put(_DONE)
+
+    future = asyncio.run_coroutine_threadsafe(pump(), get_event_loop())
+
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        future.cancel()
+
+
+def _on_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
@@ -1,60 +1,39 @@
 """Execution Utilities - Helper functions for agent execution."""
 
 import re
+from typing import List
 
+from .tool_results import ToolResult
 
-def is_raw_output(response_text: str) -> bool:
-    """
-    Check if response is raw tool output that needs further processing.
-
-    Args:
-        response_text: The agent's response text
 
-    Returns:
-        True if the response appears to be raw tool output
+def get_continuation_instruction(results: List[ToolResult]) -> str:
     """
-    # Indicators of raw JSON/dict output
-    raw_indicators = [
-        response_text.strip().startswith("{"),
-        response_text.strip().startswith("["),
-        "'success': True" in response_text,
-        '"success": true' in response_text.lower(),
-        "'error':" in response_text and len(response_text) < 500,
-    ]
-
-    return any(raw_indicators)
-
-
-def get_continuation_instruction(response_text: str) -> str:
-    """
-    Generate instruction for the agent to continue processing raw output.
+    Generate instruction for the agent to continue from the tool results it stopped at.
 
     Args:
-        response_text: The raw tool output
+        results: Typed tool results from the finished run
 
     Returns:
         Instruction string for the next turn
     """
-    if "error" in response_text.lower():
+    last = results[-1] if results else None
+    if last is None:
+        return "Please process this output and provide a clear response to the user."
+
+    if not last.succeeded:
         return "The tool returned an error. Please explain this to the user and suggest alternatives."
 
-    if "people" in response_text.lower() or "profiles" in response_text.lower():
+    if last.name == "search_people":
         return (
             "Parse these search results and present a clear summary to the user. "
             "Include: total count, a few example profiles (name, title, company), "
             "and ask if they want to export to Google Sheets or JSON."
         )
 
-    if "rows_exported" in response_text.lower() or "records_exported" in response_text.lower():
-        return (
-            "The export was successful. Summarize the results for the user "
-            "including the number of records and the destination (URL or file path)."
-        )
-
-    if "spreadsheet_url" in response_text.lower():
+    if last.name == "export_to_sheets":
         return "Provide the Google Sheets URL to the user and confirm the export was successful."
 
-    if "file_path" in response_text.lower():
+    if last.name == "export_to_json":
         return "Provide the JSON file path to the user and confirm the export was successful."
 
     return "Please process this output and provide a clear response to the user."
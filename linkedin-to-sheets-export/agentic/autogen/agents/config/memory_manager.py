@@ -1,8 +1,9 @@
 """Memory Manager - Handles search results and context persistence."""
 
-import re
 from typing import List, Dict, Any, Optional
 
+from .tool_results import ToolResult
+
 
 class MemoryManager:
     """Manages search results and conversation context."""
@@ -71,15 +72,17 @@ class MemoryManager:
         self.last_search_params = {}
         self.export_history = []
 
-    def extract_search_results(self, response_text: str):
+    def record_tool_results(self, results: List[ToolResult]):
         """
-        Extract search results from response if present.
-        This is called after each agent response to keep memory updated.
+        Update memory from the typed results of a run's tool calls.
+        This is called after each agent run to keep memory updated.
         """
-        # Look for success indicators in response
-        if "profiles found" in response_text.lower() or "people found" in response_text.lower():
-            # Try to extract count
-            match = re.search(r'(\d+)\s*(?:profiles?|people)', response_text, re.IGNORECASE)
-            if match:
-                count = int(match.group(1))
-                # Note: Actual results are stored by the agent through direct tool calls
+        for result in results:
+            if not result.succeeded:
+                continue
+            if result.name == "search_people":
+                self.store_search_results(result.value.get("people", []), result.arguments)
+            elif result.name in ("export_to_sheets", "export_to_json"):
+                details = dict(result.value)
+                details.setdefault("records_exported", details.get("people_added"))
+                self.record_export(result.name, details)
@@ -1,7 +1,11 @@
 """Response Processor - Cleans and formats agent responses."""
 
 import re
-from typing import Any
+from typing import Any, List, Optional
+
+from autogen_agentchat.messages import ToolCallSummaryMessage
+
+from .tool_results import ToolResult
 
 
 def clean_response(result: Any) -> str:
@@ -37,6 +41,37 @@ def clean_response(result: Any) -> str:
     return response_text
 
 
+def ends_with_tool_output(result: Any) -> bool:
+    """True when the run stopped at raw tool output instead of a written reply."""
+    messages = getattr(result, "messages", None) or []
+    return bool(messages) and isinstance(messages[-1], ToolCallSummaryMessage)
+
+
+def format_tool_results(results: List[ToolResult]) -> Optional[str]:
+    """
+    Format results that need no further model turn (finished exports).
+
+    Returns None when the model should look at the results itself.
+    """
+    lines = []
+    for result in results:
+        if not result.succeeded:
+            return None
+        value = result.value
+        if result.name == "export_to_sheets":
+            lines.append(
+                f"Exported {value.get('people_added', 0)} profiles to Google Sheets "
+                f"({value.get('people_skipped', 0)} duplicates skipped): {value.get('spreadsheet_url')}"
+            )
+        elif result.name == "export_to_json":
+            lines.append(
+                f"Exported {value.get('records_exported', 0)} profiles to JSON: {value.get('file_path')}"
+            )
+        else:
+            return None
+    return "\n".join(lines) or None
+
+
 def _clean_formatting(text: str) -> str:
     """Remove excessive whitespace and formatting artifacts."""
     # Remove multiple consecutive newlines
@@ -0,0 +1,24 @@
+"""Translate AutoGen stream items into progress events for the UI."""
+from typing import Any, Dict, Optional
+
+from autogen_agentchat.messages import (
+    ModelClientStreamingChunkEvent,
+    ToolCallExecutionEvent,
+    ToolCallRequestEvent,
+)
+
+
+def to_progress_event(item: Any) -> Optional[Dict[str, str]]:
+    """Returns a {'type', 'content'} event for items worth showing, else None."""
+    if isinstance(item, ModelClientStreamingChunkEvent):
+        return {"type": "token", "content": item.content}
+    if isinstance(item, ToolCallRequestEvent):
+        names = ", ".join(call.name for call in item.content)
+        return {"type": "tool_call", "content": f"Calling `{names}`"}
+    if isinstance(item, ToolCallExecutionEvent):
+        lines = [
+            f"`{result.name}` {'failed' if result.is_error else 'finished'}"
+            for result in item.content
+        ]
+        return {"type": "tool_result", "content": "\n".join(lines)}
+    return None
@@ -0,0 +1,68 @@
+"""Typed tool results captured from AutoGen's tool-call events."""
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from autogen_agentchat.messages import ToolCallExecutionEvent, ToolCallRequestEvent
+
+from tools import ToolResultStore
+
+
+@dataclass
+class ToolResult:
+    """One finished tool call, with the tool's full return value."""
+    call_id: str
+    name: str
+    arguments: Dict[str, Any]
+    value: Any
+    is_error: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.is_error and isinstance(self.value, dict) and bool(self.value.get("success"))
+
+
+class ToolResultCollector:
+    """
+    Pairs each ToolCallRequestEvent call with its FunctionExecutionResult.
+
+    The model only sees the compacted, stringified result; the full value is
+    taken from the ToolResultStore, so nothing is parsed back out of text.
+    """
+
+    def __init__(self, store: Optional[ToolResultStore] = None):
+        self.store = store
+        self.results: List[ToolResult] = []
+        self._calls: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+    def observe(self, item: Any) -> None:
+        """Feed every item from run_stream; non-tool items are ignored."""
+        if isinstance(item, ToolCallRequestEvent):
+            for call in item.content:
+                self._calls[call.id] = (call.name, _parse_arguments(call.arguments))
+        elif isinstance(item, ToolCallExecutionEvent):
+            for execution in item.content:
+                name, arguments = self._calls.pop(execution.call_id, (execution.name, {}))
+                value = self.store.lookup(name, arguments) if self.store is not None else None
+                self.results.append(ToolResult(
+                    call_id=execution.call_id,
+                    name=name,
+                    arguments=arguments,
+                    value=execution.content if value is None else value,
+                    is_error=bool(execution.is_error),
+                ))
+
+    def last(self, name: Optional[str] = None) -> Optional[ToolResult]:
+        """The most recent result, optionally of one tool."""
+        for result in reversed(self.results):
+            if name is None or result.name == name:
+                return result
+        return None
+
+
+def _parse_arguments(arguments: str) -> Dict[str, Any]:
+    try:
+        parsed = json.loads(arguments or "{}")
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
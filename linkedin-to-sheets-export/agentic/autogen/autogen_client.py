@@ -1,7 +1,6 @@
 """AutoGen Client - Wrapper for the LinkedInExportAssistant."""
 
-import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from agents import LinkedInExportAssistant
 
 
@@ -23,28 +22,24 @@ class LinkedInExportClient:
             Dict with 'result' key containing the response
         """
         try:
-            # Handle async execution
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If we're in an existing event loop (e.g., Streamlit)
-                    import nest_asyncio
-                    nest_asyncio.apply()
-                    result = loop.run_until_complete(
-                        self.assistant.execute_async(command, context)
-                    )
-                else:
-                    result = loop.run_until_complete(
-                        self.assistant.execute_async(command, context)
-                    )
-            except RuntimeError:
-                result = asyncio.run(self.assistant.execute_async(command, context))
-
-            return {"result": result}
+            return {"result": self.assistant.execute_command(command, context)}
 
         except Exception as e:
             return {"result": f"Error: {str(e)}"}
 
+    def stream(self, command: str, context: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """
+        Execute a command, yielding progress events as the agent works.
+
+        Args:
+            command: User command to execute
+            context: Optional context from previous interactions
+
+        Returns:
+            Iterator of {'type', 'content'} events; the last has type 'final'
+        """
+        return self.assistant.stream_command(command, context)
+
 
 # Alias for backwards compatibility
 JobSearchClient = LinkedInExportClient
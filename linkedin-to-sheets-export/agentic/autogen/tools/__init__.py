@@ -4,10 +4,13 @@ from .search_geo_location_tool import search_geo_location
 from .search_people_tool import search_people
 from .googlesheet.export_to_sheets import export_to_sheets
 from .export_to_json_tool import export_to_json
+from .result_store import ToolResultStore, record_tool
 
 __all__ = [
     "search_geo_location",
     "search_people",
     "export_to_sheets",
     "export_to_json",
+    "ToolResultStore",
+    "record_tool",
 ]
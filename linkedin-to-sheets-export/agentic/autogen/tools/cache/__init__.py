@@ -0,0 +1,3 @@
+from .geo_index import geo_index
+
+__all__ = ["geo_index"]
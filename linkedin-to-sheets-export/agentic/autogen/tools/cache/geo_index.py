@@ -0,0 +1,144 @@
+"""In-memory geo index so common locations never need a /linkedin/search/geo round-trip."""
+import bisect
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+CACHE_DIR = os.getenv(
+    "CONNECTSAFELY_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".connectsafely")
+)
+SEED_PATH = os.getenv(
+    "GEO_SEED_PATH", os.path.join(os.path.dirname(__file__), "geo_seed.json")
+)
+LEARNED_PATH = os.getenv("GEO_INDEX_PATH", os.path.join(CACHE_DIR, "geo_index.json"))
+# Shorter prefixes ("a", "in") are too ambiguous to resolve without the API
+MIN_PREFIX_LENGTH = int(os.getenv("GEO_MIN_PREFIX_LENGTH", "4"))
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so lookups are case-insensitive."""
+    return " ".join(str(text).lower().split())
+
+
+class GeoIndex:
+    """
+    Sorted array of (normalized name, geoId) pairs with exact and prefix lookup.
+
+    Seeded from a bundled JSON file and extended with every API response;
+    learned entries are saved to GEO_INDEX_PATH so they survive restarts.
+    """
+
+    def __init__(self, seed_path: str = SEED_PATH, learned_path: str = LEARNED_PATH):
+        self.learned_path = learned_path
+        # One list of tuples so a single insert keeps lookups consistent without locking
+        self._entries: List[Tuple[str, str]] = []
+        self._names: Dict[str, str] = {}
+        self._learned: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        for path in (seed_path, learned_path):
+            for entry in self._read(path):
+                self._add(entry["name"], entry["geoId"], entry.get("aliases", []))
+        self._learned = self._read(learned_path)
+
+    def lookup(self, keywords: str) -> Optional[Dict[str, str]]:
+        """Return the location whose name or alias equals `keywords`, if known."""
+        key = normalize(keywords)
+        i = bisect.bisect_left(self._entries, (key,))
+        if i < len(self._entries) and self._entries[i][0] == key:
+            return self._location(self._entries[i][1])
+        return None
+
+    def prefix(self, keywords: str, limit: int = 5) -> List[Dict[str, str]]:
+        """Return known locations whose name or alias starts with `keywords`, shortest first."""
+        key = normalize(keywords)
+        if not key:
+            return []
+        start = bisect.bisect_left(self._entries, (key,))
+        end = bisect.bisect_left(self._entries, (key + "\uffff",))
+        matches = sorted(self._entries[start:end], key=lambda entry: len(entry[0]))
+        geo_ids = dict.fromkeys(geo_id for _, geo_id in matches)
+        return [self._location(geo_id) for geo_id in list(geo_ids)[:limit]]
+
+    def search(self, keywords: str, limit: int = 5) -> List[Dict[str, str]]:
+        """
+        Locations that resolve `keywords` without the API; empty means ask the API.
+
+        An exact name or alias match comes first, followed by other prefix
+        matches. Without one, a prefix only counts when it is at least
+        MIN_PREFIX_LENGTH characters and matches a single location.
+        """
+        exact = self.lookup(keywords)
+        if exact is not None:
+            return [exact] + [loc for loc in self.prefix(keywords, limit) if loc != exact][: limit - 1]
+        if len(normalize(keywords)) < MIN_PREFIX_LENGTH:
+            return []
+        matches = self.prefix(keywords, 2)
+        return matches if len(matches) == 1 else []
+
+    def learn(self, keywords: str, locations: Iterable[Dict[str, Any]]) -> None:
+        """Add the locations from an API response; the query becomes an alias of the first."""
+        new_entries = []
+        with self._lock:
+            for position, location in enumerate(locations):
+                geo_id = location.get("geoId") or location.get("id")
+                name = location.get("name") or location.get("title")
+                if not geo_id or not name:
+                    continue
+                aliases = [keywords] if position == 0 else []
+                if self._add(name, str(geo_id), aliases):
+                    new_entries.append({"name": name, "geoId": str(geo_id), "aliases": aliases})
+            if new_entries:
+                self._save(new_entries)
+
+    def _add(self, name: str, geo_id: str, aliases: Iterable[str]) -> bool:
+        self._names.setdefault(geo_id, name)
+        added = False
+        for key in {normalize(name), *(normalize(alias) for alias in aliases)}:
+            i = bisect.bisect_left(self._entries, (key,))
+            if i < len(self._entries) and self._entries[i][0] == key:
+                continue
+            self._entries.insert(i, (key, geo_id))
+            added = True
+        return added
+
+    def _location(self, geo_id: str) -> Dict[str, str]:
+        return {"name": self._names[geo_id], "geoId": geo_id}
+
+    @staticmethod
+    def _read(path: str) -> List[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return []
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read geo index {path}: {e}")
+            return []
+
+    def _save(self, new_entries: List[Dict[str, Any]]) -> None:
+        """Add entries to the learned file, keeping what other processes saved there since we loaded it."""
+        # Re-read so a concurrent app's entries aren't overwritten; pick them up here too
+        on_disk = self._read(self.learned_path)
+        for entry in on_disk:
+            self._add(entry["name"], entry["geoId"], entry.get("aliases", []))
+        merged = {}
+        for entry in self._learned + on_disk + new_entries:
+            key = (normalize(entry["name"]), entry["geoId"])
+            if key in merged:
+                aliases = merged[key].setdefault("aliases", [])
+                aliases.extend(a for a in entry.get("aliases", []) if a not in aliases)
+            else:
+                merged[key] = {**entry, "aliases": list(entry.get("aliases", []))}
+        self._learned = list(merged.values())
+        try:
+            os.makedirs(os.path.dirname(self.learned_path), exist_ok=True)
+            tmp_path = f"{self.learned_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._learned, f)
+            os.replace(tmp_path, self.learned_path)
+        except OSError as e:
+            print(f"Could not save geo index: {e}")
+
+
+geo_index = GeoIndex()
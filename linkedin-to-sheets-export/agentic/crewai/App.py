@@ -6,7 +6,7 @@ os.environ["CREWAI_TELEMETRY_OPT_OUT"] = "true"
 
 import streamlit as st
 from dotenv import load_dotenv
-from crew import LinkedInExportCrew
+from streaming import describe_step, describe_task
 
 load_dotenv()
 
@@ -115,42 +115,50 @@ def main():
         st.chat_message("user").write(command)
 
         with st.chat_message("assistant"):
-            with st.spinner("Agent working..."):
-                try:
-                    crew = LinkedInExportCrew()
-
-                    # Execute with context
-                    result = crew.execute(
-                        command=command,
-                        context=st.session_state.context if st.session_state.context else None
-                    )
-
-                    result_str = str(result.get("result", ""))
-
-                    # Keep only last 1500 chars of context
-                    if len(st.session_state.context) > 1500:
-                        st.session_state.context = st.session_state.context[-1500:]
-
-                    st.session_state.context += f"\n\n{command}: {result_str}\n"
-
-                    # Display result
-                    st.write(result_str)
-
-                    # Add assistant response
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": result_str
-                    })
-
-                except Exception as e:
-                    error_msg = f"Error: {str(e)}"
-                    st.error(error_msg)
-                    st.info("Try: 1) Clearing history 2) Using simpler command")
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_msg
-                    })
-
+            # Agent steps and finished tasks stream into this panel
+            status = st.status("Agent working...", expanded=True)
+            try:
+                # Imported on first command so the UI renders before CrewAI is loaded
+                from crew import LinkedInExportCrew
+
+                crew = LinkedInExportCrew(
+                    step_callback=lambda step: status.write(describe_step(step)),
+                    task_callback=lambda output: status.write(describe_task(output)),
+                )
+
+                # Execute with context
+                result = crew.execute(
+                    command=command,
+                    context=st.session_state.context if st.session_state.context else None
+                )
+                status.update(label="Done", state="complete", expanded=False)
+
+                result_str = str(result.get("result", ""))
+
+                # Keep only last 1500 chars of context
+                if len(st.session_state.context) > 1500:
+                    st.session_state.context = st.session_state.context[-1500:]
+
+                st.session_state.context += f"\n\n{command}: {result_str}\n"
+
+                # Display result
+                st.write(result_str)
+
+                # Add assistant response
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": result_str
+                })
+
+            except Exception as e:
+                status.update(label="Failed", state="error")
+                error_msg = f"Error: {str(e)}"
+                st.error(error_msg)
+                st.info("Try: 1) Clearing history 2) Using simpler command")
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": error_msg
+                })
 
 if __name__ == "__main__":
     main()
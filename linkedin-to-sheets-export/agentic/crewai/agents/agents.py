@@ -1,6 +1,7 @@
 """CrewAI Agent Definitions for LinkedIn to Sheets Export."""
 
 import os
+from functools import lru_cache
 from crewai import Agent, LLM
 from tools import (
     search_geo_location,
@@ -10,20 +11,28 @@ from tools import (
 )
 
 
-def create_export_agent() -> Agent:
+@lru_cache(maxsize=1)
+def get_llm() -> LLM:
     """
-    Create the LinkedIn Export agent with all necessary tools.
+    Get the Gemini LLM, shared by every agent in the process.
 
     Returns:
-        Configured CrewAI Agent instance
+        Configured CrewAI LLM instance
     """
-    # Configure LLM
-    llm = LLM(
+    return LLM(
         model="gemini/gemini-2.5-pro",
         api_key=os.getenv("GEMINI_API_KEY"),
         temperature=0.7,
     )
 
+
+def create_export_agent() -> Agent:
+    """
+    Create the LinkedIn Export agent with all necessary tools.
+
+    Returns:
+        Configured CrewAI Agent instance
+    """
     agent = Agent(
         role="LinkedIn Export Specialist",
         goal="Search LinkedIn profiles and export results to Google Sheets or JSON files",
@@ -41,7 +50,7 @@ def create_export_agent() -> Agent:
             export_to_sheets,
             export_to_json
         ],
-        llm=llm,
+        llm=get_llm(),
         verbose=True,
         memory=True,
         allow_delegation=False,
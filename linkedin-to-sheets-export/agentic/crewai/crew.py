@@ -9,8 +9,11 @@ from agents import create_export_agent
 class LinkedInExportCrew:
     """Crew wrapper for LinkedIn search and export operations."""
 
-    def __init__(self):
+    def __init__(self, step_callback=None, task_callback=None):
         self.agent = create_export_agent()
+        # Called after every agent step / finished task so the UI can stream progress
+        self.step_callback = step_callback
+        self.task_callback = task_callback
 
     def execute(self, command: str, context: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -46,6 +49,8 @@ Current request:
             agents=[self.agent],
             tasks=[task],
             verbose=False,
+            step_callback=self.step_callback,
+            task_callback=self.task_callback,
         )
 
         try:
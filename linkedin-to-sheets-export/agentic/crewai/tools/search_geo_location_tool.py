@@ -3,6 +3,8 @@ import requests
 from typing import Dict, Any
 from crewai.tools import tool
 
+from .cache import geo_index
+
 
 @tool("Search Geographic Location")
 def search_geo_location(keywords: str) -> Dict[str, Any]:
@@ -16,6 +18,17 @@ def search_geo_location(keywords: str) -> Dict[str, Any]:
     Returns:
         Dict with location_id if found, or error message if not.
     """
+    # Known locations are served from the local index without an API call
+    known = geo_index.search(keywords)
+    if known:
+        return {
+            "success": True,
+            "location_id": known[0]["geoId"],
+            "location_name": known[0]["name"],
+            "all_locations": known,
+            "cached": True,
+        }
+
     api_token = os.getenv("CONNECTSAFELY_API_TOKEN")
     if not api_token:
         return {
@@ -44,6 +57,7 @@ def search_geo_location(keywords: str) -> Dict[str, Any]:
 
         data = response.json()
         locations = data.get("locations", [])
+        geo_index.learn(keywords, locations)
 
         if locations:
             first_match = locations[0]